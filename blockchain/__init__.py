@@ -8,16 +8,29 @@
     - node: Node 클래스 정의 (합의 로직 포함)
     - network: NetworkSimulator 클래스 정의
     - config: 시스템 설정 및 상수
-    - crypto: 암호화 유틸리티 (ECDSA 키 생성, 서명, 검증)
+    - crypto: 암호화 유틸리티 (ECDSA 키 생성, 서명, 검증, 서명 검증 캐시)
     - wallet: Wallet 클래스 (개인키 관리, 트랜잭션 서명)
+    - state: 상태 스냅샷 (Copy-on-Write) 및 LRU 캐시
+    - lru: 적중/실패/제거 통계를 세는 공용 LRU 캐시 (서명 검증 캐시와 상태 캐시의 기반)
+    - chain: 조상 탐색용 Skip 포인터 헬퍼
+    - mempool: Mempool 클래스 (txid 인덱스 기반 대기 트랜잭션 저장소)
+    - encoding: 트랜잭션/블록 헤더 정규 바이너리 직렬화
+    - merkle: 머클 루트 및 포함 증명
+    - mining: Midstate 재사용 채굴 엔진
+    - events: 이산 사건 스케줄러 및 링크 지연/대역폭 모델
+    - frozen: 노드 간 공유용 불변 객체 (FrozenDict)
+    - topology: Gossip 전파용 피어 토폴로지 생성
+    - sharding: 워커 프로세스 샤드 병렬 이산 사건 시뮬레이션
+    - runtime: 노드별 수신함을 둔 asyncio 노드 런타임
 """
 
 from .block import Block
 from .node import Node
 from .network import NetworkSimulator
 from .wallet import Wallet, WalletManager
-from .crypto import CryptoUtils
+from .crypto import CryptoUtils, SignatureCache
+from .mempool import Mempool
 from . import config
 
-__all__ = ['Block', 'Node', 'NetworkSimulator', 'Wallet', 'WalletManager', 'CryptoUtils', 'config']
+__all__ = ['Block', 'Node', 'NetworkSimulator', 'Wallet', 'WalletManager', 'CryptoUtils', 'SignatureCache', 'Mempool', 'config']
 __version__ = '2.0.0'
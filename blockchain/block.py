@@ -3,70 +3,249 @@
 블록의 구조, 해시 계산, PoW 채굴 로직 포함
 """
 
+import copy
 import hashlib
 import json
+import time
+from . import config, encoding
+from .frozen import freeze
+from .merkle import merkle_root, merkle_proof
+from .mining import (
+    mine_header, mine_header_parallel, effective_mining_workers, MiningStats,
+    difficulty_to_bits, bits_to_difficulty, bits_to_target, target_work
+)
 
 
 class Block:
-    """블록체인의 개별 블록을 나타내는 클래스"""
+    """
+    블록체인의 개별 블록을 나타내는 클래스
+    freeze() 이후에는 수정할 수 없으며 여러 노드가 같은 객체를 공유함
+    (누적 작업량 같은 노드별 정보는 블록이 아니라 각 Node가 보관)
+    """
 
-    def __init__(self, index, timestamp, transactions, difficulty, previous_hash, miner_id):
+    def __init__(self, index, timestamp, transactions, difficulty, previous_hash, miner_id, bits=None):
         """
         Args:
             index: 블록 높이 (제네시스=0부터 시작)
             timestamp: 블록 생성 시간
             transactions: 블록에 포함된 트랜잭션 리스트
-            difficulty: 난이도 (PoW 목표)
+            difficulty: 난이도 (PoW 목표, 소수 가능 - 헤더에는 압축 목표값 bits로 기록)
             previous_hash: 이전 블록의 해시
             miner_id: 채굴한 노드의 ID
+            bits: 압축 목표값 (주어지면 difficulty 대신 그대로 사용)
         """
+        self._frozen = False
         self.index = index
         self.timestamp = timestamp
         self.transactions = transactions
-        self.difficulty = difficulty
+        self.bits = bits if bits is not None else difficulty_to_bits(difficulty)  # 목표값의 압축 표현 (nBits)
         self.previous_hash = previous_hash
         self.miner_id = miner_id  # 누가 캤는지 (시뮬레이션 용)
         self.nonce = 0
         self.hash = None
 
-        # Work 함수: 2^difficulty (비트연산 1 << difficulty)
-        # 난이도가 1 오를 때마다 작업량은 2배가 됨 (Most-work 규칙의 핵심)
-        self.block_work = 1 << difficulty
-        self.total_work = 0  # 제네시스부터 이 블록까지의 누적 작업량
+    def __setattr__(self, name, value):
+        if self.__dict__.get('_frozen'):
+            raise AttributeError(f"고정된 블록은 수정할 수 없음: {name}")
+        object.__setattr__(self, name, value)
 
-    def calculate_hash(self):
+    def freeze(self):
+        """
+        블록을 불변으로 고정 (트랜잭션은 FrozenDict 튜플로 변환, 해시는 그대로)
+        고정된 블록은 deepcopy 없이 여러 노드에 그대로 전달 가능
+
+        Returns:
+            Block: 자기 자신
+        """
+        if not self._frozen:
+            self.transactions = tuple(freeze(tx) for tx in self.transactions)
+            object.__setattr__(self, '_frozen', True)
+        return self
+
+    @property
+    def frozen(self):
+        """고정 여부"""
+        return self._frozen
+
+    def __copy__(self):
+        if self._frozen:
+            return self
+        clone = Block.__new__(Block)
+        clone.__dict__.update(self.__dict__)
+        return clone
+
+    def __deepcopy__(self, memo):
+        # 고정된 블록은 공유해도 안전하므로 복사하지 않음
+        if self._frozen:
+            return self
+        clone = Block.__new__(Block)
+        memo[id(self)] = clone
+        clone.__dict__.update(copy.deepcopy(self.__dict__, memo))
+        return clone
+
+    @property
+    def difficulty(self):
+        """난이도 (bits에서 계산, 정수로 떨어지면 int)"""
+        return bits_to_difficulty(self.bits)
+
+    @difficulty.setter
+    def difficulty(self, value):
+        self.bits = difficulty_to_bits(value)
+
+    @property
+    def target(self):
+        """정수 목표값 (해시 < target 이면 유효)"""
+        return bits_to_target(self.bits)
+
+    @property
+    def block_work(self):
+        """
+        Work 함수: 목표값에서 계산한 기대 해시 수 (2^256 / target)
+        해시 공간 기준이므로 난이도가 1 오르면 작업량도 16배 (Most-work 규칙의 핵심)
+        """
+        return target_work(self.target)
+
+    def calculate_hash(self, root=None):
         """
         블록의 해시를 계산
+        바이너리 형식: 고정 크기 헤더(머클 루트 포함)만 해싱
+        JSON 호환 모드: 기존처럼 트랜잭션 전체를 포함한 JSON을 해싱
+
+        Args:
+            root: 미리 계산한 머클 루트 (채굴 루프에서 재사용, 없으면 계산)
 
         Returns:
             str: SHA-256 해시값 (16진수 문자열)
         """
-        block_string = json.dumps({
-            "index": self.index,
-            "timestamp": self.timestamp,
-            "transactions": self.transactions,
-            "difficulty": self.difficulty,
-            "previous_hash": self.previous_hash,
-            "nonce": self.nonce
-        }, sort_keys=True).encode()
-        return hashlib.sha256(block_string).hexdigest()
+        if encoding.is_json_compatible():
+            block_string = json.dumps({
+                "index": self.index,
+                "timestamp": self.timestamp,
+                "transactions": self.transactions,
+                "difficulty": self.difficulty,
+                "previous_hash": self.previous_hash,
+                "nonce": self.nonce
+            }, sort_keys=True).encode()
+            return hashlib.sha256(block_string).hexdigest()
+
+        return hashlib.sha256(self.encode_header(root)).hexdigest()
+
+    def encode_header(self, root=None):
+        """
+        블록 헤더를 정규 바이너리로 인코딩
+
+        Args:
+            root: 미리 계산한 머클 루트 (없으면 계산)
+
+        Returns:
+            bytes: 인코딩된 헤더
+        """
+        if root is None:
+            root = self.compute_merkle_root()
+        return encoding.encode_block_header(
+            self.index, self.timestamp, self.bits, self.previous_hash, root, self.nonce
+        )
+
+    def transaction_hashes(self):
+        """머클 트리 리프: 트랜잭션별 해시 리스트 (블록 내 순서)"""
+        return [encoding.transaction_hash(tx) for tx in self.transactions]
+
+    def compute_merkle_root(self):
+        """
+        현재 트랜잭션 목록의 머클 루트 계산
+
+        Returns:
+            bytes: 머클 루트 (32바이트)
+        """
+        return merkle_root(self.transaction_hashes())
+
+    def get_merkle_proof(self, position):
+        """
+        블록 내 position 번째 트랜잭션의 포함 증명
+
+        Args:
+            position: 트랜잭션 위치
+
+        Returns:
+            list: merkle.merkle_proof() 형식의 증명
+        """
+        return merkle_proof(self.transaction_hashes(), position)
 
     def mine_block(self):
         """
         실제 PoW(작업 증명) 수행
         난이도에 맞는 해시를 찾을 때까지 nonce를 증가시킴
+        (바이너리 형식: 헤더 앞부분 Midstate 재사용 + 정수 목표값 비교,
+         config.MINING_WORKERS가 2 이상이면 nonce 구간 분할 병렬 채굴 - 결과는 동일)
+
+        Returns:
+            MiningStats: 시도한 해시 수 / 소요 시간 / 해시율
+        """
+        start = time.perf_counter()
+
+        if encoding.is_json_compatible():
+            hashes = self.mine_block_legacy()
+        else:
+            # 머클 루트를 포함한 헤더 앞부분은 nonce와 무관하므로 템플릿당 한 번만 인코딩
+            prefix = self.encode_header_prefix()
+            target = self.target
+            workers = effective_mining_workers(config.MINING_WORKERS)
+            if workers > 1:
+                self.nonce, self.hash, hashes = mine_header_parallel(
+                    prefix, target, workers, config.MINING_CHUNK_SIZE
+                )
+            else:
+                self.nonce, self.hash, hashes = mine_header(prefix, target)
+
+        stats = MiningStats(hashes, time.perf_counter() - start)
+        print(f"[MINE] 블록 채굴 성공 (난이도: {self.difficulty:g}): {self.hash} "
+              f"({stats.hashes} hashes, {stats.hash_rate:.0f} H/s)")
+        return stats
+
+    def mine_block_legacy(self):
         """
-        target = "0" * self.difficulty
+        기존 채굴 루프 (nonce마다 전체 해시 재계산)
+        JSON 호환 모드 및 해시율 비교용
+
+        Returns:
+            int: 시도한 해시 수
+        """
+        target = self.target
         self.nonce = 0
 
         while True:
             self.hash = self.calculate_hash()
-            if self.hash.startswith(target):
-                break
+            if int(self.hash, 16) < target:
+                return self.nonce + 1
             self.nonce += 1
 
-        print(f"[MINE] 블록 채굴 성공 (난이도: {self.difficulty}): {self.hash}")
+    def serialized_size(self):
+        """
+        블록 전송 크기 (헤더 + 트랜잭션 인코딩 바이트 수, 네트워크 대역폭 모델용)
+
+        Returns:
+            int: 바이트 수
+        """
+        return len(self.encode_header()) + sum(
+            len(encoding.encode_transaction(tx)) for tx in self.transactions
+        )
+
+    def encode_header_prefix(self, root=None):
+        """
+        nonce를 제외한 헤더 앞부분 인코딩 (채굴 Midstate용)
+
+        Args:
+            root: 미리 계산한 머클 루트 (없으면 계산)
+
+        Returns:
+            bytes: 헤더 앞부분
+        """
+        if root is None:
+            root = self.compute_merkle_root()
+        return encoding.encode_block_header_prefix(
+            self.index, self.timestamp, self.bits, self.previous_hash, root
+        )
 
     def __repr__(self):
         """블록의 문자열 표현"""
-        return f"Block(idx={self.index}, hash={self.hash[:8] if self.hash else 'None'}..., work={self.total_work})"
+        return f"Block(idx={self.index}, hash={self.hash[:8] if self.hash else 'None'}..., work={self.block_work})"
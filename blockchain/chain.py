@@ -0,0 +1,81 @@
+"""
+체인 인덱스 헬퍼 모듈
+조상 탐색용 Skip 포인터 높이 계산 (Bitcoin CBlockIndex::pskip 방식)
+"""
+
+
+def invert_lowest_one(n):
+    """가장 낮은 1 비트를 0으로 바꾼 값"""
+    return n & (n - 1)
+
+
+def get_skip_height(height):
+    """
+    height 높이 블록의 Skip 포인터가 가리킬 조상 높이
+
+    Skip 포인터를 따라가면 임의 깊이의 조상을 O(log n) 단계로 찾을 수 있음
+
+    Args:
+        height: 블록 높이
+
+    Returns:
+        int: Skip 대상 조상 높이
+    """
+    if height < 2:
+        return 0
+
+    # 홀수 높이는 짝수 높이보다 조금 덜 멀리 점프 (연속 점프 시 효율 향상)
+    if height & 1:
+        return invert_lowest_one(invert_lowest_one(height - 1)) + 1
+    return invert_lowest_one(height)
+
+
+class BlockRange:
+    """
+    한 가지(branch)의 블록 구간 (start_height, tip.index] 을 나타내는 읽기 전용 뷰
+    블록을 리스트로 미리 펼치지 않고, 순회할 때 블록을 하나씩 꺼냄
+    (역순은 부모 해시, 정순은 높이별 조상 조회)
+    """
+
+    __slots__ = ('_block_index', '_get_ancestor', 'tip', 'start_height')
+
+    def __init__(self, block_index, tip, start_height, get_ancestor=None):
+        """
+        Args:
+            block_index: 블록 저장소 {block_hash: Block}
+            tip: 구간의 마지막(가장 높은) 블록
+            start_height: 구간 시작 직전 높이 (보통 공통 조상의 높이, 미포함)
+            get_ancestor: (블록, 높이) -> 조상 블록 조회 함수 (Node.get_ancestor, Skip 포인터로 O(log n))
+                          없으면 부모 해시를 따라 올라감 (블록당 O(구간 길이))
+        """
+        self._block_index = block_index
+        self._get_ancestor = get_ancestor or self._walk_ancestor
+        self.tip = tip
+        self.start_height = start_height
+
+    def _walk_ancestor(self, block, height):
+        curr = block
+        while curr is not None and curr.index > height:
+            curr = self._block_index.get(curr.previous_hash)
+        return curr
+
+    def __len__(self):
+        return max(self.tip.index - self.start_height, 0)
+
+    def __reversed__(self):
+        """Tip -> 공통 조상 직후 순서로 순회 (추가 메모리 없음)"""
+        curr = self.tip
+        while curr is not None and curr.index > self.start_height:
+            yield curr
+            curr = self._block_index.get(curr.previous_hash)
+
+    def __iter__(self):
+        """공통 조상 직후 -> Tip 순서로 순회 (높이 순, 높이마다 Tip의 조상을 조회 - 추가 메모리 없음)"""
+        for height in range(self.start_height + 1, self.tip.index + 1):
+            block = self._get_ancestor(self.tip, height)
+            if block is None:
+                return
+            yield block
+
+    def __repr__(self):
+        return f"BlockRange(heights={self.start_height + 1}..{self.tip.index}, len={len(self)})"
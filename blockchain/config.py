@@ -9,16 +9,56 @@ SIM_TIME = 0
 # 시스템 상수 설정
 ADJUSTMENT_INTERVAL = 3  # 난이도 조절 주기 (3개 블록마다 조정)
 TARGET_BLOCK_TIME = 2    # 목표 블록 생성 시간 (2초)
-MAX_STEP = 1             # 난이도 조절 최대 크기 (+1/-1까지 조정 가능)
+MAX_STEP = 1             # 블록당 난이도 변화 상한 (+1/-1 초과 시 급변으로 거부)
+MAX_RETARGET_FACTOR = 4  # 조정 주기당 목표값 변경 최대 배율 (소요 시간에 비례 조정, 4배 = 난이도 ±0.5)
+MIN_DIFFICULTY = 1       # 최소 난이도 (목표값 상한)
 FUTURE_DRIFT = 36        # 미래 시간 제한
 MAX_TIME_JUMP = 6        # 블록당 최대 시간 점프 (6초)
 
 # 채굴 관련 설정
 MINING_REWARD = 50       # 채굴 보상 금액
 DEFAULT_DIFFICULTY = 2   # 초기 난이도
+MINING_WORKERS = 1       # 병렬 채굴 워커 프로세스 수 상한 (CPU 수로 다시 제한, 1 이하면 단일 프로세스)
+MINING_CHUNK_SIZE = 1 << 14  # 병렬 채굴 시 워커에 한 번에 맡기는 nonce 구간 크기
+MINING_SLICE_HASHES = 256    # 시분할 채굴 시 한 슬라이스에 시도하는 해시 수 (슬라이스 사이에 메시지 처리)
 
 # 트랜잭션 관련 설정
 MAX_TXS_PER_BLOCK = 5    # 블록당 최대 트랜잭션 수
+SIG_CACHE_SIZE = 10000   # 서명 검증 결과 캐시 크기 (LRU, 노드 간 공유 가능)
+SIG_VERIFY_WORKERS = 4   # 블록 서명 일괄 검증 워커 수 (1 이하면 순차 검증)
+SIG_VERIFY_EXECUTOR = "thread"  # 워커 종류: "thread" 또는 "process"
+SIG_VERIFY_BATCH_MIN = 16  # 이 개수 미만의 미검증 서명은 풀을 쓰지 않고 순차 검증
+SIGN_WORKERS = 1         # 일괄 서명(Wallet.create_transactions) 프로세스 수 (1 이하면 현재 프로세스에서 서명)
+SIGN_BATCH_MIN = 64      # 이 개수 미만의 일괄 서명은 프로세스 풀을 쓰지 않음
+
+# 재현 모드 설정
+REPRODUCIBLE_SEED = None  # 설정하면 NetworkSimulator가 시드 기반 키 유도 + RFC 6979 결정적 서명 사용
+
+# 직렬화 설정
+SERIALIZATION_FORMAT = "binary"  # 해시/서명/txid 직렬화: "binary"(정규 바이너리) 또는 "json"(기존 해시 호환)
+
+# 상태 관련 설정
+STATE_CACHE_SIZE = 256   # 블록별 상태 스냅샷 캐시 크기 (LRU)
+STATE_CHECKPOINT_INTERVAL = 100  # 상태 체크포인트 주기 (캐시 미스 시 최대 Replay 블록 수)
 
 # 네트워크 시뮬레이션 설정
 MINING_PROBABILITY = 0.3  # 각 스텝마다 채굴 시도 확률 (30%)
+
+# 이산 사건 네트워크 설정 (run_event_simulation)
+LINK_LATENCY = 0.1           # 링크 기본 전파 지연 (초)
+LINK_BANDWIDTH = 1_000_000   # 링크 기본 대역폭 (바이트/초, None이면 무제한)
+NETWORK_HASH_RATE = 128      # 네트워크 전체 모의 해시율 (H/s, 노드가 균등 분배 - 블록 발견 간격 결정)
+
+# Gossip 전파 설정 (NetworkSimulator.set_topology)
+PEER_DEGREE = 8                 # 노드당 목표 평균 이웃 수
+SMALL_WORLD_REWIRE_PROB = 0.1   # small_world 토폴로지 재연결 확률
+INV_MESSAGE_SIZE = 36           # inv/getdata 메시지 크기 (바이트, 종류 4 + 해시 32)
+
+# 샤드 병렬 시뮬레이션 설정 (ShardedNetworkSimulator)
+SHARD_WORKERS = 4               # 샤드 워커 프로세스 수 상한 (CPU 수와 노드 수로 다시 제한)
+
+# asyncio 노드 런타임 설정 (AsyncNetworkRuntime)
+NODE_INBOX_SIZE = 256           # 노드별 수신함 크기 (가득 차면 링크 전달/거래 제출이 대기 - 백프레셔)
+INBOX_HIGH_WATER = 64           # 수신함에 이만큼 밀리면 채굴을 멈추고 메시지부터 처리
+RUNTIME_TIME_SCALE = 50         # 벽시계 1초당 진행하는 시뮬레이션 시간 (초)
+RUNTIME_MINING_WORKERS = 4      # PoW 탐색을 넘기는 채굴 워커 프로세스 수 상한 (CPU 수로 다시 제한)
@@ -1,14 +1,44 @@
 """
 암호화 모듈
-ECDSA 기반 키 생성, 서명, 검증 기능 제공
+ECDSA 기반 키 생성, 서명, 검증 기능 제공 (대량 키 생성/일괄 서명 포함)
+재현 모드: 시드에서 키 유도 + RFC 6979 결정적 서명 (실행마다 같은 바이트)
+서명 검증 결과 캐시 (노드 간 공유 가능)
 """
 
+import functools
 import hashlib
 import json
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from cryptography.hazmat.primitives.asymmetric import ec
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.backends import default_backend
-from cryptography.exceptions import InvalidSignature
+from cryptography.exceptions import InvalidSignature, UnsupportedAlgorithm
+
+try:
+    from .lru import LRUCache
+except ImportError:  # 단독 실행 데모 (cd blockchain && python crypto.py)
+    from lru import LRUCache
+
+
+# 공개키 파싱 결과 캐시 크기 (키 바이트 -> (공개키 객체, 주소))
+PUBLIC_KEY_CACHE_SIZE = 1024
+
+# SEC1 압축 공개키 길이 (접두 바이트 0x02/0x03 + X 좌표 32바이트)
+COMPRESSED_PUBLIC_KEY_SIZE = 33
+
+# 일괄 서명 워커가 보관하는 개인키 수 (같은 지갑의 다음 청크는 키를 다시 읽지 않음)
+SIGNING_KEY_CACHE_SIZE = 64
+
+_CURVE = ec.SECP256K1()
+_ECDSA_SHA256 = ec.ECDSA(hashes.SHA256())
+
+# secp256k1 군의 위수 (개인키 스칼라는 1 ~ n-1)
+SECP256K1_ORDER = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+
+# 재현 모드 상태 (set_reproducible()로 설정)
+_key_seed = None          # 키 유도 시드 (None이면 OS 난수로 키 생성)
+_key_counter = 0          # 시드에서 지금까지 유도한 키 수 (다음 키의 인덱스)
+_deterministic_ecdsa = None  # RFC 6979 결정적 서명 알고리즘 (None이면 무작위 k)
 
 
 class CryptoUtils:
@@ -22,11 +52,55 @@ class CryptoUtils:
         Returns:
             tuple: (private_key, public_key) 객체
         """
+        # 재현 모드면 시드에서 다음 키를 유도
+        if _key_seed is not None:
+            return _next_seeded_key_pair()
+
         # secp256k1 곡선 사용 (비트코인과 동일)
         private_key = ec.generate_private_key(ec.SECP256K1(), default_backend())
         public_key = private_key.public_key()
         return private_key, public_key
 
+    @staticmethod
+    def generate_key_pairs(n):
+        """
+        ECDSA 키 쌍 n개 생성 (부하 테스트용 대량 지갑)
+        키 생성 비용은 스칼라 곱셈이 대부분이고 개인키를 다른 프로세스에서 받아오면
+        다시 읽는 비용이 생성 비용과 비슷하므로 현재 프로세스에서 생성함
+
+        Args:
+            n: 생성할 키 쌍 수
+
+        Returns:
+            list: [(private_key, public_key), ...]
+        """
+        if _key_seed is not None:
+            return [_next_seeded_key_pair() for _ in range(n)]
+
+        pairs = []
+        for _ in range(n):
+            private_key = ec.generate_private_key(_CURVE)
+            pairs.append((private_key, private_key.public_key()))
+        return pairs
+
+    @staticmethod
+    def derive_key_pair(seed, index):
+        """
+        시드와 인덱스에서 키 쌍 유도 (같은 입력이면 항상 같은 키)
+        개인키 스칼라 = SHA-256(시드 || 인덱스) mod (n - 1) + 1
+
+        Args:
+            seed: 시드 (bytes, str 또는 int)
+            index: 키 인덱스 (0부터)
+
+        Returns:
+            tuple: (private_key, public_key) 객체
+        """
+        digest = hashlib.sha256(_seed_bytes(seed) + index.to_bytes(8, 'big')).digest()
+        scalar = int.from_bytes(digest, 'big') % (SECP256K1_ORDER - 1) + 1
+        private_key = ec.derive_private_key(scalar, _CURVE)
+        return private_key, private_key.public_key()
+
     @staticmethod
     def private_key_to_bytes(private_key):
         """
@@ -60,6 +134,22 @@ class CryptoUtils:
             format=serialization.PublicFormat.SubjectPublicKeyInfo
         )
 
+    @staticmethod
+    def public_key_to_compressed_bytes(public_key):
+        """
+        공개키를 SEC1 압축 형식(33바이트)으로 직렬화 (트랜잭션 전송용)
+
+        Args:
+            public_key: 공개키 객체
+
+        Returns:
+            bytes: 압축 공개키
+        """
+        return public_key.public_bytes(
+            encoding=serialization.Encoding.X962,
+            format=serialization.PublicFormat.CompressedPoint
+        )
+
     @staticmethod
     def bytes_to_private_key(key_bytes):
         """
@@ -81,6 +171,7 @@ class CryptoUtils:
     def bytes_to_public_key(key_bytes):
         """
         바이트에서 공개키 객체 복원
+        SEC1 점 인코딩(압축 33바이트 / 비압축 65바이트)과 기존 PEM 형식을 모두 지원
 
         Args:
             key_bytes: 직렬화된 공개키
@@ -88,15 +179,34 @@ class CryptoUtils:
         Returns:
             공개키 객체
         """
+        if key_bytes[:1] in (b'\x02', b'\x03', b'\x04'):
+            return ec.EllipticCurvePublicKey.from_encoded_point(ec.SECP256K1(), key_bytes)
+
         return serialization.load_pem_public_key(
             key_bytes,
             backend=default_backend()
         )
 
+    @staticmethod
+    @functools.lru_cache(maxsize=PUBLIC_KEY_CACHE_SIZE)
+    def load_public_key(key_bytes):
+        """
+        공개키 복원 + 주소 계산 (LRU 캐시: 같은 키는 파싱/해싱을 반복하지 않음)
+
+        Args:
+            key_bytes: 직렬화된 공개키 (압축/비압축 SEC1 또는 PEM)
+
+        Returns:
+            tuple: (공개키 객체, 주소)
+        """
+        public_key = CryptoUtils.bytes_to_public_key(key_bytes)
+        return public_key, CryptoUtils.public_key_to_address(public_key)
+
     @staticmethod
     def public_key_to_address(public_key):
         """
         공개키에서 주소 생성 (SHA-256 해시 사용)
+        (전송 형식과 무관하게 PEM 직렬화 기준이므로 압축 키도 같은 주소)
 
         Args:
             public_key: 공개키 객체
@@ -132,13 +242,36 @@ class CryptoUtils:
         else:
             message_bytes = message
 
-        # ECDSA 서명 생성
+        # ECDSA 서명 생성 (재현 모드면 RFC 6979 결정적 k)
         signature = private_key.sign(
             message_bytes,
-            ec.ECDSA(hashes.SHA256())
+            _signature_algorithm()
         )
         return signature
 
+    @staticmethod
+    def sign_messages(private_key, messages, deterministic=None):
+        """
+        여러 메시지에 차례로 서명 (메시지 변환 분기 없이 바이트만 받음)
+
+        Args:
+            private_key: 개인키 객체 또는 직렬화된 개인키 (워커 프로세스로 보낼 때)
+            messages: 서명할 바이트 메시지 리스트
+            deterministic: RFC 6979 결정적 서명 여부 (None이면 현재 프로세스 설정,
+                           워커 프로세스에는 호출자가 명시적으로 전달)
+
+        Returns:
+            list: 16진수 서명 문자열 리스트
+        """
+        if isinstance(private_key, bytes):
+            private_key = _load_signing_key(private_key)
+        if deterministic is None:
+            algorithm = _signature_algorithm()
+        else:
+            algorithm = _rfc6979_ecdsa() if deterministic else _ECDSA_SHA256
+        sign = private_key.sign
+        return [sign(message, algorithm).hex() for message in messages]
+
     @staticmethod
     def verify_signature(public_key, message, signature):
         """
@@ -200,6 +333,235 @@ class CryptoUtils:
         """
         return bytes.fromhex(hex_string)
 
+    @staticmethod
+    def verify_transaction(tx):
+        """
+        트랜잭션 서명 검증 (공개키 복원 -> 주소 확인 -> ECDSA 검증)
+        워커 프로세스에서도 호출할 수 있도록 트랜잭션 dict만 받음
+
+        Args:
+            tx: 검증할 트랜잭션 (서명/공개키 필드 존재)
+
+        Returns:
+            bool: 서명이 유효한지 여부
+        """
+        try:
+            # 1. 공개키 복원 및 주소 계산 (키 바이트별 캐시)
+            public_key, address = CryptoUtils.load_public_key(bytes.fromhex(tx['public_key']))
+
+            # 2. 송신자 주소와 공개키가 일치하는지 확인
+            if address != tx['body']['sender']:
+                print("[ERROR] 서명 검증 실패: 공개키가 송신자 주소와 불일치")
+                return False
+
+            # 3. 서명 복원 및 검증 (body의 정규 직렬화 바이트 사용)
+            # (crypto.py 단독 실행 데모에서도 임포트되도록 패키지 의존은 여기서만)
+            from .encoding import tx_body_bytes
+            signature = CryptoUtils.hex_to_signature(tx['signature'])
+            return CryptoUtils.verify_signature(public_key, tx_body_bytes(tx['body']), signature)
+
+        except Exception as e:
+            print(f"[ERROR] 서명 검증 중 예외 발생: {e}")
+            return False
+
+    @staticmethod
+    def verify_transactions(txs):
+        """
+        여러 트랜잭션 서명을 차례로 검증 (첫 실패에서 중단)
+
+        Args:
+            txs: 트랜잭션 리스트
+
+        Returns:
+            list: 검증 결과 리스트 (실패가 있으면 그 결과까지만 포함)
+        """
+        results = []
+        for tx in txs:
+            is_valid = CryptoUtils.verify_transaction(tx)
+            results.append(is_valid)
+            if not is_valid:
+                break
+        return results
+
+
+# 서명 일괄 검증용 워커 풀 (처음 필요할 때 생성, 설정이 바뀌면 다시 생성)
+_verify_executor = None
+_verify_executor_config = None
+
+
+def get_verify_executor(kind, workers):
+    """
+    서명 검증 워커 풀 반환 (프로세스 전역에서 공유)
+
+    Args:
+        kind: "process" 또는 "thread" (cryptography는 검증 중 GIL을 해제함)
+        workers: 워커 수
+
+    Returns:
+        Executor: concurrent.futures 실행기
+    """
+    global _verify_executor, _verify_executor_config
+
+    if _verify_executor is not None and _verify_executor_config == (kind, workers):
+        return _verify_executor
+
+    shutdown_verify_executor()
+    if kind == "process":
+        _verify_executor = ProcessPoolExecutor(max_workers=workers)
+    elif kind == "thread":
+        _verify_executor = ThreadPoolExecutor(max_workers=workers)
+    else:
+        raise ValueError(f"지원하지 않는 실행기 종류: {kind}")
+    _verify_executor_config = (kind, workers)
+    return _verify_executor
+
+
+def shutdown_verify_executor():
+    """서명 검증 워커 풀 종료"""
+    global _verify_executor, _verify_executor_config
+
+    if _verify_executor is not None:
+        _verify_executor.shutdown(wait=True, cancel_futures=True)
+    _verify_executor = None
+    _verify_executor_config = None
+
+
+def _seed_bytes(seed):
+    if isinstance(seed, bytes):
+        return seed
+    return str(seed).encode('utf-8')
+
+
+def _next_seeded_key_pair():
+    global _key_counter
+    key_pair = CryptoUtils.derive_key_pair(_key_seed, _key_counter)
+    _key_counter += 1
+    return key_pair
+
+
+def _rfc6979_ecdsa():
+    return ec.ECDSA(hashes.SHA256(), deterministic_signing=True)
+
+
+@functools.lru_cache(maxsize=None)
+def rfc6979_supported():
+    """
+    RFC 6979 결정적 서명 지원 여부 (프로세스당 한 번만 확인, 미지원이면 경고 출력)
+    OpenSSL 3.2 미만 백엔드는 UnsupportedAlgorithm, deterministic_signing 인자가 없는
+    cryptography 버전은 TypeError 발생
+
+    Returns:
+        bool: 지원 여부
+    """
+    try:
+        _rfc6979_ecdsa()
+    except (UnsupportedAlgorithm, TypeError) as e:
+        print(f"[WARN] RFC 6979 결정적 서명 미지원 ({e}): 재현 모드에서도 서명은 무작위 k 사용")
+        return False
+    return True
+
+
+def _signature_algorithm():
+    return _deterministic_ecdsa if _deterministic_ecdsa is not None else _ECDSA_SHA256
+
+
+def set_reproducible(seed):
+    """
+    재현 모드 설정: 이후 생성되는 키는 시드에서 차례로 유도하고 서명은 RFC 6979 결정적 k 사용
+    (같은 시드로 같은 순서의 작업을 하면 키/서명/txid/블록 해시가 실행마다 동일,
+     백엔드가 RFC 6979를 지원하지 않으면 경고 후 무작위 k로 서명 - rfc6979_supported())
+
+    Args:
+        seed: 시드 (bytes, str 또는 int, None이면 재현 모드 해제)
+
+    Returns:
+        tuple: 바꾸기 전 재현 모드 상태 (restore_reproducible()로 되돌릴 때 사용)
+    """
+    global _key_seed, _key_counter, _deterministic_ecdsa
+
+    previous = (_key_seed, _key_counter, _deterministic_ecdsa)
+    if seed is None:
+        _key_seed = None
+        _deterministic_ecdsa = None
+    else:
+        # 미지원 백엔드면 키만 시드에서 유도 (서명할 때마다 실패하지 않도록 여기서 한 번 확인)
+        _deterministic_ecdsa = _rfc6979_ecdsa() if rfc6979_supported() else None
+        _key_seed = _seed_bytes(seed)
+    _key_counter = 0
+    return previous
+
+
+def restore_reproducible(state):
+    """
+    set_reproducible()이 반환한 재현 모드 상태로 복원 (키 유도 위치 포함)
+
+    Args:
+        state: (시드, 유도한 키 수, 서명 알고리즘)
+    """
+    global _key_seed, _key_counter, _deterministic_ecdsa
+
+    _key_seed, _key_counter, _deterministic_ecdsa = state
+
+
+def is_reproducible():
+    """재현 모드 여부"""
+    return _key_seed is not None
+
+
+def is_deterministic_signing():
+    """RFC 6979 결정적 서명 사용 여부"""
+    return _deterministic_ecdsa is not None
+
+
+@functools.lru_cache(maxsize=SIGNING_KEY_CACHE_SIZE)
+def _load_signing_key(private_key_bytes):
+    return CryptoUtils.bytes_to_private_key(private_key_bytes)
+
+
+# 일괄 서명용 프로세스 풀 (처음 필요할 때 생성, 워커 수가 바뀌면 다시 생성)
+_sign_executor = None
+_sign_executor_workers = None
+
+
+def get_sign_executor(workers):
+    """
+    일괄 서명 프로세스 풀 반환 (프로세스 전역에서 공유)
+
+    Args:
+        workers: 워커 수
+
+    Returns:
+        ProcessPoolExecutor: 프로세스 풀
+    """
+    global _sign_executor, _sign_executor_workers
+
+    if _sign_executor is not None and _sign_executor_workers == workers:
+        return _sign_executor
+
+    shutdown_sign_executor()
+    _sign_executor = ProcessPoolExecutor(max_workers=workers)
+    _sign_executor_workers = workers
+    return _sign_executor
+
+
+def shutdown_sign_executor():
+    """일괄 서명 프로세스 풀 종료"""
+    global _sign_executor, _sign_executor_workers
+
+    if _sign_executor is not None:
+        _sign_executor.shutdown(wait=True, cancel_futures=True)
+    _sign_executor = None
+    _sign_executor_workers = None
+
+
+class SignatureCache(LRUCache):
+    """
+    서명 검증 결과 LRU 캐시 (lru.LRUCache)
+    key: (txid, signature, public_key) - 검증 입력 전체를 포함하므로 결과는 결정적
+    value: 검증 결과 (bool)
+    (같은 NetworkSimulator의 노드들이 하나의 캐시를 공유할 수 있음)
+    """
+
 
 def demo():
     """암호화 기능 데모"""
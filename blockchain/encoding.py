@@ -0,0 +1,347 @@
+"""
+직렬화 모듈
+트랜잭션 본문 / 트랜잭션 / 블록 헤더의 정규(Canonical) 바이너리 인코딩
+(버전 바이트 + 타입 태그 + 길이 접두, dict는 키 정렬 -> 같은 값은 항상 같은 바이트)
+
+config.SERIALIZATION_FORMAT이 "json"이면 해시/서명/txid는 기존
+json.dumps(sort_keys=True) 바이트를 그대로 사용 (기존 해시 호환 모드)
+"""
+
+import hashlib
+import json
+import struct
+from . import config
+
+
+# 인코딩 형식 버전 (모든 인코딩의 첫 바이트)
+FORMAT_VERSION = 1
+
+# 타입 태그
+_NONE = b'N'
+_TRUE = b'T'
+_FALSE = b'F'
+_INT = b'I'
+_FLOAT = b'R'
+_STR = b'S'
+_BYTES = b'B'
+_LIST = b'L'
+_DICT = b'D'
+_TX_BODY = b'X'  # 표준 트랜잭션 본문 전용 고정 레이아웃
+_TX = b'Y'       # 표준 서명 트랜잭션 전용 고정 레이아웃 (본문 + 서명 + 공개키)
+
+_U32 = struct.Struct('>I')
+_F64 = struct.Struct('>d')
+
+# 표준 트랜잭션 본문 필드 (이 키 집합이면 고정 레이아웃 사용)
+_TX_BODY_FIELDS = frozenset(("sender", "recipient", "amount", "nonce"))
+_TX_FIELDS = frozenset(("body", "signature", "public_key"))
+
+# 블록 헤더 필드 (해시 대상, 순서 고정)
+BLOCK_HEADER_FIELDS = ("index", "timestamp", "bits", "previous_hash", "merkle_root", "nonce")
+
+
+class EncodingError(ValueError):
+    """인코딩/디코딩 실패 (지원하지 않는 타입, 손상된 데이터, 버전 불일치)"""
+
+
+def _encode_int(value):
+    length = (value.bit_length() + 8) // 8  # 부호 비트 포함
+    return _U32.pack(length) + value.to_bytes(length, 'big', signed=True)
+
+
+def _encode_str(value):
+    data = value.encode('utf-8')
+    return _U32.pack(len(data)) + data
+
+
+def _encode_into(value, out):
+    """value의 인코딩을 out(bytearray)에 이어 붙임"""
+    # bool은 int의 하위 타입이므로 먼저 확인
+    if value is None:
+        out += _NONE
+    elif value is True:
+        out += _TRUE
+    elif value is False:
+        out += _FALSE
+    elif isinstance(value, int):
+        out += _INT
+        out += _encode_int(value)
+    elif isinstance(value, float):
+        out += _FLOAT
+        out += _F64.pack(value)
+    elif isinstance(value, str):
+        out += _STR
+        out += _encode_str(value)
+    elif isinstance(value, (bytes, bytearray)):
+        out += _BYTES
+        out += _U32.pack(len(value))
+        out += value
+    elif isinstance(value, (list, tuple)):
+        out += _LIST
+        out += _U32.pack(len(value))
+        for item in value:
+            _encode_into(item, out)
+    elif isinstance(value, dict):
+        # 표준 형태는 키 이름 없이 고정 순서로 기록 (그 외는 일반 dict 인코딩)
+        if value.keys() == _TX_BODY_FIELDS and _is_standard_body(value):
+            out += _TX_BODY
+            _encode_body_into(value, out)
+            return
+        if value.keys() == _TX_FIELDS and _is_standard_tx(value):
+            out += _TX
+            _encode_body_into(value['body'], out)
+            out += _encode_str(value['signature'])
+            out += _encode_str(value['public_key'])
+            return
+
+        out += _DICT
+        out += _U32.pack(len(value))
+        for key in sorted(value):
+            if not isinstance(key, str):
+                raise EncodingError(f"dict 키는 문자열이어야 함: {key!r}")
+            out += _encode_str(key)
+            _encode_into(value[key], out)
+    else:
+        raise EncodingError(f"지원하지 않는 타입: {type(value).__name__}")
+
+
+def _encode_body_into(body, out):
+    out += _encode_str(body['sender'])
+    out += _encode_str(body['recipient'])
+    out += _encode_int(body['amount'])
+    out += _encode_int(body['nonce'])
+
+
+def _is_standard_body(body):
+    return (type(body['sender']) is str and type(body['recipient']) is str
+            and type(body['amount']) is int and type(body['nonce']) is int)
+
+
+def _is_standard_tx(tx):
+    body = tx['body']
+    return (isinstance(body, dict) and body.keys() == _TX_BODY_FIELDS and _is_standard_body(body)
+            and type(tx['signature']) is str and type(tx['public_key']) is str)
+
+
+def encode_value(value):
+    """
+    값을 정규 바이너리로 인코딩 (버전 바이트 포함)
+
+    Args:
+        value: None/bool/int/float/str/bytes/list/dict 조합
+
+    Returns:
+        bytes: 인코딩된 바이트
+    """
+    out = bytearray((FORMAT_VERSION,))
+    _encode_into(value, out)
+    return bytes(out)
+
+
+class _Reader:
+    """디코딩용 바이트 커서"""
+
+    def __init__(self, data):
+        self.data = memoryview(data)
+        self.pos = 0
+
+    def take(self, size):
+        end = self.pos + size
+        if end > len(self.data):
+            raise EncodingError("데이터가 예상보다 짧음")
+        chunk = self.data[self.pos:end]
+        self.pos = end
+        return chunk
+
+    def u32(self):
+        return _U32.unpack(self.take(4))[0]
+
+    def int(self):
+        return int.from_bytes(self.take(self.u32()), 'big', signed=True)
+
+    def str(self):
+        try:
+            return str(self.take(self.u32()), 'utf-8')
+        except UnicodeDecodeError as e:
+            raise EncodingError(f"잘못된 UTF-8 문자열: {e}")
+
+
+def _decode_from(reader):
+    tag = bytes(reader.take(1))
+    if tag == _NONE:
+        return None
+    if tag == _TRUE:
+        return True
+    if tag == _FALSE:
+        return False
+    if tag == _INT:
+        return reader.int()
+    if tag == _FLOAT:
+        return _F64.unpack(reader.take(8))[0]
+    if tag == _STR:
+        return reader.str()
+    if tag == _BYTES:
+        return bytes(reader.take(reader.u32()))
+    if tag == _LIST:
+        return [_decode_from(reader) for _ in range(reader.u32())]
+    if tag == _DICT:
+        result = {}
+        for _ in range(reader.u32()):
+            key = reader.str()
+            result[key] = _decode_from(reader)
+        return result
+    if tag == _TX_BODY:
+        return _decode_body(reader)
+    if tag == _TX:
+        body = _decode_body(reader)
+        signature = reader.str()
+        return {"body": body, "signature": signature, "public_key": reader.str()}
+    raise EncodingError(f"알 수 없는 타입 태그: {tag!r}")
+
+
+def _decode_body(reader):
+    sender = reader.str()
+    recipient = reader.str()
+    amount = reader.int()
+    return {"sender": sender, "recipient": recipient, "amount": amount, "nonce": reader.int()}
+
+
+def decode_value(data):
+    """
+    encode_value()로 인코딩된 바이트를 값으로 복원
+
+    Args:
+        data: 인코딩된 바이트
+
+    Returns:
+        복원된 값 (tuple은 list로 복원)
+    """
+    reader = _Reader(data)
+    version = reader.take(1)[0]
+    if version != FORMAT_VERSION:
+        raise EncodingError(f"지원하지 않는 형식 버전: {version}")
+
+    value = _decode_from(reader)
+    if reader.pos != len(reader.data):
+        raise EncodingError("인코딩 뒤에 남는 데이터가 있음")
+    return value
+
+
+# 트랜잭션 / 블록 헤더 API
+
+def encode_tx_body(body):
+    """트랜잭션 본문 인코딩 (서명/txid 대상)"""
+    return encode_value(body)
+
+
+def decode_tx_body(data):
+    """트랜잭션 본문 디코딩"""
+    return _expect_dict(decode_value(data), "트랜잭션 본문")
+
+
+def encode_transaction(tx):
+    """트랜잭션 전체 인코딩 (본문 + 서명 + 공개키)"""
+    return encode_value(tx)
+
+
+def decode_transaction(data):
+    """트랜잭션 전체 디코딩"""
+    return _expect_dict(decode_value(data), "트랜잭션")
+
+
+def transaction_hash(tx):
+    """
+    트랜잭션 전체(본문 + 서명 + 공개키)의 해시 (머클 트리 리프)
+
+    Args:
+        tx: 트랜잭션
+
+    Returns:
+        bytes: SHA-256 다이제스트 (32바이트)
+    """
+    return hashlib.sha256(encode_transaction(tx)).digest()
+
+
+def encode_block_header(index, timestamp, bits, previous_hash, merkle_root, nonce):
+    """
+    블록 헤더 인코딩 (블록 해시 대상, 트랜잭션 수와 무관한 고정 크기)
+
+    Args:
+        index: 블록 높이
+        timestamp: 블록 생성 시간
+        bits: 목표값의 압축 표현 (nBits)
+        previous_hash: 이전 블록 해시
+        merkle_root: 트랜잭션 머클 루트 (32바이트)
+        nonce: PoW nonce
+
+    Returns:
+        bytes: 인코딩된 헤더
+    """
+    return encode_value([index, timestamp, bits, previous_hash, merkle_root, nonce])
+
+
+def encode_block_header_prefix(index, timestamp, bits, previous_hash, merkle_root):
+    """
+    nonce를 제외한 블록 헤더 앞부분 인코딩 (채굴 시 미리 해싱해 두는 고정 구간)
+    encode_block_header_prefix(...) + encode_nonce(nonce) == encode_block_header(..., nonce)
+
+    Returns:
+        bytes: 헤더 앞부분
+    """
+    out = bytearray((FORMAT_VERSION,))
+    out += _LIST
+    out += _U32.pack(len(BLOCK_HEADER_FIELDS))
+    for value in (index, timestamp, bits, previous_hash, merkle_root):
+        _encode_into(value, out)
+    return bytes(out)
+
+
+def encode_nonce(nonce):
+    """블록 헤더의 마지막 필드(nonce) 인코딩"""
+    return _INT + _encode_int(nonce)
+
+
+def decode_block_header(data):
+    """
+    블록 헤더 디코딩
+
+    Returns:
+        dict: BLOCK_HEADER_FIELDS를 키로 하는 딕셔너리
+    """
+    fields = decode_value(data)
+    if not isinstance(fields, list) or len(fields) != len(BLOCK_HEADER_FIELDS):
+        raise EncodingError("블록 헤더 형식이 아님")
+    return dict(zip(BLOCK_HEADER_FIELDS, fields))
+
+
+def _expect_dict(value, name):
+    if not isinstance(value, dict):
+        raise EncodingError(f"{name} 형식이 아님")
+    return value
+
+
+# 해시/서명 경로용 (형식 설정 반영)
+
+def is_json_compatible():
+    """기존 JSON 해시 호환 모드 여부"""
+    return config.SERIALIZATION_FORMAT == "json"
+
+
+def json_bytes(value):
+    """기존 방식 직렬화 (json.dumps(sort_keys=True))"""
+    return json.dumps(value, sort_keys=True).encode('utf-8')
+
+
+def tx_body_bytes(body):
+    """
+    txid 계산/서명에 쓰이는 트랜잭션 본문 바이트
+
+    Args:
+        body: 트랜잭션 본문
+
+    Returns:
+        bytes: 설정된 형식의 직렬화 결과
+    """
+    if is_json_compatible():
+        return json_bytes(body)
+    return encode_tx_body(body)
@@ -0,0 +1,152 @@
+"""
+이산 사건(Discrete-Event) 시뮬레이션 모듈
+시각이 붙은 이벤트를 힙에 보관하고 다음 이벤트 시각으로 바로 이동하며 처리
+(비용은 노드 수 × 틱이 아니라 이벤트 수에 비례)
+링크별 지연(Latency) / 대역폭(Bandwidth) 전송 모델 포함
+"""
+
+import heapq
+from . import config
+
+
+class EventScheduler:
+    """
+    시각순 이벤트 큐
+    같은 시각은 정렬 키(key) 순서, 키도 같으면 예약 순서대로 처리
+    (키를 노드별 순번으로 주면 처리 순서가 전역 예약 순서와 무관해짐 - 샤드 실행과 결과 일치)
+    """
+
+    def __init__(self, start_time=0):
+        """
+        Args:
+            start_time: 시작 시각
+        """
+        self.now = start_time
+        self._queue = []  # (시각, 정렬 키, 예약 순번, action, args)
+        self._seq = 0
+        self.processed = 0
+
+    def schedule(self, at, action, *args, key=()):
+        """
+        at 시각에 action(*args) 실행 예약
+
+        Args:
+            at: 실행 시각 (현재 시각보다 이르면 현재 시각으로 보정)
+            action: 호출할 함수
+            *args: 함수 인자
+            key: 같은 시각 이벤트의 정렬 키 (튜플, 기본은 예약 순서만 사용)
+        """
+        heapq.heappush(self._queue, (max(at, self.now), key, self._seq, action, args))
+        self._seq += 1
+
+    def schedule_after(self, delay, action, *args, key=()):
+        """현재 시각으로부터 delay 뒤에 action(*args) 실행 예약"""
+        self.schedule(self.now + delay, action, *args, key=key)
+
+    def next_time(self):
+        """다음 이벤트 시각 (없으면 None)"""
+        return self._queue[0][0] if self._queue else None
+
+    def step(self):
+        """
+        다음 이벤트 하나 처리 (전역 시뮬레이션 시간을 이벤트 시각으로 이동)
+
+        Returns:
+            bool: 처리한 이벤트가 있었는지 여부
+        """
+        if not self._queue:
+            return False
+
+        at, _, _, action, args = heapq.heappop(self._queue)
+        self.now = at
+        config.SIM_TIME = at
+        action(*args)
+        self.processed += 1
+        return True
+
+    def run(self, until=None, max_events=None):
+        """
+        이벤트 처리 (until 시각 이후의 이벤트는 남겨 둠)
+
+        Args:
+            until: 종료 시각 (None이면 큐가 빌 때까지, 끝나면 현재 시각을 until로 이동)
+            max_events: 최대 처리 이벤트 수
+
+        Returns:
+            int: 처리한 이벤트 수
+        """
+        count = 0
+        while self._queue and (max_events is None or count < max_events):
+            if until is not None and self._queue[0][0] > until:
+                break
+            self.step()
+            count += 1
+
+        if until is not None and (max_events is None or count < max_events) and until > self.now:
+            self.now = until
+            config.SIM_TIME = until
+        return count
+
+    def run_before(self, end):
+        """
+        end 시각 전(미만)의 이벤트만 처리 (시각은 end로 옮기지 않음 - 샤드 시간 창 처리용)
+
+        Args:
+            end: 시간 창 끝 (이 시각의 이벤트는 남겨 둠)
+
+        Returns:
+            int: 처리한 이벤트 수
+        """
+        count = 0
+        while self._queue and self._queue[0][0] < end:
+            self.step()
+            count += 1
+        return count
+
+    def __len__(self):
+        return len(self._queue)
+
+    def __repr__(self):
+        return f"EventScheduler(now={self.now}, pending={len(self._queue)}, processed={self.processed})"
+
+
+class Link:
+    """
+    단방향 링크 전송 모델
+    메시지는 링크에서 차례로 전송되고(대역폭 점유), 전송이 끝난 뒤 지연 시간만큼 지나 도착
+    """
+
+    __slots__ = ('latency', 'bandwidth', 'busy_until', 'messages', 'bytes_sent')
+
+    def __init__(self, latency, bandwidth):
+        """
+        Args:
+            latency: 전파 지연 (초)
+            bandwidth: 대역폭 (바이트/초, None이면 무제한)
+        """
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.busy_until = 0   # 이 시각까지 앞선 메시지를 전송 중
+        self.messages = 0
+        self.bytes_sent = 0
+
+    def transmit(self, now, size):
+        """
+        메시지 전송 예약
+
+        Args:
+            now: 전송 요청 시각
+            size: 메시지 크기 (바이트)
+
+        Returns:
+            float: 수신 측 도착 시각
+        """
+        start = max(now, self.busy_until)
+        finish = start + (size / self.bandwidth if self.bandwidth else 0)
+        self.busy_until = finish
+        self.messages += 1
+        self.bytes_sent += size
+        return finish + self.latency
+
+    def __repr__(self):
+        return f"Link(latency={self.latency}, bandwidth={self.bandwidth}, messages={self.messages})"
@@ -0,0 +1,66 @@
+"""
+불변 객체 모듈
+노드 간에 복사 없이 공유하는 트랜잭션/블록 내용을 수정할 수 없게 고정
+(FrozenDict는 dict 하위 타입이므로 조회/JSON/인코딩 경로는 그대로 동작)
+"""
+
+
+class FrozenDict(dict):
+    """수정할 수 없는 dict (copy/deepcopy는 자기 자신을 반환)"""
+
+    __slots__ = ()
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError(f"{type(self).__name__}는 수정할 수 없음")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        # 기본 dict 하위 타입 pickle은 __setitem__으로 복원하므로 생성자 인자로 전달
+        return (FrozenDict, (dict(self),))
+
+    def __repr__(self):
+        return f"FrozenDict({dict.__repr__(self)})"
+
+
+def freeze(value):
+    """
+    값을 재귀적으로 불변 형태로 변환 (dict -> FrozenDict, list -> tuple)
+
+    Args:
+        value: 트랜잭션 등 dict/list/스칼라 조합
+
+    Returns:
+        불변 값 (이미 FrozenDict면 그대로 반환)
+    """
+    if isinstance(value, FrozenDict):
+        return value
+    if isinstance(value, dict):
+        return FrozenDict({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def thaw(value):
+    """
+    freeze()의 역변환: 수정 가능한 독립 복사본 생성 (FrozenDict -> dict, tuple -> list)
+
+    Args:
+        value: 불변 값
+
+    Returns:
+        수정 가능한 값
+    """
+    if isinstance(value, dict):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [thaw(item) for item in value]
+    return value
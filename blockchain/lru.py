@@ -0,0 +1,90 @@
+"""
+LRU 캐시 모듈
+적중/실패/제거 통계를 세는 크기 제한 캐시
+(서명 검증 결과 캐시 crypto.SignatureCache와 상태 스냅샷 캐시 state.StateCache가 공유)
+"""
+
+from collections import OrderedDict
+
+
+class LRUCache:
+    """
+    키별 값 LRU 캐시 (None은 저장하지 않음 - get()이 None이면 캐시 미스)
+    """
+
+    def __init__(self, capacity):
+        """
+        Args:
+            capacity: 최대 보관 항목 수
+        """
+        self.capacity = capacity
+        self._entries = OrderedDict()  # {key: value} (앞쪽이 가장 오래 쓰이지 않은 항목)
+
+        # 캐시 크기 조정을 위한 통계
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        """
+        값 조회 (적중/실패 통계 반영, 최근 사용으로 갱신)
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            캐시된 값 또는 None (미스)
+        """
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return value
+
+    def peek(self, key):
+        """통계/LRU 순서에 영향 없이 조회"""
+        return self._entries.get(key)
+
+    def put(self, key, value):
+        """
+        값 저장 (용량 초과 시 가장 오래 쓰이지 않은 항목 제거)
+
+        Args:
+            key: 캐시 키
+            value: 저장할 값 (저장 후에는 수정하지 않음)
+        """
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        """캐시 비우기 (통계는 유지)"""
+        self._entries.clear()
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        """
+        캐시 통계 반환
+
+        Returns:
+            dict: {'size', 'capacity', 'hits', 'misses', 'evictions', 'hit_rate'}
+        """
+        total = self.hits + self.misses
+        return {
+            'size': len(self._entries),
+            'capacity': self.capacity,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / total if total else 0.0,
+        }
@@ -8,7 +8,11 @@
     python blockchain/main.py
 """
 
+import os
+import time
+
 from blockchain import Node, NetworkSimulator, Wallet, config
+from blockchain.sharding import ShardedNetworkSimulator, effective_shard_workers
 
 
 def main():
@@ -77,7 +81,7 @@ def main():
         print(f"  - 주소: {node.node_id[:32]}...")
         print(f"  - 체인 높이: {tip.index}")
         print(f"  - Tip 해시: {tip.hash[:16]}...")
-        print(f"  - 총 작업량: {tip.total_work}")
+        print(f"  - 총 작업량: {node.get_chain_work()}")
         print(f"  - 현재 난이도: {tip.difficulty}")
         print(f"  - 잔액: {state['balance']}")
         print(f"  - Nonce: {state['nonce']}")
@@ -162,6 +166,7 @@ def demo_signature_validation():
     print("=" * 60)
 
     from blockchain import CryptoUtils
+    from blockchain.encoding import tx_body_bytes
 
     # 지갑 생성
     alice_wallet = Wallet("Alice")
@@ -189,7 +194,7 @@ def demo_signature_validation():
     public_key = CryptoUtils.bytes_to_public_key(public_key_bytes)
     signature = CryptoUtils.hex_to_signature(tx['signature'])
 
-    is_valid = CryptoUtils.verify_signature(public_key, tx['body'], signature)
+    is_valid = CryptoUtils.verify_signature(public_key, tx_body_bytes(tx['body']), signature)
     print(f"   검증 결과: {'[OK] 유효한 서명' if is_valid else '[FAIL] 무효한 서명'}")
 
     # 공개키로부터 주소 복원
@@ -202,15 +207,70 @@ def demo_signature_validation():
     tampered_body = tx['body'].copy()
     tampered_body['amount'] = 1000
 
-    is_valid_tampered = CryptoUtils.verify_signature(public_key, tampered_body, signature)
+    is_valid_tampered = CryptoUtils.verify_signature(public_key, tx_body_bytes(tampered_body), signature)
     print(f"   검증 결과: {'[OK] 유효한 서명 (이상함!)' if is_valid_tampered else '[FAIL] 무효한 서명 (정상)'}")
 
     # 다른 사람의 공개키로 검증 시도
     print(f"\n[WARN] Bob의 공개키로 검증 시도...")
-    is_valid_wrong_key = CryptoUtils.verify_signature(bob_wallet.public_key, tx['body'], signature)
+    is_valid_wrong_key = CryptoUtils.verify_signature(bob_wallet.public_key, tx_body_bytes(tx['body']), signature)
     print(f"   검증 결과: {'[OK] 유효한 서명 (이상함!)' if is_valid_wrong_key else '[FAIL] 무효한 서명 (정상)'}")
 
 
+def demo_sharding_benchmark(node_count=300, duration=20, shards=None, seed=7, kind="random_regular"):
+    """
+    샤드 병렬 시뮬레이션 벤치마크 - 같은 시드의 단일 프로세스 실행과 시간/결과 비교
+    (노드 로그도 시간에 포함되므로 `python -m blockchain.main > /dev/null`처럼 출력을 버리고 측정 권장,
+     속도 향상은 CPU 코어가 샤드 수 이상이어야 나타남)
+
+    Args:
+        node_count: 노드 수
+        duration: 시뮬레이션 시간 (초)
+        shards: 샤드 수 (None이면 config.SHARD_WORKERS를 CPU / 노드 수로 제한)
+        seed: 재현 시드
+        kind: 피어 토폴로지 (None이면 직접 전송)
+
+    Returns:
+        dict: 실행 시간(single / sharded 초), 속도 향상, 샤드 수, 시간 창 수, 결과 일치 여부
+    """
+    node_ids = [f"N{i}" for i in range(node_count)]
+
+    config.SIM_TIME = 0
+    start = time.perf_counter()
+    single = NetworkSimulator(seed=seed)
+    for node_id in node_ids:
+        single.add_node(Node(node_id, single.genesis_block))
+    if kind:
+        single.set_topology(kind)
+    single.run_event_simulation(duration=duration)
+    single_elapsed = time.perf_counter() - start
+    expected = (single.get_node_summaries(), single.event_stats)
+
+    config.SIM_TIME = 0
+    start = time.perf_counter()
+    with ShardedNetworkSimulator(seed=seed, shards=shards) as sharded:
+        for node_id in node_ids:
+            sharded.add_node(node_id)
+        if kind:
+            sharded.set_topology(kind)
+        sharded.run_event_simulation(duration=duration)
+        sharded_elapsed = time.perf_counter() - start
+        result = {
+            'single': single_elapsed,
+            'sharded': sharded_elapsed,
+            'speedup': single_elapsed / sharded_elapsed,
+            'shards': sharded.shard_count,
+            'windows': sharded.windows,
+            'identical': (sharded.get_node_summaries(), sharded.event_stats) == expected,
+        }
+
+    print(f"\n[BENCH] 노드 {node_count}개, {duration}초, CPU {os.cpu_count()}개 "
+          f"(샤드 상한 {effective_shard_workers(config.SHARD_WORKERS, node_count)}개)")
+    print(f"   단일 프로세스: {result['single']:.2f}초 | 샤드 {result['shards']}개: {result['sharded']:.2f}초 "
+          f"(시간 창 {result['windows']}개) | 속도 향상 {result['speedup']:.2f}배 | "
+          f"결과 {'일치' if result['identical'] else '불일치'}")
+    return result
+
+
 if __name__ == "__main__":
     # 기본 시뮬레이션 실행
     main()
@@ -222,3 +282,7 @@ if __name__ == "__main__":
     # 서명 검증 데모를 실행하려면 아래 주석 해제
     # print("\n\n")
     # demo_signature_validation()
+
+    # 샤드 병렬 시뮬레이션 벤치마크를 실행하려면 아래 주석 해제 (다중 코어에서 의미 있음)
+    # print("\n\n")
+    # demo_sharding_benchmark()
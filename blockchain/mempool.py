@@ -0,0 +1,268 @@
+"""
+멤풀 모듈
+txid로 인덱싱된 대기 트랜잭션 저장소 (삽입/조회/삭제 O(1), 도착 순서 유지)
+송신자별 nonce 큐와 실행 가능 송신자(Ready) 집합으로 블록 템플릿을 O(k log n)에 구성
+재검증이 필요한 송신자(Dirty)만 추적하여 팁 변경 시 증분 정리
+"""
+
+import heapq
+from collections import OrderedDict
+
+
+class Mempool:
+    """txid 인덱스 + 송신자별 nonce 큐 기반 멤풀"""
+
+    def __init__(self, txid_func, nonce_func):
+        """
+        Args:
+            txid_func: 트랜잭션 -> txid 함수 (Node.compute_txid)
+            nonce_func: 송신자 주소 -> 현재 확정 nonce 함수 (Node.get_confirmed_nonce)
+        """
+        self._txid_func = txid_func
+        self._nonce_func = nonce_func
+
+        self._txs = OrderedDict()  # {txid: tx} - 도착 순서 유지
+        self._entries = {}         # {txid: (도착 순번, sender, nonce)}
+        self._seq = 0
+
+        # 송신자별 nonce 큐: {sender: {nonce: [txid, ...]}} (같은 nonce는 도착 순서)
+        self._by_sender = {}
+
+        # Ready 집합: {sender: 다음 nonce(확정 nonce + 1)의 선두 txid}
+        # Ready 힙: (도착 순번, sender, txid) - 지연 삭제 (Ready 집합과 다르면 무시)
+        self._ready = {}
+        self._ready_heap = []
+
+        # Dirty 집합: 재검증이 필요한 송신자 (새 거래 도착 또는 확정 상태 변경)
+        self._dirty = set()
+
+    def add(self, tx):
+        """
+        트랜잭션 추가 (이미 같은 txid가 있으면 거부)
+
+        Args:
+            tx: 추가할 트랜잭션
+
+        Returns:
+            bool: 추가 여부 (중복이면 False)
+        """
+        txid = self._txid_func(tx)
+        if txid in self._txs:
+            return False
+
+        body = tx['body']
+        sender = body['sender']
+        nonce = body.get('nonce', 0)
+
+        self._txs[txid] = tx
+        self._entries[txid] = (self._seq, sender, nonce)
+        self._seq += 1
+        self._by_sender.setdefault(sender, {}).setdefault(nonce, []).append(txid)
+
+        self._dirty.add(sender)
+        self.refresh_sender(sender)
+        return True
+
+    def remove(self, tx):
+        """
+        트랜잭션 제거
+
+        Args:
+            tx: 제거할 트랜잭션
+
+        Returns:
+            bool: 제거 여부 (없었으면 False)
+        """
+        return self.discard(self._txid_func(tx)) is not None
+
+    def discard(self, txid):
+        """
+        txid로 트랜잭션 제거
+
+        Args:
+            txid: 트랜잭션 ID
+
+        Returns:
+            dict: 제거된 트랜잭션 또는 None
+        """
+        tx = self._txs.pop(txid, None)
+        if tx is None:
+            return None
+
+        _, sender, nonce = self._entries.pop(txid)
+        queue = self._by_sender[sender]
+        queue[nonce].remove(txid)
+        if not queue[nonce]:
+            del queue[nonce]
+        if not queue:
+            del self._by_sender[sender]
+
+        self.refresh_sender(sender)
+        return tx
+
+    def refresh_sender(self, sender):
+        """
+        송신자의 Ready 여부 갱신 (확정 nonce가 바뀌었거나 큐가 바뀐 경우 호출)
+
+        Args:
+            sender: 송신자 주소
+        """
+        head = None
+        queue = self._by_sender.get(sender)
+        if queue:
+            txids = queue.get(self._nonce_func(sender) + 1)
+            if txids:
+                head = txids[0]
+
+        if head is None:
+            self._ready.pop(sender, None)
+        elif self._ready.get(sender) != head:
+            self._ready[sender] = head
+            heapq.heappush(self._ready_heap, (self._entries[head][0], sender, head))
+
+            # 지연 삭제로 쌓인 무효 항목이 많아지면 힙 재구성
+            if len(self._ready_heap) > 2 * len(self._ready) + 64:
+                self._ready_heap = [(self._entries[h][0], s, h) for s, h in self._ready.items()]
+                heapq.heapify(self._ready_heap)
+
+    def refresh_senders(self, senders):
+        """
+        확정 상태가 바뀐 계정들의 Ready 여부 갱신 및 재검증 대상 표시
+        (멤풀에 거래가 없는 계정은 무시)
+
+        Args:
+            senders: 상태가 바뀐 계정 주소들
+        """
+        for sender in senders:
+            if sender in self._by_sender or sender in self._ready:
+                self._dirty.add(sender)
+                self.refresh_sender(sender)
+
+    def refresh_all(self):
+        """모든 송신자의 Ready 여부 갱신 (상태를 통째로 다시 계산한 경우)"""
+        self.refresh_senders(list(self._by_sender))
+
+    def pop_dirty(self):
+        """
+        재검증이 필요한 송신자 집합을 꺼내고 비움
+
+        Returns:
+            set: 송신자 주소 집합
+        """
+        dirty = self._dirty
+        self._dirty = set()
+        return dirty
+
+    def select(self, max_txs, accept):
+        """
+        블록 템플릿용 트랜잭션 선택
+        Ready 송신자의 선두 거래를 도착 순서대로 꺼내고, 채택되면 같은 송신자의
+        다음 nonce 거래를 후보에 추가 (선택 수 k에 대해 O(k log n))
+
+        Args:
+            max_txs: 최대 선택 거래 수
+            accept: tx -> bool 콜백 (서명/잔액 확인, 채택 시 호출자가 잔액 차감 반영)
+
+        Returns:
+            list: 선택된 트랜잭션 리스트 (송신자별 nonce 순서 보장)
+        """
+        selected = []
+        taken = set()
+        restore = []    # Ready 힙에서 꺼낸 유효 항목 (선택 후 되돌림)
+        followers = []  # 이번 선택 중 새로 실행 가능해진 후보
+
+        heap = self._ready_heap
+        while len(selected) < max_txs:
+            # Ready 힙 최상단의 무효 항목 정리
+            while heap and self._ready.get(heap[0][1]) != heap[0][2]:
+                heapq.heappop(heap)
+
+            if heap and (not followers or heap[0] < followers[0]):
+                entry = heapq.heappop(heap)
+                restore.append(entry)
+            elif followers:
+                entry = heapq.heappop(followers)
+            else:
+                break
+
+            _, sender, txid = entry
+            if txid in taken:
+                continue
+            taken.add(txid)
+
+            nonce = self._entries[txid][2]
+            queue = self._by_sender[sender]
+
+            if accept(self._txs[txid]):
+                selected.append(self._txs[txid])
+                candidates = queue.get(nonce + 1)
+            else:
+                # 같은 nonce의 다른 거래(충돌 거래)가 있으면 다음 후보로 시도
+                same_nonce = queue[nonce]
+                position = same_nonce.index(txid)
+                candidates = same_nonce[position + 1:position + 2]
+
+            if candidates:
+                heapq.heappush(followers, (self._entries[candidates[0]][0], sender, candidates[0]))
+
+        for entry in restore:
+            heapq.heappush(heap, entry)
+
+        return selected
+
+    def get(self, txid):
+        """txid로 트랜잭션 조회 (없으면 None)"""
+        return self._txs.get(txid)
+
+    def items(self):
+        """(txid, tx) 쌍을 도착 순서대로 반환"""
+        return self._txs.items()
+
+    def sender_items(self, sender):
+        """
+        한 송신자의 (txid, tx) 쌍을 도착 순서대로 반환
+
+        Args:
+            sender: 송신자 주소
+
+        Returns:
+            list: [(txid, tx), ...]
+        """
+        queue = self._by_sender.get(sender)
+        if not queue:
+            return []
+        txids = [txid for same_nonce in queue.values() for txid in same_nonce]
+        txids.sort(key=lambda txid: self._entries[txid][0])
+        return [(txid, self._txs[txid]) for txid in txids]
+
+    def senders(self):
+        """멤풀에 거래가 있는 송신자 목록"""
+        return list(self._by_sender)
+
+    def ready_senders(self):
+        """다음 nonce 거래가 실행 가능한 송신자 목록"""
+        return list(self._ready)
+
+    def clear(self):
+        """멤풀 비우기"""
+        self._txs.clear()
+        self._entries.clear()
+        self._by_sender.clear()
+        self._ready.clear()
+        self._ready_heap.clear()
+        self._dirty.clear()
+
+    def __contains__(self, item):
+        """txid(문자열) 또는 트랜잭션(dict)으로 포함 여부 확인"""
+        txid = item if isinstance(item, str) else self._txid_func(item)
+        return txid in self._txs
+
+    def __iter__(self):
+        """트랜잭션을 도착 순서대로 순회"""
+        return iter(self._txs.values())
+
+    def __len__(self):
+        return len(self._txs)
+
+    def __repr__(self):
+        return f"Mempool(size={len(self._txs)}, ready={len(self._ready)})"
@@ -0,0 +1,89 @@
+"""
+머클 트리 모듈
+블록 트랜잭션의 머클 루트 계산과 포함 증명(Inclusion Proof) 생성/검증
+(홀수 개 노드는 고정 패딩 값과 짝지음 - 마지막 노드 복제 방식은 [a,b,c]와 [a,b,c,c]의 루트가 같아지는
+ 변조(CVE-2012-2459)를 허용하므로 사용하지 않음)
+"""
+
+import hashlib
+
+
+# 트랜잭션이 없는 블록의 머클 루트
+EMPTY_ROOT = bytes(32)
+
+# 홀수 개 레벨의 마지막 노드와 짝지을 값 (SHA-256 출력과 충돌하지 않는 값이므로
+# 리프 목록이 다르면 루트도 다름)
+PADDING = bytes(32)
+
+
+def _hash_pair(left, right):
+    return hashlib.sha256(left + right).digest()
+
+
+def _next_level(level):
+    if len(level) & 1:
+        level = level + [PADDING]
+    return [_hash_pair(level[i], level[i + 1]) for i in range(0, len(level), 2)]
+
+
+def merkle_root(leaves):
+    """
+    머클 루트 계산
+
+    Args:
+        leaves: 리프 해시 리스트 (bytes, 트랜잭션 순서)
+
+    Returns:
+        bytes: 머클 루트 (32바이트)
+    """
+    if not leaves:
+        return EMPTY_ROOT
+
+    level = list(leaves)
+    while len(level) > 1:
+        level = _next_level(level)
+    return level[0]
+
+
+def merkle_proof(leaves, position):
+    """
+    position 번째 리프의 포함 증명 생성
+
+    Args:
+        leaves: 리프 해시 리스트
+        position: 증명할 리프의 위치
+
+    Returns:
+        list: [(형제 해시, 형제가 오른쪽인지 여부), ...] (리프 -> 루트 순서)
+    """
+    if not 0 <= position < len(leaves):
+        raise IndexError(f"리프 위치 범위 초과: {position}")
+
+    proof = []
+    level = list(leaves)
+    while len(level) > 1:
+        if len(level) & 1:
+            level = level + [PADDING]
+        sibling = position ^ 1
+        proof.append((level[sibling], sibling > position))
+        level = _next_level(level)
+        position //= 2
+    return proof
+
+
+def verify_merkle_proof(leaf, proof, root):
+    """
+    포함 증명 검증
+
+    Args:
+        leaf: 리프 해시
+        proof: merkle_proof() 결과
+        root: 기대하는 머클 루트
+
+    Returns:
+        bool: 리프가 루트에 포함되는지 여부
+    """
+    current = leaf
+    for sibling, sibling_is_right in proof:
+        current = _hash_pair(current, sibling) if sibling_is_right else _hash_pair(sibling, current)
+    return current == root
@@ -0,0 +1,456 @@
+"""
+채굴 엔진 모듈
+nonce를 제외한 헤더 앞부분을 한 번만 해싱해 두고(Midstate) nonce마다 복사해서 이어 해싱하며,
+다이제스트를 정수 목표값(Target)과 비교 (헤더에는 목표값의 압축 표현 nBits를 기록)
+nonce 구간 분할 멀티프로세스 병렬 채굴 지원
+취소 토큰 + 슬라이스 단위 해시 예산으로 중단 가능한 채굴 작업(MiningJob) 지원
+"""
+
+import hashlib
+import math
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from . import encoding
+
+
+# 중단 여부 확인 주기 (해시 수)
+ABORT_CHECK_INTERVAL = 1024
+
+
+def difficulty_to_target(difficulty):
+    """
+    난이도를 정수 목표값으로 변환 (target = 2^(256 - 4 * difficulty))
+    정수 난이도는 기존 의미 그대로 16진수 해시가 0 difficulty개로 시작하는 조건이며,
+    소수 난이도는 그 사이를 연속적으로 보간함
+
+    Args:
+        difficulty: 난이도 (int 또는 float)
+
+    Returns:
+        int: 목표값
+    """
+    if float(difficulty).is_integer():
+        return 1 << (256 - 4 * int(difficulty))
+
+    exponent = 256 - 4 * difficulty
+    whole = math.floor(exponent)
+    # 소수부 2^frac를 52비트 고정소수점으로 계산 (압축 표현의 가수 정밀도보다 충분히 큼)
+    return (int(2 ** (exponent - whole) * (1 << 52)) << whole) >> 52
+
+
+def target_to_difficulty(target):
+    """
+    정수 목표값을 난이도로 변환 (difficulty_to_target의 역함수)
+
+    Args:
+        target: 목표값
+
+    Returns:
+        float: 난이도
+    """
+    return (256 - math.log2(target)) / 4
+
+
+def target_to_bits(target):
+    """
+    목표값을 압축 표현(nBits 방식)으로 변환
+    상위 1바이트는 목표값의 바이트 길이, 하위 3바이트는 상위 유효 바이트(가수)
+    (가수의 최상위 비트는 비트코인과 같이 부호 비트로 남겨 둠, 하위 비트는 버림)
+
+    Args:
+        target: 목표값 (양의 정수)
+
+    Returns:
+        int: 32비트 압축 표현
+    """
+    size = (target.bit_length() + 7) // 8
+    if size <= 3:
+        mantissa = target << (8 * (3 - size))
+    else:
+        mantissa = target >> (8 * (size - 3))
+    if mantissa & 0x800000:
+        mantissa >>= 8
+        size += 1
+    return (size << 24) | mantissa
+
+
+def bits_to_target(bits):
+    """
+    압축 표현(nBits)을 목표값으로 복원
+
+    Args:
+        bits: 32비트 압축 표현
+
+    Returns:
+        int: 목표값
+    """
+    size = bits >> 24
+    mantissa = bits & 0x7fffff
+    if size <= 3:
+        return mantissa >> (8 * (3 - size))
+    return mantissa << (8 * (size - 3))
+
+
+def difficulty_to_bits(difficulty):
+    """난이도 -> 압축 표현"""
+    return target_to_bits(difficulty_to_target(difficulty))
+
+
+def bits_to_difficulty(bits):
+    """
+    압축 표현 -> 난이도 (정수로 떨어지면 int)
+
+    Args:
+        bits: 32비트 압축 표현
+
+    Returns:
+        int 또는 float: 난이도
+    """
+    difficulty = target_to_difficulty(bits_to_target(bits))
+    return int(difficulty) if difficulty.is_integer() else difficulty
+
+
+def target_work(target):
+    """
+    목표값의 작업량 (해답 하나를 찾는 데 필요한 기대 해시 수 = 2^256 / target)
+    정수 난이도 d에서는 16^d
+
+    Args:
+        target: 목표값
+
+    Returns:
+        int: 작업량
+    """
+    return (1 << 256) // target
+
+
+def search_nonce_range(header_prefix, target, start_nonce, end_nonce=None, should_abort=None):
+    """
+    [start_nonce, end_nonce) 구간에서 목표값보다 작은 해시를 내는 가장 작은 nonce 탐색
+
+    Args:
+        header_prefix: nonce를 제외한 헤더 바이트 (encoding.encode_block_header_prefix)
+        target: 정수 목표값
+        start_nonce: 탐색 시작 nonce
+        end_nonce: 탐색 끝 nonce (미포함, None이면 끝없이)
+        should_abort: ABORT_CHECK_INTERVAL 해시마다 호출, True면 탐색 중단
+
+    Returns:
+        tuple: (nonce 또는 None, 시도한 해시 수)
+    """
+    midstate = hashlib.sha256(header_prefix)
+    encode_nonce = encoding.encode_nonce
+    from_bytes = int.from_bytes
+
+    nonce = start_nonce
+    next_check = start_nonce + ABORT_CHECK_INTERVAL
+    while end_nonce is None or nonce < end_nonce:
+        h = midstate.copy()
+        h.update(encode_nonce(nonce))
+        if from_bytes(h.digest(), 'big') < target:
+            return nonce, nonce - start_nonce + 1
+        nonce += 1
+
+        if should_abort is not None and nonce >= next_check:
+            if should_abort():
+                break
+            next_check = nonce + ABORT_CHECK_INTERVAL
+    return None, nonce - start_nonce
+
+
+def header_hash(header_prefix, nonce):
+    """헤더 앞부분 + nonce의 16진수 해시"""
+    return hashlib.sha256(header_prefix + encoding.encode_nonce(nonce)).hexdigest()
+
+
+def mine_header(header_prefix, target, start_nonce=0):
+    """
+    목표값보다 작은 해시가 나올 때까지 nonce 탐색 (단일 프로세스)
+
+    Args:
+        header_prefix: nonce를 제외한 헤더 바이트 (encoding.encode_block_header_prefix)
+        target: 정수 목표값
+        start_nonce: 탐색 시작 nonce
+
+    Returns:
+        tuple: (nonce, 16진수 해시, 시도한 해시 수)
+    """
+    nonce, hashes = search_nonce_range(header_prefix, target, start_nonce)
+    return nonce, header_hash(header_prefix, nonce), hashes
+
+
+# 병렬 채굴
+# nonce 공간을 chunk_size 크기의 구간으로 나눠 순서대로 워커에 분배.
+# 해답이 나온 가장 낮은 구간보다 아래 구간이 모두 끝나야 확정하므로
+# 결과는 단일 프로세스 탐색(가장 작은 nonce)과 항상 동일.
+
+# 워커 공유 값: 지금까지 해답이 나온 가장 낮은 구간 번호 (그보다 높은 구간은 탐색 중단)
+_NO_SOLUTION = (1 << 63) - 1
+_found_chunk = None
+
+_mining_executor = None
+_mining_executor_workers = None
+
+
+def _init_mining_worker(found_chunk):
+    global _found_chunk
+    _found_chunk = found_chunk
+
+
+def _search_chunk(header_prefix, target, chunk, chunk_size):
+    """워커 프로세스: chunk 번째 구간 탐색 (더 낮은 구간에서 해답이 나오면 중단)"""
+    start = chunk * chunk_size
+    return search_nonce_range(
+        header_prefix, target, start, start + chunk_size,
+        should_abort=lambda: _found_chunk.value < chunk
+    )
+
+
+def effective_mining_workers(cap):
+    """
+    실제 사용할 채굴 워커 수 (설정 상한과 CPU 수 중 작은 값)
+
+    Args:
+        cap: 설정된 워커 수 상한 (config.MINING_WORKERS)
+
+    Returns:
+        int: 워커 수 (1이면 단일 프로세스 채굴)
+    """
+    return max(1, min(cap, os.cpu_count() or 1))
+
+
+def get_mining_executor(workers):
+    """
+    채굴 워커 프로세스 풀 반환 (처음 필요할 때 생성, 워커 수가 바뀌면 다시 생성)
+
+    Args:
+        workers: 워커 수
+
+    Returns:
+        ProcessPoolExecutor: 프로세스 풀
+    """
+    global _mining_executor, _mining_executor_workers, _found_chunk
+
+    if _mining_executor is not None and _mining_executor_workers == workers:
+        return _mining_executor
+
+    shutdown_mining_executor()
+    _found_chunk = multiprocessing.Value('q', _NO_SOLUTION)
+    _mining_executor = ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_mining_worker, initargs=(_found_chunk,)
+    )
+    _mining_executor_workers = workers
+    return _mining_executor
+
+
+def shutdown_mining_executor():
+    """채굴 워커 프로세스 풀 종료"""
+    global _mining_executor, _mining_executor_workers
+
+    if _mining_executor is not None:
+        _mining_executor.shutdown(wait=True, cancel_futures=True)
+    _mining_executor = None
+    _mining_executor_workers = None
+
+
+def mine_header_parallel(header_prefix, target, workers, chunk_size):
+    """
+    nonce 구간 분할 병렬 채굴 (결과는 mine_header와 동일)
+
+    Args:
+        header_prefix: nonce를 제외한 헤더 바이트
+        target: 정수 목표값
+        workers: 워커 프로세스 수
+        chunk_size: 워커 한 번에 맡기는 nonce 구간 크기
+
+    Returns:
+        tuple: (nonce, 16진수 해시, 시도한 해시 수 - 중단된 구간의 시도 포함)
+    """
+    executor = get_mining_executor(workers)
+
+    pending = {}     # {future: chunk}
+    best = None      # (chunk, nonce) - 해답이 나온 가장 낮은 구간
+    hashes = 0
+    next_chunk = 0
+
+    try:
+        while True:
+            # 해답 전에는 워커당 2개씩 구간을 미리 채워 둠 (워커가 쉬지 않도록)
+            while best is None and len(pending) < 2 * workers:
+                future = executor.submit(_search_chunk, header_prefix, target, next_chunk, chunk_size)
+                pending[future] = next_chunk
+                next_chunk += 1
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                chunk = pending.pop(future)
+                nonce, tried = future.result()
+                hashes += tried
+                if nonce is not None and (best is None or chunk < best[0]):
+                    best = (chunk, nonce)
+                    with _found_chunk.get_lock():
+                        _found_chunk.value = chunk
+
+            # 해답 구간보다 낮은 구간이 모두 끝났으면 확정
+            if best is not None and all(chunk > best[0] for chunk in pending.values()):
+                break
+    finally:
+        # 남은 구간 취소 (실행 중인 높은 구간은 공유 값을 보고 곧 중단)
+        for future in pending:
+            future.cancel()
+        for future in pending:
+            if not future.cancelled():
+                hashes += future.result()[1]
+        _found_chunk.value = _NO_SOLUTION
+
+    nonce = best[1]
+    return nonce, header_hash(header_prefix, nonce), hashes
+
+
+class CancelToken:
+    """채굴 작업 취소 토큰 (다른 스레드에서 cancel()해도 탐색 중 ABORT_CHECK_INTERVAL 안에 반영)"""
+
+    __slots__ = ('cancelled', 'reason')
+
+    def __init__(self):
+        self.cancelled = False
+        self.reason = None
+
+    def cancel(self, reason=None):
+        """
+        작업 취소 요청
+
+        Args:
+            reason: 취소 사유 (로그/통계용)
+        """
+        self.reason = reason
+        self.cancelled = True
+
+
+class MiningJob:
+    """
+    중단 가능한 채굴 작업
+    step()마다 최대 budget개의 nonce만 시도하고 진행 위치를 기억하므로
+    호출자가 채굴과 메시지 처리를 번갈아 수행할 수 있음 (결과는 mine_header와 동일)
+    """
+
+    def __init__(self, block, token=None):
+        """
+        Args:
+            block: 채굴할 블록 템플릿 (해답을 찾으면 nonce/hash가 채워짐)
+            token: 취소 토큰 (없으면 새로 생성)
+        """
+        self.block = block
+        self.token = token if token is not None else CancelToken()
+        self.target = block.target
+        self.next_nonce = 0
+        self.hashes = 0
+        self.elapsed = 0.0
+        self.done = False
+
+        # 바이너리 형식이면 헤더 앞부분을 작업당 한 번만 인코딩 (JSON 호환 모드는 nonce마다 전체 해시)
+        self._prefix = None if encoding.is_json_compatible() else block.encode_header_prefix()
+
+    @property
+    def cancelled(self):
+        """취소 여부"""
+        return self.token.cancelled
+
+    def cancel(self, reason=None):
+        """작업 취소 (이미 시도한 해시는 버려짐)"""
+        self.token.cancel(reason)
+
+    def step(self, budget):
+        """
+        최대 budget개의 nonce 시도
+
+        Args:
+            budget: 이번 슬라이스의 해시 예산
+
+        Returns:
+            bool: 해답을 찾았는지 여부 (취소되었거나 예산을 다 쓰면 False)
+        """
+        if self.done or self.cancelled:
+            return self.done
+
+        start = time.perf_counter()
+        end = self.next_nonce + budget
+        if self._prefix is None:
+            nonce, tried = self._step_legacy(end)
+        else:
+            nonce, tried = search_nonce_range(
+                self._prefix, self.target, self.next_nonce, end,
+                should_abort=lambda: self.token.cancelled
+            )
+        return self.record(nonce, tried, time.perf_counter() - start)
+
+    @property
+    def header_prefix(self):
+        """nonce를 제외한 헤더 앞부분 (JSON 호환 모드면 None - 다른 프로세스에 구간 탐색을 맡길 수 없음)"""
+        return self._prefix
+
+    def record(self, nonce, tried, elapsed=0.0):
+        """
+        next_nonce부터 탐색한 결과 반영 (step() 또는 다른 프로세스의 search_nonce_range 결과)
+
+        Args:
+            nonce: 찾은 nonce (없으면 None)
+            tried: 시도한 해시 수
+            elapsed: 탐색 소요 시간 (초)
+
+        Returns:
+            bool: 해답을 찾았는지 여부
+        """
+        self.hashes += tried
+        self.next_nonce += tried
+        self.elapsed += elapsed
+
+        if nonce is not None:
+            self.block.nonce = nonce
+            if self._prefix is not None:
+                self.block.hash = header_hash(self._prefix, nonce)
+            self.done = True
+        return self.done
+
+    def _step_legacy(self, end):
+        block = self.block
+        for nonce in range(self.next_nonce, end):
+            block.nonce = nonce
+            block.hash = block.calculate_hash()
+            if int(block.hash, 16) < self.target:
+                return nonce, nonce - self.next_nonce + 1
+            if self.token.cancelled:
+                return None, nonce - self.next_nonce + 1
+        return None, end - self.next_nonce
+
+    def stats(self):
+        """지금까지의 MiningStats"""
+        return MiningStats(self.hashes, self.elapsed)
+
+    def __repr__(self):
+        state = "done" if self.done else "cancelled" if self.cancelled else "running"
+        return f"MiningJob(height={self.block.index}, next_nonce={self.next_nonce}, {state})"
+
+
+class MiningStats:
+    """채굴 1회의 통계 (시도한 해시 수, 소요 시간, 해시율)"""
+
+    def __init__(self, hashes, elapsed):
+        """
+        Args:
+            hashes: 시도한 해시 수
+            elapsed: 소요 시간 (초)
+        """
+        self.hashes = hashes
+        self.elapsed = elapsed
+
+    @property
+    def hash_rate(self):
+        """초당 해시 수 (H/s)"""
+        return self.hashes / self.elapsed if self.elapsed > 0 else float('inf')
+
+    def __repr__(self):
+        return f"MiningStats(hashes={self.hashes}, elapsed={self.elapsed:.4f}s, rate={self.hash_rate:.0f} H/s)"
+
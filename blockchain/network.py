@@ -1,24 +1,75 @@
 """
 네트워크 시뮬레이터 클래스
 여러 노드를 관리하고 블록 전파를 시뮬레이션
+(스텝 방식 run_simulation과 이산 사건 방식 run_event_simulation 제공)
 """
 
 import random
-import copy
 from .block import Block
 from .node import Node
-from . import config
+from .crypto import SignatureCache, set_reproducible, restore_reproducible
+from .events import EventScheduler, Link
+from .frozen import freeze
+from .topology import build_topology
+from . import config, encoding
 
 
 class NetworkSimulator:
     """블록체인 네트워크 시뮬레이터"""
 
-    def __init__(self):
-        """네트워크 시뮬레이터 초기화"""
+    def __init__(self, seed=None, sig_cache=None):
+        """
+        네트워크 시뮬레이터 초기화
+
+        Args:
+            seed: 재현 시드 (None이면 config.REPRODUCIBLE_SEED, 둘 다 None이면 무작위 실행)
+                  주어지면 이후 생성되는 지갑 키/서명/채굴 확률/채굴 간격이 시드로 결정되어 실행마다 동일
+                  (재현 모드는 프로세스 전역 설정이므로 시드가 없으면 해제, close()에서 이전 설정 복원)
+            sig_cache: 재사용할 서명 검증 캐시 (재현 실행 간 공유 가능, 없으면 새로 생성)
+        """
+        self.seed = config.REPRODUCIBLE_SEED if seed is None else seed
+        self._saved_reproducible = set_reproducible(self.seed)
+
+        # 시뮬레이션 난수 (채굴 시도 확률)
+        self.rng = random.Random(self.seed)
+
         self.nodes = []
         self.wallets = {}  # {address: Wallet} - 주소별 지갑 매핑
         self.genesis_block = self.create_genesis()
 
+        # 노드 공용 서명 검증 캐시 (같은 거래를 노드마다 다시 검증하지 않음)
+        self.sig_cache = sig_cache if sig_cache is not None else SignatureCache(config.SIG_CACHE_SIZE)
+
+        # 이산 사건 엔진: 이벤트 큐와 링크별 전송 모델 {(src_id, dst_id): Link}
+        self.scheduler = EventScheduler(config.SIM_TIME)
+        self.links = {}
+        self._mining_epoch = {}  # {node_id: 예약된 채굴 이벤트 세대} - 팁이 바뀌면 이전 예약 무효
+        # 이벤트 정렬 키 (노드 인덱스, 노드별 순번)와 노드별 채굴 간격 난수
+        # - 같은 시각 이벤트의 처리 순서와 난수가 다른 노드의 진행과 무관 (샤드 실행과 결과 일치)
+        self._node_index = {}
+        self._event_counts = {}
+        self._node_rngs = {}
+        self.event_stats = {'blocks_mined': 0, 'block_messages': 0, 'tx_messages': 0, 'bytes': 0,
+                            'inv_messages': 0, 'getdata_messages': 0, 'redundant_invs': 0}
+
+        # Gossip 전파: {node_id: [이웃 Node]} (None이면 송신자가 모든 노드에 직접 전송)
+        self.peers = None
+        self._seen = {}         # {node_id: 알리거나 받은 해시 집합} - 같은 항목은 한 번만 요청
+        self._objects = {}      # {해시: (종류, 고정된 블록/거래, 크기)} - getdata 응답용
+        self._propagation = {}  # {해시: {'kind', 'origin_time', 'arrivals'}} - 전파 지연 측정
+
+    def close(self):
+        """생성 시 바꾼 재현 모드 설정 복원 (이후 만드는 키는 이전 설정을 따름)"""
+        if self._saved_reproducible is not None:
+            restore_reproducible(self._saved_reproducible)
+            self._saved_reproducible = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
     def create_genesis(self):
         """
         제네시스 블록 생성
@@ -34,17 +85,18 @@ class NetworkSimulator:
             previous_hash="0",
             miner_id="GENESIS"
         )
-        genesis.total_work = genesis.block_work
         genesis.mine_block()
-        return genesis
+        return genesis.freeze()
 
     def add_node(self, node):
         """
-        네트워크에 노드 추가
+        네트워크에 노드 추가 (노드는 네트워크 공용 서명 캐시를 사용)
 
         Args:
             node: 추가할 노드
         """
+        node.sig_cache = self.sig_cache
+        self._node_index.setdefault(node.node_id, len(self._node_index))
         self.nodes.append(node)
 
     def register_wallet(self, wallet):
@@ -60,16 +112,17 @@ class NetworkSimulator:
     def broadcast_block(self, sender_node, new_block):
         """
         블록을 네트워크에 전파 (네트워크 지연 시뮬레이션 가능)
+        블록을 한 번 고정(freeze)한 뒤 모든 노드가 같은 객체를 공유 (노드 수와 무관한 복사 비용)
 
         Args:
             sender_node: 블록을 전송하는 노드
             new_block: 전파할 블록
         """
+        new_block.freeze()
         for node in self.nodes:
             if node.node_id != sender_node.node_id:
                 # 즉시 전달 (지연 시간 0 가정)
-                # deepcopy로 각 노드가 독립적인 블록 객체를 받도록 함
-                node.receive_block(copy.deepcopy(new_block))
+                node.receive_block(new_block)
 
     def run_simulation(self, steps=20):
         """
@@ -87,14 +140,14 @@ class NetworkSimulator:
             # 모든 노드가 채굴 시도
             for node in self.nodes:
                 # 확률적으로 채굴 시도 (노드 간 경쟁 시뮬레이션)
-                if random.random() < config.MINING_PROBABILITY:
+                if self.rng.random() < config.MINING_PROBABILITY:
                     mined_block = node.try_mine()
 
                     # 자기 자신에게 등록
                     node.receive_block(mined_block)
 
                     # 채굴 성공 로그
-                    print(f"[MINE]  [{node.node_id}] 블록 채굴 성공! (Work: {mined_block.total_work})")
+                    print(f"[MINE]  [{node.node_id}] 블록 채굴 성공! (Work: {node.get_chain_work(mined_block.hash)})")
 
                     # 네트워크 전파
                     self.broadcast_block(node, mined_block)
@@ -102,12 +155,423 @@ class NetworkSimulator:
             # 상태 출력
             self.print_network_status()
 
+    def run_sliced_simulation(self, steps=20, slice_hashes=None):
+        """
+        시분할 채굴 시뮬레이션 실행
+        매 스텝 각 노드가 슬라이스 예산만큼만 채굴하고, 찾은 블록은 즉시 전파하므로
+        다른 노드는 다음 슬라이스 전에 블록을 처리하고 낡은 채굴 작업을 중단함
+
+        Args:
+            steps: 시뮬레이션 스텝 수
+            slice_hashes: 노드당 스텝별 해시 예산 (None이면 config.MINING_SLICE_HASHES)
+        """
+        print(f"[START] 시분할 채굴 시뮬레이션 시작 (Genesis Hash: {self.genesis_block.hash[:6]})")
+
+        for step in range(steps):
+            config.SIM_TIME += 1  # 전역 시간 증가
+            print(f"\n--- Time: {config.SIM_TIME} ---")
+
+            for node in self.nodes:
+                mined_block = node.mine_step(slice_hashes)
+                if mined_block is None:
+                    continue
+
+                node.receive_block(mined_block)
+                print(f"[MINE]  [{node.node_id}] 블록 채굴 성공! (Work: {node.get_chain_work(mined_block.hash)})")
+                self.broadcast_block(node, mined_block)
+
+            self.print_network_status()
+
+        self.print_mining_stats()
+
+    # 이산 사건 시뮬레이션 (링크 지연/대역폭 모델)
+    def set_link(self, src, dst, latency=None, bandwidth=None, symmetric=True):
+        """
+        두 노드 사이 링크의 지연/대역폭 설정
+
+        Args:
+            src: 송신 노드 (Node 또는 node_id)
+            dst: 수신 노드 (Node 또는 node_id)
+            latency: 전파 지연 (초, None이면 config.LINK_LATENCY)
+            bandwidth: 대역폭 (바이트/초, None이면 config.LINK_BANDWIDTH)
+            symmetric: True면 반대 방향 링크도 같은 값으로 설정
+
+        Returns:
+            Link: src -> dst 링크
+        """
+        src_id = getattr(src, 'node_id', src)
+        dst_id = getattr(dst, 'node_id', dst)
+        latency = config.LINK_LATENCY if latency is None else latency
+        bandwidth = config.LINK_BANDWIDTH if bandwidth is None else bandwidth
+
+        link = self.links[(src_id, dst_id)] = Link(latency, bandwidth)
+        if symmetric:
+            self.links[(dst_id, src_id)] = Link(latency, bandwidth)
+        return link
+
+    def get_link(self, src, dst):
+        """
+        src -> dst 링크 조회 (설정되지 않았으면 기본값 링크 생성)
+
+        Returns:
+            Link: 링크
+        """
+        link = self.links.get((src.node_id, dst.node_id))
+        if link is None:
+            link = self.set_link(src, dst, symmetric=False)
+        return link
+
+    def _event_key(self, node):
+        """node가 예약하는 다음 이벤트의 정렬 키 (노드 인덱스, 노드별 순번)"""
+        count = self._event_counts.get(node.node_id, 0)
+        self._event_counts[node.node_id] = count + 1
+        return (self._node_index[node.node_id], count)
+
+    def _node_rng(self, node):
+        """노드별 채굴 간격 난수 (시드가 있으면 시드와 node_id로 결정)"""
+        rng = self._node_rngs.get(node.node_id)
+        if rng is None:
+            seed = f"{self.seed}:{node.node_id}" if self.seed is not None else self.rng.getrandbits(64)
+            rng = self._node_rngs[node.node_id] = random.Random(seed)
+        return rng
+
+    def _network_nodes(self):
+        """직접 전송(토폴로지 없음) 대상과 해시율 분배 기준이 되는 네트워크 전체 노드"""
+        return self.nodes
+
+    def _send(self, src, dst, size, action, *args):
+        """src -> dst 링크로 size 바이트 메시지를 보내고 도착 시각에 action(*args) 실행 예약"""
+        arrival = self.get_link(src, dst).transmit(self.scheduler.now, size)
+        self.event_stats['bytes'] += size
+        self._dispatch(dst, arrival, self._event_key(src), action, args)
+
+    def _dispatch(self, dst, arrival, key, action, args):
+        """dst에 도착할 메시지 이벤트 예약"""
+        self.scheduler.schedule(arrival, action, *args, key=key)
+
+    def send_block(self, src, dst, block, size=None):
+        """
+        블록 전송 예약 (링크 전송이 끝나고 지연 시간이 지난 시각에 수신 이벤트 발생)
+
+        Args:
+            src: 송신 노드
+            dst: 수신 노드
+            block: 전송할 블록
+            size: 블록 크기 (None이면 계산)
+        """
+        self.event_stats['block_messages'] += 1
+        size = block.serialized_size() if size is None else size
+        self._send(src, dst, size, self._deliver_block, dst, block, src)
+
+    def send_transaction(self, src, dst, tx, size=None):
+        """트랜잭션 전송 예약 (send_block과 같은 링크 모델)"""
+        self.event_stats['tx_messages'] += 1
+        size = len(encoding.encode_transaction(tx)) if size is None else size
+        self._send(src, dst, size, self._deliver_transaction, dst, tx, src)
+
+    def relay_block(self, sender_node, block):
+        """
+        새 블록 전파 시작 (고정된 블록 하나를 공유)
+        토폴로지가 없으면 모든 노드에 직접 전송, 있으면 이웃에게 해시만 알림 (inv)
+
+        Args:
+            sender_node: 블록을 채굴한 노드
+            block: 전파할 블록
+        """
+        block.freeze()
+        size = block.serialized_size()
+        self._register_item(sender_node, 'block', block.hash, block, size)
+
+        if self.peers is not None:
+            self._announce(sender_node, 'block', block.hash)
+            return
+        for node in self._network_nodes():
+            if node.node_id != sender_node.node_id:
+                self.send_block(sender_node, node, block, size)
+
+    def _deliver_block(self, node, block, sender=None):
+        self._record_arrival(node, 'block', block.hash)
+        waiting = self._waiting_orphans(node, block.hash)
+
+        previous_tip = node.chain_tip
+        node.receive_block(block)
+        if node.chain_tip != previous_tip and node.node_id in self._mining_epoch:
+            # 채굴 중인 노드는 팁이 바뀌면 새 팁 기준으로 채굴 이벤트 다시 예약
+            self.schedule_mining(node)
+
+        if self.peers is None:
+            return
+        # 연결된 블록만 이웃에게 알림 (이 블록 덕분에 연결된 고아 블록 포함, 무효 블록은 전파하지 않음)
+        for connected in [block] + waiting:
+            if connected.hash in node.block_index:
+                self._announce(node, 'block', connected.hash, exclude=sender if connected is block else None)
+
+    def _waiting_orphans(self, node, block_hash):
+        """block_hash를 (간접) 부모로 기다리는 고아 블록들"""
+        found = []
+        stack = [block_hash]
+        while stack:
+            for child in node.orphan_pool.get(stack.pop(), ()):
+                found.append(child)
+                stack.append(child.hash)
+        return found
+
+    def relay_transaction(self, origin, tx):
+        """
+        트랜잭션 전파 시작 (relay_block과 같은 방식)
+
+        Args:
+            origin: 트랜잭션을 처음 받은 노드
+            tx: 전파할 트랜잭션 (고정된 트랜잭션 하나를 모든 노드가 공유)
+        """
+        tx = freeze(tx)
+        txid = origin.compute_txid(tx)
+        size = len(encoding.encode_transaction(tx))
+        self._register_item(origin, 'tx', txid, tx, size)
+
+        if self.peers is not None:
+            self._announce(origin, 'tx', txid)
+            return
+        for node in self._network_nodes():
+            if node.node_id != origin.node_id:
+                self.send_transaction(origin, node, tx, size)
+
+    def _deliver_transaction(self, node, tx, sender=None):
+        txid = node.compute_txid(tx)
+        self._record_arrival(node, 'tx', txid)
+        if node.add_transaction(tx) and self.peers is not None:
+            self._announce(node, 'tx', txid, exclude=sender)
+
+    # Gossip 전파 (inv -> getdata -> 블록/거래)
+    def set_topology(self, kind="random_regular", degree=None, rewire_prob=None):
+        """
+        노드 간 피어 연결을 구성하고 gossip 전파 사용
+        (이후 블록/거래는 이웃에게 해시를 알리고, 갖고 있지 않은 이웃만 본문을 요청)
+
+        Args:
+            kind: "full_mesh" / "random_regular" / "small_world" / "scale_free" (None이면 직접 전송으로 복귀)
+            degree: 목표 평균 이웃 수 (None이면 config.PEER_DEGREE)
+            rewire_prob: small_world 재연결 확률 (None이면 config.SMALL_WORLD_REWIRE_PROB)
+
+        Returns:
+            dict: {node_id: [이웃 Node]} (kind가 None이면 None)
+        """
+        if kind is None:
+            self.peers = None
+            return None
+
+        degree = config.PEER_DEGREE if degree is None else degree
+        rewire_prob = config.SMALL_WORLD_REWIRE_PROB if rewire_prob is None else rewire_prob
+        adjacency = build_topology(kind, len(self.nodes), self.rng, degree, rewire_prob)
+
+        self.peers = {
+            node.node_id: [self.nodes[j] for j in sorted(neighbors)]
+            for node, neighbors in zip(self.nodes, adjacency)
+        }
+        edges = sum(len(neighbors) for neighbors in adjacency) // 2
+        print(f"[TOPOLOGY] {kind}: 노드 {len(self.nodes)}개, 연결 {edges}개 "
+              f"(평균 이웃 {2 * edges / max(1, len(self.nodes)):.1f})")
+        return self.peers
+
+    def _register_item(self, origin, kind, item_hash, item, size):
+        """새 블록/거래를 getdata 응답용으로 보관하고 전파 지연 측정 시작"""
+        self._objects[item_hash] = (kind, item, size)
+        propagation = self._propagation.setdefault(
+            item_hash, {'kind': kind, 'origin_time': None, 'arrivals': []}
+        )
+        if propagation['origin_time'] is None:
+            propagation['origin_time'] = self.scheduler.now
+        self._seen.setdefault(origin.node_id, set()).add(item_hash)
+
+    def _record_arrival(self, node, kind, item_hash):
+        # 도착 시각만 기록 (전파를 시작하지 않은 항목은 통계에서 제외)
+        self._seen.setdefault(node.node_id, set()).add(item_hash)
+        self._propagation.setdefault(
+            item_hash, {'kind': kind, 'origin_time': None, 'arrivals': []}
+        )['arrivals'].append(self.scheduler.now)
+
+    def _announce(self, node, kind, item_hash, exclude=None):
+        """이웃들에게 해시 알림 (inv)"""
+        for peer in self.peers[node.node_id]:
+            if exclude is not None and peer.node_id == exclude.node_id:
+                continue
+            self.event_stats['inv_messages'] += 1
+            self._send(node, peer, config.INV_MESSAGE_SIZE, self._on_inv, peer, node, item_hash)
+
+    def _on_inv(self, node, peer, item_hash):
+        seen = self._seen.setdefault(node.node_id, set())
+        if item_hash in seen:
+            # 이미 받았거나 요청 중인 항목 (중복 알림 = gossip 오버헤드)
+            self.event_stats['redundant_invs'] += 1
+            return
+        seen.add(item_hash)
+        self.event_stats['getdata_messages'] += 1
+        self._send(node, peer, config.INV_MESSAGE_SIZE, self._on_getdata, peer, node, item_hash)
+
+    def _on_getdata(self, node, requester, item_hash):
+        kind, item, size = self._objects[item_hash]
+        if kind == 'block':
+            self.send_block(node, requester, item, size)
+        else:
+            self.send_transaction(node, requester, item, size)
+
+    def get_propagation_stats(self, kind='block'):
+        """
+        전파 지연 / 메시지 오버헤드 통계
+
+        Args:
+            kind: 'block' 또는 'tx'
+
+        Returns:
+            dict: {'items', 'coverage', 'mean_delay', 'p50_delay', 'p90_delay', 'max_delay',
+                   'inv_messages', 'getdata_messages', 'data_messages', 'redundant_invs',
+                   'redundancy', 'bytes'}
+                  (coverage: 원본 노드를 제외한 노드 중 받은 비율의 평균,
+                   redundancy: 알림 중 이미 아는 항목이었던 비율, 메시지 수는 블록/거래 합계)
+        """
+        return summarize_propagation(self._propagation, len(self.nodes), self.event_stats, kind)
+
+    def print_propagation_stats(self, kind='block'):
+        """전파 지연 / 메시지 오버헤드 통계 출력"""
+        stats = self.get_propagation_stats(kind)
+        print(f"   [{kind}] items={stats['items']} | coverage={stats['coverage']:.1%} | "
+              f"delay mean={stats['mean_delay']:.3f}s p90={stats['p90_delay']:.3f}s max={stats['max_delay']:.3f}s")
+        print(f"   msgs: inv={stats['inv_messages']} getdata={stats['getdata_messages']} "
+              f"data={stats['data_messages']} | redundant inv={stats['redundant_invs']} "
+              f"({stats['redundancy']:.1%}) | bytes={stats['bytes']}")
+
+    def submit_transaction(self, sender_address, recipient_address, amount, origin=None):
+        """
+        서명된 트랜잭션을 한 노드에 제출하고 링크를 통해 전파 (이산 사건 방식)
+
+        Args:
+            sender_address: 송신자 주소
+            recipient_address: 수신자 주소
+            amount: 금액
+            origin: 트랜잭션을 받을 노드 (None이면 첫 번째 노드)
+
+        Returns:
+            dict: 제출한 트랜잭션 (송신자 지갑이 없으면 None)
+        """
+        sender_wallet = self.wallets.get(sender_address)
+        if not sender_wallet:
+            print(f"[ERROR] 오류: 송신자 지갑을 찾을 수 없습니다 ({sender_address[:16]}...)")
+            return None
+
+        origin = origin or self.nodes[0]
+
+        # 제출 노드가 아는 확정 nonce + 멤풀에 대기 중인 거래 수
+        next_nonce = origin.get_confirmed_nonce(sender_address) + 1
+        next_nonce += len(origin.mempool.sender_items(sender_address))
+
+        tx = freeze(sender_wallet.create_transaction(recipient_address, amount, next_nonce))
+        origin.add_transaction(tx)
+        self.relay_transaction(origin, tx)
+        return tx
+
+    def schedule_mining(self, node):
+        """
+        노드의 다음 블록 발견 시각 예약 (이전 예약은 무효화)
+        블록 발견 간격은 지수 분포: 노드 해시율 / 블록 작업량을 발생률로 사용
+
+        Args:
+            node: 채굴 노드
+        """
+        epoch = self._mining_epoch.get(node.node_id, 0) + 1
+        self._mining_epoch[node.node_id] = epoch
+
+        hash_rate = config.NETWORK_HASH_RATE / len(self._network_nodes())
+        delay = self._node_rng(node).expovariate(hash_rate / node.get_tip_block().block_work)
+        self.scheduler.schedule_after(delay, self._mine_event, node, epoch, key=self._event_key(node))
+
+    def _mine_event(self, node, epoch):
+        if self._mining_epoch.get(node.node_id) != epoch:
+            return  # 팁이 바뀌어 다시 예약된 낡은 이벤트
+
+        now = self.scheduler.now
+        tip = node.get_tip_block()
+        if tip.timestamp >= now:
+            # 블록 시간은 부모보다 커야 하므로 다음 기회로 미룸
+            self.schedule_mining(node)
+            return
+
+        # 블록 시간은 규칙상 부모 + MAX_TIME_JUMP를 넘을 수 없음
+        mined_block = node.try_mine(min(now, tip.timestamp + config.MAX_TIME_JUMP))
+        node.receive_block(mined_block)
+        self.event_stats['blocks_mined'] += 1
+        print(f"[MINE]  [{node.node_id}] 블록 채굴 성공! (t={now:.3f}, Work: {node.get_chain_work(mined_block.hash)})")
+
+        self.relay_block(node, mined_block)
+        self.schedule_mining(node)
+
+    def run_event_simulation(self, duration=20, max_events=None):
+        """
+        이산 사건 시뮬레이션 실행
+        다음 이벤트(블록 발견, 블록/거래 도착) 시각으로 바로 이동하므로
+        비용은 노드 수 × 시간 틱이 아니라 처리한 이벤트 수에 비례
+
+        Args:
+            duration: 진행할 시뮬레이션 시간 (초)
+            max_events: 최대 처리 이벤트 수 (None이면 제한 없음)
+
+        Returns:
+            int: 처리한 이벤트 수
+        """
+        scheduler = self.scheduler
+        if scheduler.now < config.SIM_TIME:
+            scheduler.now = config.SIM_TIME  # 스텝 방식으로 진행한 시간 반영
+
+        print(f"[START] 이산 사건 시뮬레이션 시작 (Genesis Hash: {self.genesis_block.hash[:6]}, "
+              f"t={scheduler.now:g} -> {scheduler.now + duration:g})")
+
+        # 아직 채굴 이벤트가 없는 노드만 예약 (이어서 실행해도 중복 예약하지 않음)
+        for node in self.nodes:
+            if node.node_id not in self._mining_epoch:
+                self.schedule_mining(node)
+
+        processed = scheduler.run(until=scheduler.now + duration, max_events=max_events)
+
+        stats = self.event_stats
+        print(f"\n--- Time: {scheduler.now:g} ({processed} events) ---")
+        print(f"   Blocks={stats['blocks_mined']} | Block msgs={stats['block_messages']} | "
+              f"Tx msgs={stats['tx_messages']} | Inv msgs={stats['inv_messages']} | Bytes={stats['bytes']}")
+        self.print_network_status()
+        return processed
+
+    def print_mining_stats(self):
+        """노드별 채굴 통계 출력 (낡은 템플릿에 낭비된 해시 포함)"""
+        for node in self.nodes:
+            stats = node.get_mining_stats()
+            print(f"   Node[{node.node_id}]: Blocks={stats['blocks']} | Hashes={stats['hashes']} | "
+                  f"Aborted={stats['aborted_jobs']} | Wasted={stats['wasted_hashes']} ({stats['wasted_ratio']:.1%})")
+
+    def get_node_summaries(self):
+        """
+        노드별 체인 상태 요약 (실행 결과 비교용)
+
+        Returns:
+            dict: {node_id: {'tip', 'height', 'chain_work', 'blocks', 'orphans', 'mempool', 'balance'}}
+        """
+        summaries = {}
+        for node in self.nodes:
+            tip = node.get_tip_block()
+            summaries[node.node_id] = {
+                'tip': tip.hash,
+                'height': tip.index,
+                'chain_work': node.get_chain_work(),
+                'blocks': len(node.block_index),
+                'orphans': sum(len(children) for children in node.orphan_pool.values()),
+                'mempool': len(node.mempool),
+                'balance': node.state.get(node.node_id, {'balance': 0})['balance'],
+            }
+        return summaries
+
     def print_network_status(self):
         """현재 네트워크 상태 출력"""
         for node in self.nodes:
             tip = node.get_tip_block()
             balance = node.state.get(node.node_id, {'balance': 0, 'nonce': 0})
-            print(f"   Node[{node.node_id}]: Tip={tip.hash[:6]}(H:{tip.index}, Work:{tip.total_work}) | Bal={balance}")
+            print(f"   Node[{node.node_id}]: Tip={tip.hash[:6]}(H:{tip.index}, Work:{node.get_chain_work()}) | Bal={balance}")
 
     def add_transaction_to_network(self, sender_address, recipient_address, amount):
         """
@@ -132,15 +596,58 @@ class NetworkSimulator:
         else:
             next_nonce = 1
 
-        # 지갑을 사용하여 서명된 트랜잭션 생성
-        tx = sender_wallet.create_transaction(recipient_address, amount, next_nonce)
+        # 지갑을 사용하여 서명된 트랜잭션 생성 (고정하여 모든 노드가 같은 객체 공유)
+        tx = freeze(sender_wallet.create_transaction(recipient_address, amount, next_nonce))
 
         # 모든 노드에 추가
         for node in self.nodes:
-            node.add_transaction(copy.deepcopy(tx))
+            node.add_transaction(tx)
 
         sender_name = sender_wallet.owner_name
         recipient_wallet = self.wallets.get(recipient_address)
         recipient_name = recipient_wallet.owner_name if recipient_wallet else recipient_address[:8]
 
         print(f"[BROADCAST] 트랜잭션 브로드캐스트: {sender_name} -> {recipient_name}: {amount} (nonce: {next_nonce})")
+
+
+def summarize_propagation(propagation, node_count, event_stats, kind='block'):
+    """
+    전파 기록으로 지연 / 메시지 오버헤드 통계 계산 (NetworkSimulator.get_propagation_stats 참고)
+
+    Args:
+        propagation: {해시: {'kind', 'origin_time', 'arrivals'}}
+        node_count: 네트워크 전체 노드 수
+        event_stats: 메시지 카운터 (NetworkSimulator.event_stats 형식)
+        kind: 'block' 또는 'tx'
+
+    Returns:
+        dict: get_propagation_stats()와 같은 형식
+    """
+    others = max(1, node_count - 1)
+    delays = []
+    coverage = []
+    for record in propagation.values():
+        if record['kind'] == kind and record['origin_time'] is not None:
+            delays.extend(arrival - record['origin_time'] for arrival in record['arrivals'])
+            coverage.append(len(record['arrivals']) / others)
+    delays.sort()
+
+    def percentile(q):
+        return delays[min(len(delays) - 1, int(q * len(delays)))] if delays else 0.0
+
+    return {
+        'items': len(coverage),
+        'coverage': sum(coverage) / len(coverage) if coverage else 0.0,
+        'mean_delay': sum(delays) / len(delays) if delays else 0.0,
+        'p50_delay': percentile(0.5),
+        'p90_delay': percentile(0.9),
+        'max_delay': delays[-1] if delays else 0.0,
+        'inv_messages': event_stats['inv_messages'],
+        'getdata_messages': event_stats['getdata_messages'],
+        'data_messages': event_stats['block_messages'] + event_stats['tx_messages'],
+        'redundant_invs': event_stats['redundant_invs'],
+        'redundancy': (event_stats['redundant_invs'] / event_stats['inv_messages']
+                       if event_stats['inv_messages'] else 0.0),
+        'bytes': event_stats['bytes'],
+    }
+
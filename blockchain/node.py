@@ -4,28 +4,44 @@
 """
 
 import hashlib
-import json
 import copy
+from concurrent.futures import as_completed
 from .block import Block
-from . import config
-from .crypto import CryptoUtils
+from . import config, encoding
+from .crypto import CryptoUtils, SignatureCache, get_verify_executor
+from .state import StateSnapshot, StateCache
+from .chain import get_skip_height, BlockRange
+from .mempool import Mempool
+from .mining import (
+    MiningJob, difficulty_to_target, target_to_bits, difficulty_to_bits, bits_to_difficulty
+)
 
 
 class Node:
     """블록체인 네트워크의 개별 노드를 나타내는 클래스"""
 
-    def __init__(self, node_id, genesis_block):
+    def __init__(self, node_id, genesis_block, sig_cache=None):
         """
         Args:
             node_id: 노드 식별자
             genesis_block: 제네시스 블록
+            sig_cache: 공유할 서명 검증 캐시 (없으면 노드 전용 캐시 생성)
         """
         self.node_id = node_id
 
+        # 서명 검증 결과 캐시 (블록 검증/멤풀 정리/블록 템플릿 선택이 함께 사용)
+        if sig_cache is None:
+            sig_cache = SignatureCache(config.SIG_CACHE_SIZE)
+        self.sig_cache = sig_cache
+
         # Block Tree: 모든 블록 저장 (고아 블록 포함)
         # key: block_hash, value: Block 객체
         self.block_index = {genesis_block.hash: genesis_block}
 
+        # 누적 작업량(Total Work): 블록은 노드 간에 공유되므로 노드별로 보관
+        # key: block_hash, value: 제네시스부터 그 블록까지의 작업량 합
+        self.chain_work = {genesis_block.hash: genesis_block.block_work}
+
         # 고아 블록 대기실 (Orphan Pool)
         # key: parent_hash (기다리는 부모의 해시)
         # value: [block1, block2...] (그 부모를 기다리는 자식 블록들)
@@ -34,26 +50,179 @@ class Node:
         # 현재 내가 생각하는 '메인 체인'의 끝 (Tip)
         self.chain_tip = genesis_block.hash
 
-        # Mempool
-        self.mempool = []
+        # 메인 체인 높이 인덱스: main_chain[height] = block_hash (O(1) 조상 조회)
+        self.main_chain = [genesis_block.hash]
+
+        # Skip 포인터: 곁가지 블록의 조상 탐색을 O(log n)으로 단축
+        # key: block_hash, value: get_skip_height(높이)의 조상 해시
+        self.skip_pointers = {}
+
+        # 확정 거래 인덱스: 메인 체인 거래의 위치 (연결/분리 시 증분 갱신)
+        # key: txid, value: (block_hash, height, position)
+        # (코인베이스는 txid가 블록마다 같을 수 있어 제외)
+        self.tx_index = {}
+
+        # Mempool (txid 인덱스, 도착 순서 유지, 송신자별 nonce 큐)
+        self.mempool = Mempool(self.compute_txid, self.get_confirmed_nonce)
 
-        # 상태 (UTXO/Balances) - 필요할 때 Replay로 계산
+        # 상태 (UTXO/Balances) - 팁 이동 시 새 블록만 증분 적용
         self.state = {}
+
+        # Undo Log: 메인 체인 블록별 되돌리기 기록 (Reorg 시 공통 조상까지만 롤백)
+        # key: block_hash, value: {address: 블록 적용 전 계정 (없던 계정이면 None)}
+        self.undo_logs = {}
+
+        # 블록별 상태 스냅샷 캐시 (검증 시 부모 상태를 Replay 없이 조회)
+        self.state_cache = StateCache(config.STATE_CACHE_SIZE)
+
+        # 상태 체크포인트: 메인 체인의 STATE_CHECKPOINT_INTERVAL 블록마다 평탄화된 스냅샷 보관
+        # (캐시 미스 시 Replay는 가장 가까운 체크포인트부터 시작, 블록이 메인 체인에서 빠지면 삭제)
+        # key: block_hash, value: StateSnapshot
+        self.state_checkpoints = {}
+
+        # 진행 중인 시분할 채굴 작업 (팁이 바뀌면 취소)
+        self.mining_job = None
+
+        # 채굴 통계: 낡은 템플릿에 쓰인 해시(wasted_hashes) 포함
+        self.mining_stats = {'blocks': 0, 'hashes': 0, 'aborted_jobs': 0, 'wasted_hashes': 0}
+
         self.rebuild_state(genesis_block.hash)
+        self.index_block_transactions(genesis_block)
+        genesis_state = StateSnapshot(dict(self.state))
+        self.state_cache.put(genesis_block.hash, genesis_state)
+        self.state_checkpoints[genesis_block.hash] = genesis_state
 
     def get_tip_block(self):
         """현재 체인의 팁 블록 반환"""
         return self.block_index[self.chain_tip]
 
+    def get_chain_work(self, block_hash=None):
+        """
+        블록까지의 누적 작업량 조회
+
+        Args:
+            block_hash: 블록 해시 (None이면 현재 팁)
+
+        Returns:
+            int: 누적 작업량 (연결되지 않은 블록이면 None)
+        """
+        return self.chain_work.get(self.chain_tip if block_hash is None else block_hash)
+
+    def get_confirmed_nonce(self, address):
+        """
+        메인 체인 팁 기준 계정의 확정 nonce
+
+        Args:
+            address: 계정 주소
+
+        Returns:
+            int: 확정 nonce (계정이 없으면 0)
+        """
+        account = self.state.get(address)
+        return account['nonce'] if account else 0
+
     def add_transaction(self, tx):
-        """멤풀에 트랜잭션 추가"""
-        self.mempool.append(tx)
+        """
+        멤풀에 트랜잭션 추가 (같은 txid가 이미 있으면 거부)
+
+        Args:
+            tx: 추가할 트랜잭션
+
+        Returns:
+            bool: 추가 여부
+        """
+        txid = self.compute_txid(tx)
+        if txid in self.tx_index:
+            print(f"[SKIP] [{self.node_id}] 이미 확정된 거래 무시: {txid[:8]}")
+            return False
+
+        if not self.mempool.add(tx):
+            print(f"[SKIP] [{self.node_id}] 중복 거래 무시: {txid[:8]}")
+            return False
+        return True
+
+    def get_transaction_location(self, txid):
+        """
+        메인 체인에 확정된 거래의 위치 조회 (O(1))
+
+        Args:
+            txid: 트랜잭션 ID
+
+        Returns:
+            tuple: (block_hash, height, position) 또는 None (미확정)
+        """
+        return self.tx_index.get(txid)
+
+    def get_confirmed_transaction(self, txid):
+        """
+        메인 체인에 확정된 거래 조회 (O(1))
+
+        Args:
+            txid: 트랜잭션 ID
+
+        Returns:
+            dict: 트랜잭션 또는 None (미확정)
+        """
+        location = self.tx_index.get(txid)
+        if location is None:
+            return None
+        block_hash, _, position = location
+        return self.block_index[block_hash].transactions[position]
+
+    def get_transaction_proof(self, txid):
+        """
+        확정 거래의 머클 포함 증명 (블록 전체 없이 헤더의 머클 루트만으로 검증 가능)
+
+        Args:
+            txid: 트랜잭션 ID
+
+        Returns:
+            tuple: (block_hash, merkle_root, proof) 또는 None (미확정)
+        """
+        location = self.tx_index.get(txid)
+        if location is None:
+            return None
+        block_hash, _, position = location
+        block = self.block_index[block_hash]
+        return block_hash, block.compute_merkle_root(), block.get_merkle_proof(position)
+
+    def is_confirmed(self, txid):
+        """거래가 메인 체인에 포함되어 있는지 확인 (O(1))"""
+        return txid in self.tx_index
+
+    def index_block_transactions(self, block):
+        """
+        메인 체인에 연결된 블록의 거래를 확정 거래 인덱스에 추가
 
-    # 상태 처리: Replay (Undo Log 대신 다시 계산)
+        Args:
+            block: 연결된 블록
+        """
+        for position, tx in enumerate(block.transactions):
+            if tx['body']['sender'] == "SYSTEM":
+                continue
+            self.tx_index[self.compute_txid(tx)] = (block.hash, block.index, position)
+
+    def unindex_block_transactions(self, block):
+        """
+        메인 체인에서 분리된 블록의 거래를 확정 거래 인덱스에서 제거
+
+        Args:
+            block: 분리된 블록
+        """
+        for tx in block.transactions:
+            if tx['body']['sender'] == "SYSTEM":
+                continue
+            txid = self.compute_txid(tx)
+            location = self.tx_index.get(txid)
+            if location is not None and location[0] == block.hash:
+                del self.tx_index[txid]
+
+    # 상태 처리: 증분 적용 + Undo Log (전체 Replay는 초기화/안전장치 용도)
     def rebuild_state(self, tip_hash):
         """
-        제네시스부터 tip_hash까지 거슬러 올라가며 경로를 찾고,
-        다시 내려오면서 잔액을 계산함.
+        tip_hash에서 가장 가까운 기준점(캐시 스냅샷/체크포인트, 없으면 Genesis)까지
+        거슬러 올라가 경로를 찾고, 다시 내려오면서 잔액을 계산함.
+        (재생한 블록의 Undo Log도 함께 기록)
 
         Args:
             tip_hash: 목표 팁 블록의 해시
@@ -61,28 +230,172 @@ class Node:
         Returns:
             bool: 성공 여부
         """
-        # 1. 경로 찾기 (Tip -> Genesis)
+        # 1. 경로 찾기 (Tip -> 기준점)
+        base, path = self.find_replay_base(tip_hash)
+
+        # [확인] 경로 불완전 감지
+        if base is None:
+            print("[ERROR] 경로 불완전 - 상태 재구성 중단")
+            return False
+
+        # 2. 순방향 재생 (기준점 -> Tip)
+        # Undo Log는 블록 해시에 대해 결정적이므로 기존 기록도 그대로 유효
+        new_state = base.to_dict()
+        for block in reversed(path):
+            self.undo_logs[block.hash] = self.apply_block_with_undo(block, new_state)
+            self.save_checkpoint(block, new_state)
+
+        self.state = new_state
+        self.mempool.refresh_all()
+        return True
+
+    def find_replay_base(self, tip_hash):
+        """
+        tip_hash에서 거슬러 올라가며 상태 재생의 기준점을 찾음
+        (캐시된 스냅샷 또는 체크포인트, 둘 다 없으면 Genesis 이전의 빈 상태)
+        체크포인트 덕분에 경로 길이는 최대 STATE_CHECKPOINT_INTERVAL 블록
+
+        Args:
+            tip_hash: 목표 블록 해시
+
+        Returns:
+            tuple: (기준 스냅샷, 재생할 블록 경로 [Tip -> 기준점 직후])
+                   경로가 끊겨 기준점에 닿지 못하면 (None, None)
+        """
         path = []
         curr = self.block_index.get(tip_hash)
+
         while curr:
+            base = self.state_cache.peek(curr.hash)
+            if base is None:
+                base = self.state_checkpoints.get(curr.hash)
+            if base is not None:
+                return base, path
+
             path.append(curr)
             if curr.previous_hash == "0":  # Genesis 도달
-                break
+                return StateSnapshot(), path
             curr = self.block_index.get(curr.previous_hash)
 
-        # [확인] 경로 불완전 감지
-        if not path or path[-1].previous_hash != "0":
-            print("[ERROR] 경로 불완전 - 상태 재구성 중단")
+        return None, None
+
+    def save_checkpoint(self, block, state):
+        """
+        체크포인트 높이의 메인 체인 블록이면 평탄화된 상태 스냅샷을 보관
+        (곁가지 블록은 저장하지 않음 - 재생 기준점은 메인 체인 조상이면 충분)
+
+        Args:
+            block: 메인 체인에 연결된 블록
+            state: 블록 시점의 상태 딕셔너리
+        """
+        if block.index % config.STATE_CHECKPOINT_INTERVAL == 0:
+            # 계정은 교체만 되므로(Copy-on-Write) 얕은 복사로 충분
+            self.state_checkpoints[block.hash] = StateSnapshot(dict(state))
+
+    def apply_block_with_undo(self, block, state):
+        """
+        블록을 상태에 적용하고, 되돌리기 위한 Undo 레코드를 반환
+
+        Args:
+            block: 적용할 블록
+            state: 상태 딕셔너리
+
+        Returns:
+            dict: {address: 적용 전 계정 복사본 (없던 계정이면 None)}
+        """
+        undo = {}
+        for tx in block.transactions:
+            body = tx['body']
+            for address in (body['sender'], body['recipient']):
+                if address not in undo:
+                    # 계정은 교체만 되므로(Copy-on-Write) 참조만 보관해도 안전
+                    undo[address] = state.get(address)
+
+        self.apply_block_to_state(block, state)
+        return undo
+
+    def connect_block(self, block):
+        """
+        현재 팁 위에 블록 하나를 연결 (새 블록의 트랜잭션만 상태에 적용)
+
+        Args:
+            block: 현재 팁을 부모로 하는 블록
+        """
+        undo = self.apply_block_with_undo(block, self.state)
+        self.undo_logs[block.hash] = undo
+        self.chain_tip = block.hash
+        self.main_chain.append(block.hash)
+        self.index_block_transactions(block)
+        self.save_checkpoint(block, self.state)
+
+        # 계정이 바뀐 송신자만 멤풀 Ready 여부 갱신
+        self.mempool.refresh_senders(undo)
+
+    def disconnect_block(self, block):
+        """
+        현재 팁 블록 하나를 분리 (Undo Log로 블록 적용 전 상태 복원)
+
+        Args:
+            block: 현재 팁 블록
+
+        Returns:
+            bool: 성공 여부 (Undo Log가 없으면 False)
+        """
+        undo = self.undo_logs.pop(block.hash, None)
+        if undo is None:
+            print(f"[ERROR] [{self.node_id}] Undo Log 없음 - 블록 분리 불가: {block.hash[:6]}")
             return False
 
-        # 2. 순방향 재생 (Genesis -> Tip)
-        new_state = {}
-        for block in reversed(path):
-            self.apply_block_to_state(block, new_state)
+        for address, acc in undo.items():
+            if acc is None:
+                self.state.pop(address, None)
+            else:
+                self.state[address] = acc
 
-        self.state = new_state
+        self.chain_tip = block.previous_hash
+        self.main_chain.pop()
+        self.unindex_block_transactions(block)
+        self.state_checkpoints.pop(block.hash, None)
+
+        self.mempool.refresh_senders(undo)
         return True
 
+    def is_on_main_chain(self, block):
+        """
+        블록이 현재 메인 체인 위에 있는지 확인 (O(1))
+
+        Args:
+            block: 확인할 블록
+
+        Returns:
+            bool: 메인 체인 포함 여부
+        """
+        return block.index < len(self.main_chain) and self.main_chain[block.index] == block.hash
+
+    def reset_main_chain(self, tip_hash):
+        """
+        메인 체인 높이 인덱스와 확정 거래 인덱스를 tip_hash 기준으로 다시 맞춤
+        (공통 구간은 유지)
+
+        Args:
+            tip_hash: 새 팁 블록의 해시
+        """
+        branch = []
+        curr = self.block_index.get(tip_hash)
+        while curr and not self.is_on_main_chain(curr):
+            branch.append(curr.hash)
+            curr = self.block_index.get(curr.previous_hash)
+
+        fork_height = curr.index if curr else -1
+        for block_hash in self.main_chain[fork_height + 1:]:
+            self.unindex_block_transactions(self.block_index[block_hash])
+            self.state_checkpoints.pop(block_hash, None)
+        del self.main_chain[fork_height + 1:]
+
+        for block_hash in reversed(branch):
+            self.main_chain.append(block_hash)
+            self.index_block_transactions(self.block_index[block_hash])
+
     def apply_block_to_state(self, block, state):
         """
         블록 내 트랜잭션을 상태에 적용하는 헬퍼 함수
@@ -98,33 +411,47 @@ class Node:
             amount = body['amount']
             nonce = body.get('nonce', 0)
 
-            # Sender 초기화
-            if sender not in state:
-                state[sender] = {'balance': 0, 'nonce': 0}
-            # Recipient 초기화
-            if recipient not in state:
-                state[recipient] = {'balance': 0, 'nonce': 0}
+            # 계정은 제자리 수정 대신 복사본으로 교체 (스냅샷 간 공유 - Copy-on-Write)
+            sender_acc = dict(state.get(sender) or {'balance': 0, 'nonce': 0})
 
-            if sender == "SYSTEM":
-                # SYSTEM은 nonce 체크 면제 (또는 별도 처리)
-                state[recipient]['balance'] += amount
-            else:
+            if sender != "SYSTEM":
                 # 상태 업데이트: 잔액 차감 + Nonce 증가
-                state[sender]['balance'] -= amount
-                state[sender]['nonce'] = nonce  # 현재 트랜잭션의 nonce로 업데이트
-                state[recipient]['balance'] += amount
+                sender_acc['balance'] -= amount
+                sender_acc['nonce'] = nonce  # 현재 트랜잭션의 nonce로 업데이트
+            # SYSTEM은 nonce 체크 면제 (계정만 초기화)
+            state[sender] = sender_acc
+
+            recipient_acc = dict(state.get(recipient) or {'balance': 0, 'nonce': 0})
+            recipient_acc['balance'] += amount
+            state[recipient] = recipient_acc
 
     # 체인 선택 (Most-work) & Reorg
     def receive_block(self, new_block):
         """
         새로운 블록을 수신하고 처리
+        이 블록 덕분에 연결되는 고아 블록도 이어서 처리 (재귀 대신 작업 스택 - 긴 고아 사슬도 안전)
 
         Args:
             new_block: 수신한 블록
         """
+        pending = [new_block]
+        while pending:
+            # 재귀 호출과 같은 순서(깊이 우선, 도착 순서)로 처리
+            pending.extend(reversed(self.process_block(pending.pop())))
+
+    def process_block(self, new_block):
+        """
+        블록 하나만 처리 (고아 해제된 자식 블록은 처리하지 않고 반환)
+
+        Args:
+            new_block: 수신한 블록
+
+        Returns:
+            list: 이 블록을 부모로 기다리던 고아 블록들 (호출자가 이어서 처리)
+        """
         # 1. 이미 아는 블록이면 무시
         if new_block.hash in self.block_index:
-            return
+            return []
 
         # 2. 부모 블록 확인 (부모를 모르면 고아 블록 처리)
         parent = self.block_index.get(new_block.previous_hash)
@@ -136,24 +463,30 @@ class Node:
             if new_block.previous_hash not in self.orphan_pool:
                 self.orphan_pool[new_block.previous_hash] = []
             self.orphan_pool[new_block.previous_hash].append(new_block)
-            return
+            return []
 
         # 3. 통합 유효성 검증 호출
         if not self.validate_block(new_block, parent):
             print(f"[REMOVE] [{self.node_id}] 유효하지 않은 블록 폐기: {new_block.hash[:6]}")
-            return
+            return []
 
         # 4. 누적 작업량(Total Work) 계산
         # 내 작업량 = 부모 작업량 + 내 블록 난이도 가중치
-        new_block.total_work = parent.total_work + new_block.block_work
+        new_work = self.chain_work[parent.hash] + new_block.block_work
 
         # 블록 저장소에 추가
         self.block_index[new_block.hash] = new_block
+        self.chain_work[new_block.hash] = new_work
+
+        # Skip 포인터 설정 (부모 쪽 조상 탐색은 이미 O(log n))
+        skip_block = self.get_ancestor(parent, get_skip_height(new_block.index))
+        if skip_block is not None:
+            self.skip_pointers[new_block.hash] = skip_block.hash
 
         # Chain Selection (가장 무거운 체인 선택)
         current_tip = self.get_tip_block()
 
-        if new_block.total_work > current_tip.total_work:
+        if new_work > self.chain_work[current_tip.hash]:
             # 1. 단순 연장인지, Reorg인지 판단
             # "새 블록의 부모가 내 현재 팁인가?"
             if new_block.previous_hash == current_tip.hash:
@@ -162,32 +495,38 @@ class Node:
 
                 # 새 블록의 트랜잭션만 멤풀에서 빼주면 됨
                 for tx in new_block.transactions:
-                    if tx in self.mempool:
-                        self.mempool.remove(tx)
+                    self.mempool.remove(tx)
+
+                # 2. Tip 업데이트: 새 블록만 상태에 증분 적용 (체인 길이와 무관)
+                self.connect_block(new_block)
 
             else:
                 # [Case B] Reorg 발생 (부모가 다름 = 갈라진 가지)
-                self.handle_reorg(current_tip, new_block)
+                # 공통 조상까지만 롤백한 뒤 새 가지를 재생
+                if not self.handle_reorg(current_tip, new_block):
+                    # 안전장치: 증분 전환 실패 시 기준점부터 다시 계산
+                    self.chain_tip = new_block.hash
+                    self.reset_main_chain(new_block.hash)
+                    self.rebuild_state(new_block.hash)
 
-            # 2. Tip 업데이트 및 상태 재계산
-            # (Reorg 여부와 상관없이 상태는 항상 Tip 기준으로 다시 그림)
-            self.chain_tip = new_block.hash
-            self.rebuild_state(new_block.hash)
+            # Mempool 정리: 전환된 블록이 건드린 계정과 새 거래의 송신자만 재검증
+            # (연장이면 새 블록, Reorg면 버려진/채택된 구간에 비례)
+            self.update_mempool()
 
-            # Mempool 정리 (새 체인에 포함된 거래는 멤풀에서 제거)
-            self.clean_mempool()
+            # 이전 팁 위에서 진행 중이던 채굴은 더 이상 의미 없으므로 중단
+            self.abort_stale_mining()
 
         # ---------------------------------------------------------
-        # 6. [추가된 부분] 고아 블록 구출 (Recursive Processing)
+        # 6. [추가된 부분] 고아 블록 구출
         # 중요: 이 로직은 위 if문(Chain Selection) 바깥에 있어야 합니다.
         # 부모가 메인 체인으로 선택받지 못했더라도, 자식을 연결하면
         # 자식이 메인 체인을 이길 수도 있기 때문입니다.
+        # (자식 처리는 호출자 몫: receive_block의 작업 스택 / 비동기 런타임의 메시지 루프)
         # ---------------------------------------------------------
         children = self.orphan_pool.pop(new_block.hash, [])
         if children:
             print(f"[UNLOCK] [{self.node_id}] 고아 해제! {len(children)}개의 블록을 연결 시도합니다.")
-            for child in children:
-                self.receive_block(child)
+        return children
 
     def validate_block(self, new_block, parent_block):
         """
@@ -206,21 +545,24 @@ class Node:
             print(f"[ERROR] 오류: 데이터 변조됨 (Hash 불일치)")
             return False
 
-        # 2. 연결 고리 검사
+        # 2. 연결 고리 검사 (부모 해시 + 높이 연속성)
         if new_block.previous_hash != parent_block.hash:
             print(f"[ERROR] 오류: 부모 해시 불일치")
             return False
+        if new_block.index != parent_block.index + 1:
+            print(f"[ERROR] 오류: 블록 높이 불연속 (부모: {parent_block.index}, 블록: {new_block.index})")
+            return False
 
-        # 3. PoW 작업 증명 (해당 난이도 준수 여부)
-        target_prefix = "0" * new_block.difficulty
-        if not new_block.hash.startswith(target_prefix):
-            print(f"[ERROR] 오류: 난이도({new_block.difficulty}) 불충족")
+        # 3. PoW 작업 증명 (해시를 정수로 보고 목표값 미만인지 비교)
+        if int(new_block.hash, 16) >= new_block.target:
+            print(f"[ERROR] 오류: 난이도({new_block.difficulty:g}) 불충족")
             return False
 
-        # 4. 난이도 조작 여부 검사
-        expected = self.get_expected_difficulty(new_block, parent_block)
-        if new_block.difficulty != expected:
-            print(f"[ERROR] 오류: 난이도 조작됨 (규칙: {expected}, 실제: {new_block.difficulty})")
+        # 4. 난이도 조작 여부 검사 (압축 목표값 bits가 규칙과 정확히 일치해야 함)
+        expected_bits = self.get_expected_bits(new_block, parent_block)
+        if new_block.bits != expected_bits:
+            print(f"[ERROR] 오류: 난이도 조작됨 (규칙: {bits_to_difficulty(expected_bits):g}, "
+                  f"실제: {new_block.difficulty:g})")
             return False
 
         # 5. 블록 단조 증가 검사
@@ -234,7 +576,7 @@ class Node:
             return False
 
         # 7. 난이도 급변 제한
-        if abs(new_block.difficulty - parent_block.difficulty) > 1:
+        if abs(new_block.difficulty - parent_block.difficulty) > config.MAX_STEP:
             print(f"[ERROR] 오류: 난이도 급변")
             return False
 
@@ -258,7 +600,15 @@ class Node:
             bool: 유효성 여부
         """
         # 부모 블록까지의 잔액 상태를 가져옴 (Base State)
-        temp_state = self.get_state_at(parent_block.hash)
+        # 부모 스냅샷은 공유되므로 자식 스냅샷에만 기록
+        parent_state = self.get_state_at(parent_block.hash)
+        temp_state = parent_state.child()
+
+        # 서명 일괄 검증 (캐시 미스만 워커 풀에서 병렬 처리, 첫 실패 시 중단)
+        # 이후 순차 검증 단계의 서명 확인은 캐시 조회로 끝남
+        if not self.verify_block_signatures(new_block.transactions):
+            print(f"[ERROR] 오류: 서명 일괄 검증 실패")
+            return False
 
         coinbase_count = 0
 
@@ -269,9 +619,9 @@ class Node:
             amount = body['amount']
             tx_nonce = body.get('nonce', 0)
 
-            # Sender/Recipient 상태 가져오기 (없으면 기본값)
-            sender_acc = temp_state.get(sender, {'balance': 0, 'nonce': 0})
-            recipient_acc = temp_state.get(recipient, {'balance': 0, 'nonce': 0})
+            # Sender/Recipient 상태 가져오기 (없으면 기본값, 공유 계정이므로 복사)
+            sender_acc = dict(temp_state.get(sender, {'balance': 0, 'nonce': 0}))
+            recipient_acc = dict(temp_state.get(recipient, {'balance': 0, 'nonce': 0}))
 
             # A. 기본 무결성 체크
             if amount <= 0:
@@ -297,8 +647,9 @@ class Node:
                     print(f"[ERROR] 오류: 채굴 보상을 엉뚱한 사람이 가져감 ({recipient} != {new_block.miner_id})")
                     return False
 
-                # 상태 반영 (돈이 생겨남)
+                # 상태 반영 (돈이 생겨남, SYSTEM 계정도 apply_block_to_state와 같이 기록)
                 recipient_acc['balance'] += amount
+                temp_state[sender] = sender_acc
                 temp_state[recipient] = recipient_acc  # 업데이트 된 객체 저장
 
             # C. 일반 거래 검증
@@ -333,11 +684,14 @@ class Node:
             print(f"[ERROR] 오류: 채굴 보상(Coinbase) 트랜잭션이 누락됨")
             return False
 
+        # 검증하며 만든 상태를 그대로 캐시 (블록을 다시 적용하지 않음, 자식 블록 검증 시 Replay 불필요)
+        self.state_cache.put(new_block.hash, temp_state)
         return True
 
     def verify_transaction_signature(self, tx):
         """
         트랜잭션의 디지털 서명 검증
+        (한 번 검증한 (txid, 서명, 공개키) 조합은 캐시 조회로 대체)
 
         Args:
             tx: 검증할 트랜잭션
@@ -345,42 +699,103 @@ class Node:
         Returns:
             bool: 서명이 유효한지 여부
         """
-        try:
-            # 1. 트랜잭션에 필수 필드가 있는지 확인
-            if 'signature' not in tx or 'public_key' not in tx:
-                print(f"[ERROR] 서명 검증 실패: 서명 또는 공개키 누락")
-                return False
+        # 1. 트랜잭션에 필수 필드가 있는지 확인
+        if 'signature' not in tx or 'public_key' not in tx:
+            print(f"[ERROR] 서명 검증 실패: 서명 또는 공개키 누락")
+            return False
 
-            # 2. 공개키 복원
-            public_key_hex = tx['public_key']
-            public_key_bytes = bytes.fromhex(public_key_hex)
-            public_key = CryptoUtils.bytes_to_public_key(public_key_bytes)
+        cache_key = self.signature_cache_key(tx)
+        is_valid = self.sig_cache.get(cache_key)
+        if is_valid is None:
+            is_valid = CryptoUtils.verify_transaction(tx)
+            self.sig_cache.put(cache_key, is_valid)
+        return is_valid
 
-            # 3. 공개키로부터 주소 계산
-            calculated_address = CryptoUtils.public_key_to_address(public_key)
+    def signature_cache_key(self, tx):
+        """서명 검증 캐시 키 (txid, 서명, 공개키)"""
+        return (self.compute_txid(tx), tx['signature'], tx['public_key'])
 
-            # 4. 송신자 주소와 공개키가 일치하는지 확인
-            sender_address = tx['body']['sender']
-            if calculated_address != sender_address:
-                print(f"[ERROR] 서명 검증 실패: 공개키가 송신자 주소와 불일치")
-                return False
+    def verify_block_signatures(self, transactions):
+        """
+        블록 내 일반 거래의 서명 일괄 검증 (잔액/nonce 순차 검증 이전 단계)
+        캐시에 없는 서명만 모아 워커 풀(config.SIG_VERIFY_WORKERS)에 분배하고,
+        하나라도 실패하면 남은 작업을 취소하고 즉시 실패 처리
+        (서명/공개키가 누락된 거래는 순차 검증 단계에서 거부)
+
+        Args:
+            transactions: 블록의 트랜잭션 리스트
+
+        Returns:
+            bool: 모든 서명이 유효한지 여부
+        """
+        pending = self.pending_signatures(transactions)
+        if pending is None:
+            return False
+        if not pending:
+            return True
+
+        workers = config.SIG_VERIFY_WORKERS
+        if workers <= 1 or len(pending) < config.SIG_VERIFY_BATCH_MIN:
+            # 작은 배치는 풀 전달 비용이 더 크므로 순차 검증
+            for cache_key, tx in pending.items():
+                is_valid = CryptoUtils.verify_transaction(tx)
+                self.sig_cache.put(cache_key, is_valid)
+                if not is_valid:
+                    return False
+            return True
+
+        # 워커 수만큼 묶음으로 나눠 제출 (묶음 안에서도 첫 실패에서 중단)
+        keys = list(pending)
+        chunk_size = -(-len(keys) // workers)
+        executor = get_verify_executor(config.SIG_VERIFY_EXECUTOR, workers)
+        futures = {}
+        for start in range(0, len(keys), chunk_size):
+            chunk_keys = keys[start:start + chunk_size]
+            future = executor.submit(CryptoUtils.verify_transactions, [pending[k] for k in chunk_keys])
+            futures[future] = chunk_keys
 
-            # 5. 서명 복원
-            signature_hex = tx['signature']
-            signature = CryptoUtils.hex_to_signature(signature_hex)
+        try:
+            for future in as_completed(futures):
+                results = future.result()
+                for cache_key, is_valid in zip(futures[future], results):
+                    self.sig_cache.put(cache_key, is_valid)
+                if not all(results):
+                    return False
+        finally:
+            for future in futures:
+                future.cancel()
+        return True
 
-            # 6. 서명 검증 (body만 사용)
-            is_valid = CryptoUtils.verify_signature(public_key, tx['body'], signature)
+    def pending_signatures(self, transactions):
+        """
+        아직 검증하지 않은(캐시에 없는) 일반 거래 서명 수집
 
-            return is_valid
+        Args:
+            transactions: 블록의 트랜잭션 리스트
 
-        except Exception as e:
-            print(f"[ERROR] 서명 검증 중 예외 발생: {e}")
-            return False
+        Returns:
+            dict: {캐시 키: 거래} (이미 실패로 캐시된 서명이 있으면 None)
+        """
+        pending = {}
+        for tx in transactions:
+            if tx['body']['sender'] == "SYSTEM":
+                continue
+            if 'signature' not in tx or 'public_key' not in tx:
+                continue
+
+            cache_key = self.signature_cache_key(tx)
+            is_valid = self.sig_cache.get(cache_key)
+            if is_valid is False:
+                return None
+            if is_valid is None:
+                pending[cache_key] = tx
+        return pending
 
     def get_ancestor(self, block, target_height):
         """
-        블록에서 부모를 타고 거슬러 올라가 target_height의 블록을 찾음
+        블록에서 거슬러 올라가 target_height의 조상 블록을 찾음
+        - 메인 체인 위: 높이 인덱스로 O(1) 조회
+        - 곁가지: Skip 포인터로 O(log n) 점프 (메인 체인에 닿으면 즉시 O(1))
 
         Args:
             block: 시작 블록
@@ -389,9 +804,27 @@ class Node:
         Returns:
             Block: 찾은 블록 또는 None
         """
+        if target_height < 0:
+            return None
+
         curr = block
         while curr and curr.index > target_height:
-            curr = self.block_index.get(curr.previous_hash)
+            if self.is_on_main_chain(curr):
+                return self.block_index[self.main_chain[target_height]]
+
+            # Skip 포인터가 목표를 지나치지 않으면 점프, 아니면 부모로 한 칸
+            skip_height = get_skip_height(curr.index)
+            prev_skip_height = get_skip_height(curr.index - 1)
+            skip_hash = self.skip_pointers.get(curr.hash)
+
+            if skip_hash is not None and (
+                skip_height == target_height
+                or (skip_height > target_height
+                    and not (prev_skip_height < skip_height - 2 and prev_skip_height >= target_height))
+            ):
+                curr = self.block_index.get(skip_hash)
+            else:
+                curr = self.block_index.get(curr.previous_hash)
         return curr
 
     def get_expected_difficulty(self, new_block, parent_block):
@@ -403,15 +836,30 @@ class Node:
             parent_block: 부모 블록
 
         Returns:
-            int: 예상 난이도
+            int 또는 float: 예상 난이도 (get_expected_bits의 난이도 표현)
+        """
+        return bits_to_difficulty(self.get_expected_bits(new_block, parent_block))
+
+    def get_expected_bits(self, new_block, parent_block):
+        """
+        [트리 구조 전용] 다음에 올 블록의 압축 목표값(bits) 계산
+        조정 주기마다 목표값을 실제 소요 시간 / 목표 시간 비율만큼 비례 조정
+        (한 번에 MAX_RETARGET_FACTOR배까지, 최소 난이도 MIN_DIFFICULTY)
+
+        Args:
+            new_block: 새 블록
+            parent_block: 부모 블록
+
+        Returns:
+            int: 압축 목표값
         """
         # 1. 첫 구간(Genesis 근처)은 기본 난이도
         if new_block.index <= config.ADJUSTMENT_INTERVAL:
-            return config.DEFAULT_DIFFICULTY
+            return difficulty_to_bits(config.DEFAULT_DIFFICULTY)
 
         # 2. 조정 주기가 아니라면 부모 난이도 유지
         if new_block.index % config.ADJUSTMENT_INTERVAL != 0:
-            return parent_block.difficulty
+            return parent_block.bits
 
         # 3. 조정 주기 도달: 과거 블록 시간 측정
         start_index = new_block.index - config.ADJUSTMENT_INTERVAL
@@ -420,48 +868,65 @@ class Node:
         start_node = self.get_ancestor(parent_block, start_index)
 
         if not start_node:
-            return parent_block.difficulty  # 안전장치
+            return parent_block.bits  # 안전장치
 
-        time_taken = parent_block.timestamp - start_node.timestamp
-        expected_time = config.TARGET_BLOCK_TIME * config.ADJUSTMENT_INTERVAL
+        # 이산 사건 엔진에서는 타임스탬프가 소수이므로 밀리초 정수로 계산 (정수 시간이면 결과 동일)
+        time_taken = round((parent_block.timestamp - start_node.timestamp) * 1000)
+        expected_time = config.TARGET_BLOCK_TIME * config.ADJUSTMENT_INTERVAL * 1000
 
-        if time_taken < expected_time / 2:
-            return parent_block.difficulty + config.MAX_STEP
-        elif time_taken > expected_time * 2:
-            return max(parent_block.difficulty - config.MAX_STEP, 1)
-        else:
-            return parent_block.difficulty
+        # 빠르면 목표값 축소(난이도 증가), 느리면 목표값 확대(난이도 감소) - 정수 연산
+        parent_target = parent_block.target
+        target = parent_target * time_taken // expected_time
+
+        # 한 번에 MAX_RETARGET_FACTOR배까지만 조정, 최소 난이도 유지
+        factor = config.MAX_RETARGET_FACTOR
+        target = min(max(target, parent_target // factor, 1), parent_target * factor)
+        target = min(target, difficulty_to_target(config.MIN_DIFFICULTY))
+        return target_to_bits(target)
 
     def get_state_at(self, tip_hash):
         """
-        [Helper] 특정 블록(tip_hash) 시점의 잔액 상태를 처음부터 계산해서 반환
+        [Helper] 특정 블록(tip_hash) 시점의 잔액 상태를 반환
+        캐시에 없으면 가장 가까운 캐시된 조상 또는 체크포인트부터 재생
 
         Args:
             tip_hash: 목표 블록 해시
 
         Returns:
-            dict: 상태 딕셔너리
+            StateSnapshot: 상태 스냅샷 (공유 객체이므로 child()로 파생해서 수정)
         """
-        # 1. 경로 역추적 (Tip -> Genesis)
-        path = []
-        curr = self.block_index.get(tip_hash)
+        cached = self.state_cache.get(tip_hash)
+        if cached is not None:
+            return cached
 
-        while curr:
-            path.append(curr)
-            if curr.previous_hash == "0":  # Genesis 도달
-                break
-            curr = self.block_index.get(curr.previous_hash)
+        # 1. 경로 역추적 (Tip -> 캐시된 조상/체크포인트)
+        base, path = self.find_replay_base(tip_hash)
 
-        # 2. 경로가 끊겨있거나 Genesis에 도달 못한 경우 (안전장치)
-        if not path or path[-1].previous_hash != "0":
-            return {}
+        # 2. 경로가 끊겨있거나 기준점에 도달 못한 경우 (안전장치)
+        if base is None:
+            return StateSnapshot()
 
-        # 3. 순방향 재생 (Genesis -> Tip)
-        balances = {}
+        # 3. 순방향 재생 (기준점 -> Tip)
         for block in reversed(path):
-            self.apply_block_to_state(block, balances)
+            base = self.derive_state(base, block)
+
+        self.state_cache.put(tip_hash, base)
+        return base
+
+    def derive_state(self, parent_state, block):
+        """
+        부모 스냅샷에 블록 하나를 적용한 자식 스냅샷 생성 (블록 크기에 비례)
 
-        return balances
+        Args:
+            parent_state: 부모 블록 시점의 스냅샷
+            block: 적용할 블록
+
+        Returns:
+            StateSnapshot: 블록 시점의 스냅샷
+        """
+        child = parent_state.child()
+        self.apply_block_to_state(block, child)
+        return child
 
     def handle_reorg(self, old_tip, new_tip):
         """
@@ -470,59 +935,75 @@ class Node:
         Args:
             old_tip: 이전 팁 블록
             new_tip: 새 팁 블록
-        """
-        fork_point = None
-        discarded_blocks = []  # 버려질 블록들 (Old Chain)
-        adopted_blocks = []    # 채택될 블록들 (New Chain)
-
-        curr_old = old_tip
-        curr_new = new_tip
-
-        # 1. 높이 맞추기
-        while curr_new.index > curr_old.index:
-            adopted_blocks.append(curr_new)
-            curr_new = self.block_index.get(curr_new.previous_hash)
-            if curr_new is None:
-                print(f"[WARN] [{self.node_id}] reorg 보류: new 쪽 조상 미수신")
-                return
 
-        while curr_old.index > curr_new.index:
-            discarded_blocks.append(curr_old)
-            curr_old = self.block_index.get(curr_old.previous_hash)
-            if curr_old is None:
-                print(f"[WARN] [{self.node_id}] reorg 보류: old 쪽 조상 미수신")
-                return
-
-        # 2. 공통 조상 찾기
-        while curr_new.hash != curr_old.hash:
-            adopted_blocks.append(curr_new)
-            discarded_blocks.append(curr_old)
-
-            curr_new = self.block_index.get(curr_new.previous_hash)
-            curr_old = self.block_index.get(curr_old.previous_hash)
-
-            if curr_new is None or curr_old is None:
-                print(f"[WARN] [{self.node_id}] reorg 보류: 공통 조상 탐색 중 조상 미수신")
-                return
+        Returns:
+            bool: 상태 전환 성공 여부 (실패 시 호출자가 전체 재계산)
+        """
+        # 1. 공통 조상 찾기 (높이 인덱스 기반 이진 탐색)
+        fork_point = self.find_fork_point(old_tip, new_tip)
+        if fork_point is None:
+            print(f"[WARN] [{self.node_id}] reorg 보류: 공통 조상 탐색 중 조상 미수신")
+            return False
 
-        fork_point = curr_new  # 공통 조상 발견
+        # 2. 버려질/채택될 구간 (리스트로 펼치지 않는 뷰)
+        discarded_blocks = BlockRange(self.block_index, old_tip, fork_point.index)                     # Old Chain
+        adopted_blocks = BlockRange(self.block_index, new_tip, fork_point.index, self.get_ancestor)  # New Chain
 
         # 3. 멤풀 업데이트
         print(f"[REORG] [{self.node_id}] Reorg 감지! 깊이: {len(discarded_blocks)} block(s) rollback.")
 
-        # 버려지는 블록의 거래들을 멤풀로 부활
-        for block in discarded_blocks:
+        # 버려지는 블록의 거래들을 멤풀로 부활 (Tip부터)
+        for block in reversed(discarded_blocks):
             for tx in block.transactions:
                 if tx['body']['sender'] == "SYSTEM":
                     continue  # 코인베이스 제외
-                if tx not in self.mempool:
-                    self.mempool.append(tx)
+                self.mempool.add(tx)  # 이미 있으면 무시
 
         # 새로 채택된 블록의 거래들은 멤풀에서 제거
-        for block in adopted_blocks:
+        for block in reversed(adopted_blocks):
             for tx in block.transactions:
-                if tx in self.mempool:
-                    self.mempool.remove(tx)
+                self.mempool.remove(tx)
+
+        # 4. 상태 전환: 버려진 블록을 팁부터 롤백 -> 공통 조상에서 새 가지 순방향 재생
+        for block in reversed(discarded_blocks):
+            if not self.disconnect_block(block):
+                return False
+
+        for block in adopted_blocks:
+            self.connect_block(block)
+
+        return True
+
+    def find_fork_point(self, old_tip, new_tip):
+        """
+        두 팁의 공통 조상(Fork Point)을 찾음
+        높이별 조상 일치 여부는 단조적이므로 높이에 대해 이진 탐색
+        (조상 조회가 메인 체인 O(1) / 곁가지 O(log n) 이므로 전체 O(log² n))
+
+        Args:
+            old_tip: 이전 팁 블록
+            new_tip: 새 팁 블록
+
+        Returns:
+            Block: 공통 조상 블록 또는 None (조상 미수신)
+        """
+        fork_point = None
+        low, high = 0, min(old_tip.index, new_tip.index)
+
+        while low <= high:
+            mid = (low + high) // 2
+            old_ancestor = self.get_ancestor(old_tip, mid)
+            new_ancestor = self.get_ancestor(new_tip, mid)
+            if old_ancestor is None or new_ancestor is None:
+                return None
+
+            if old_ancestor.hash == new_ancestor.hash:
+                fork_point = old_ancestor
+                low = mid + 1
+            else:
+                high = mid - 1
+
+        return fork_point
 
     def compute_txid(self, tx):
         """
@@ -534,76 +1015,102 @@ class Node:
         Returns:
             str: 트랜잭션 ID (해시)
         """
-        return hashlib.sha256(json.dumps(tx['body'], sort_keys=True).encode()).hexdigest()
+        return hashlib.sha256(encoding.tx_body_bytes(tx['body'])).hexdigest()
 
     def clean_mempool(self):
         """
-        멤풀 정리 (Mempool Cleanup)
+        멤풀 정리 (Mempool Cleanup) - 전체 재검증
         현재 메인 체인에 포함된 거래 및 유효하지 않은 거래 제거
+        (팁 변경 시에는 update_mempool()이 영향받은 송신자만 재검증)
         """
-        # (1) 현재 메인 체인의 모든 트랜잭션 수집
-        confirmed_txs = set()
-        curr_block = self.get_tip_block()
+        self.mempool.pop_dirty()
+        for sender in self.mempool.senders():
+            self.revalidate_sender(sender)
 
-        while True:
-            for tx in curr_block.transactions:
-                tx_sig = self.compute_txid(tx)
-                confirmed_txs.add(tx_sig)
+    def update_mempool(self):
+        """
+        멤풀 증분 정리
+        블록 연결/분리로 계정이 바뀐 송신자와 새 거래가 들어온 송신자만 재검증
+        (비용은 체인/멤풀 크기가 아닌 블록 크기에 비례)
+        """
+        for sender in self.mempool.pop_dirty():
+            self.revalidate_sender(sender)
 
-            if curr_block.previous_hash == "0":
-                break
-            curr_block = self.block_index[curr_block.previous_hash]
+    def revalidate_sender(self, sender):
+        """
+        한 송신자의 멤풀 거래를 현재 상태 기준으로 도착 순서대로 재검증
+        (송신자 간 잔액/nonce는 서로 영향이 없으므로 송신자 단위로 독립 처리)
 
-        # (2) 멤풀 필터링
-        valid_mempool = []
-        temp_state = copy.deepcopy(self.state)
+        Args:
+            sender: 송신자 주소
+        """
+        sender_acc = self.state.get(sender, {'balance': 0, 'nonce': 0})
+        balance = sender_acc['balance']
+        expected_nonce = sender_acc['nonce'] + 1
 
-        for tx in self.mempool:
-            tx_sig = self.compute_txid(tx)
+        for tx_sig, tx in self.mempool.sender_items(sender):
             body = tx['body']
-            sender = body['sender']
             amount = body['amount']
             tx_nonce = body.get('nonce', 0)
 
-            # 필터 1: 이미 체인에 존재하는가?
-            if tx_sig in confirmed_txs:
+            # 필터 0: 이미 메인 체인에 포함되어 있는가? (확정 거래 인덱스, O(1))
+            if tx_sig in self.tx_index:
+                self.mempool.discard(tx_sig)
                 continue
 
-            # 필터 2: SYSTEM 거래인가?
+            # 필터 1: SYSTEM 거래인가?
             if sender == "SYSTEM":
+                self.mempool.discard(tx_sig)
                 continue
 
-            sender_acc = temp_state.get(sender, {'balance': 0, 'nonce': 0})
-
-            # 필터 3: 서명 검증
+            # 필터 2: 서명 검증
             if not self.verify_transaction_signature(tx):
                 print(f"[REMOVE] [{self.node_id}] 서명 무효 거래 제거: {sender}")
+                self.mempool.discard(tx_sig)
                 continue
 
-            # 필터 4: 잔액이 충분한가?
-            if sender_acc['balance'] < amount:
-                print(f"[REMOVE] [{self.node_id}] 잔액 부족 거래 제거: {sender} (보유: {sender_acc['balance']}, 시도: {amount})")
+            # 필터 3: 잔액이 충분한가?
+            if balance < amount:
+                print(f"[REMOVE] [{self.node_id}] 잔액 부족 거래 제거: {sender} (보유: {balance}, 시도: {amount})")
+                self.mempool.discard(tx_sig)
                 continue
 
-            # 필터 5: Nonce 체크
-            if tx_nonce == sender_acc['nonce'] + 1:
-                sender_acc['balance'] -= amount
-                sender_acc['nonce'] = tx_nonce
-                temp_state[sender] = sender_acc
-                valid_mempool.append(tx)
+            # 필터 4: Nonce 체크 (이미 확정된 nonce의 거래도 여기서 제거)
+            if tx_nonce == expected_nonce:
+                balance -= amount
+                expected_nonce = tx_nonce + 1
             else:
-                print(f"[REMOVE] [{self.node_id}] nonce 불일치 거래 제거: {sender} (node 상태: {sender_acc['nonce']})")
-
-        # 필터링된 유효 거래들로 멤풀 교체
-        self.mempool = valid_mempool
+                print(f"[REMOVE] [{self.node_id}] nonce 불일치 거래 제거: {sender} (node 상태: {expected_nonce - 1})")
+                self.mempool.discard(tx_sig)
 
-    def try_mine(self):
+    def try_mine(self, timestamp=None):
         """
-        채굴 시도: 멤풀에서 트랜잭션을 선택하고 새 블록 생성
+        채굴 시도: 멤풀에서 트랜잭션을 선택하고 새 블록 생성 (해답을 찾을 때까지 대기)
+
+        Args:
+            timestamp: 블록 시간 (None이면 config.SIM_TIME)
 
         Returns:
             Block: 채굴된 블록
         """
+        new_block = self.create_block_template(timestamp)
+
+        # 채굴 시도
+        stats = new_block.mine_block()
+        self.mining_stats['blocks'] += 1
+        self.mining_stats['hashes'] += stats.hashes
+        return new_block
+
+    def create_block_template(self, timestamp=None):
+        """
+        현재 팁 위에 채굴할 블록 템플릿 생성 (코인베이스 + 멤풀 거래, 규칙에 맞는 난이도)
+
+        Args:
+            timestamp: 블록 시간 (None이면 config.SIM_TIME)
+
+        Returns:
+            Block: nonce/hash가 채워지지 않은 블록
+        """
         tip = self.get_tip_block()
 
         # 보상 트랜잭션
@@ -624,28 +1131,114 @@ class Node:
         # 새 블록 생성
         new_block = Block(
             index=tip.index + 1,
-            timestamp=config.SIM_TIME,
+            timestamp=config.SIM_TIME if timestamp is None else timestamp,
             transactions=txs,
             difficulty=tip.difficulty,
             previous_hash=tip.hash,
-            miner_id=self.node_id
+            miner_id=self.node_id,
+            bits=tip.bits
         )
 
         # 프로토콜 규칙에 따른 난이도 계산
-        expected_difficulty = self.get_expected_difficulty(new_block, tip)
+        expected_bits = self.get_expected_bits(new_block, tip)
 
-        if new_block.difficulty != expected_difficulty:
-            print(f"[CONFIG] [{self.node_id}] 난이도 조정 적용: {new_block.difficulty} -> {expected_difficulty}")
-            new_block.difficulty = expected_difficulty
-            new_block.block_work = 1 << expected_difficulty
+        if new_block.bits != expected_bits:
+            print(f"[CONFIG] [{self.node_id}] 난이도 조정 적용: {new_block.difficulty:g} -> "
+                  f"{bits_to_difficulty(expected_bits):g}")
+            new_block.bits = expected_bits
 
-        # 채굴 시도
-        new_block.mine_block()
         return new_block
 
+    def start_mining(self):
+        """
+        현재 팁 위에서 새 시분할 채굴 작업 시작 (진행 중인 작업은 취소)
+
+        Returns:
+            MiningJob: 시작된 채굴 작업
+        """
+        self.abort_mining("새 작업 시작")
+        self.mining_job = MiningJob(self.create_block_template())
+        return self.mining_job
+
+    def mine_step(self, budget=None):
+        """
+        진행 중인 채굴 작업을 한 슬라이스만큼 진행 (작업이 없으면 새로 시작)
+
+        Args:
+            budget: 이번 슬라이스의 해시 예산 (None이면 config.MINING_SLICE_HASHES)
+
+        Returns:
+            Block: 해답을 찾았으면 채굴된 블록, 아니면 None (팁과 같은 시각이면 대기)
+        """
+        job = self.mining_job
+        if job is None:
+            # 블록 시간은 부모보다 커야 하므로 팁과 같은 시각에는 새 작업을 시작하지 않음
+            if self.get_tip_block().timestamp >= config.SIM_TIME:
+                return None
+            job = self.start_mining()
+
+        if not job.step(budget or config.MINING_SLICE_HASHES):
+            return None
+
+        self.mining_job = None
+        self.mining_stats['blocks'] += 1
+        self.mining_stats['hashes'] += job.hashes
+        stats = job.stats()
+        print(f"[MINE] 블록 채굴 성공 (난이도: {job.block.difficulty:g}): {job.block.hash} "
+              f"({stats.hashes} hashes, {stats.hash_rate:.0f} H/s)")
+        return job.block
+
+    def abort_mining(self, reason):
+        """
+        진행 중인 채굴 작업 취소 (이미 시도한 해시는 낭비로 집계)
+
+        Args:
+            reason: 취소 사유
+
+        Returns:
+            bool: 취소한 작업이 있었는지 여부
+        """
+        job = self.mining_job
+        if job is None:
+            return False
+
+        job.cancel(reason)
+        self.mining_job = None
+        self.mining_stats['aborted_jobs'] += 1
+        self.mining_stats['hashes'] += job.hashes
+        self.mining_stats['wasted_hashes'] += job.hashes
+        print(f"[ABORT] [{self.node_id}] 채굴 작업 중단 (H:{job.block.index}, {reason}): {job.hashes} hashes 낭비")
+        return True
+
+    def abort_stale_mining(self):
+        """
+        진행 중인 채굴 작업의 부모가 현재 팁이 아니면 취소
+
+        Returns:
+            bool: 취소 여부
+        """
+        job = self.mining_job
+        if job is None or job.block.previous_hash == self.chain_tip:
+            return False
+        return self.abort_mining(f"팁 변경 -> {self.chain_tip[:6]}")
+
+    def get_mining_stats(self):
+        """
+        채굴 통계 반환
+
+        Returns:
+            dict: {'blocks', 'hashes', 'aborted_jobs', 'wasted_hashes', 'wasted_ratio'}
+        """
+        stats = dict(self.mining_stats)
+        if self.mining_job is not None:
+            stats['hashes'] += self.mining_job.hashes  # 진행 중인 작업 포함
+        stats['wasted_ratio'] = stats['wasted_hashes'] / stats['hashes'] if stats['hashes'] else 0.0
+        return stats
+
     def select_txs_for_block(self, max_txs=5):
         """
         멤풀에서 유효한 거래만 선별
+        실행 가능한 송신자의 nonce 큐에서만 꺼내므로 멤풀 크기가 아닌 블록 크기에 비례
 
         Args:
             max_txs: 최대 선택 거래 수
@@ -653,33 +1246,29 @@ class Node:
         Returns:
             list: 선택된 트랜잭션 리스트
         """
-        selected = []
-        temp_state = copy.deepcopy(self.state)
+        # 이번 블록에서 송신자별로 이미 차감된 금액 (상태 전체 복사 불필요)
+        spent = {}
 
-        for tx in self.mempool:
+        def accept(tx):
             body = tx['body']
             sender = body['sender']
             amount = body['amount']
-            tx_nonce = body.get('nonce', 0)
-            sender_acc = temp_state.get(sender, {'balance': 0, 'nonce': 0})
 
             # 시스템 거래 필터링
             if sender == "SYSTEM":
-                continue
+                return False
 
             # 서명 검증
             if not self.verify_transaction_signature(tx):
-                continue
+                return False
 
-            # 잔액 및 Nonce 확인
-            if sender_acc['balance'] >= amount and tx_nonce == sender_acc['nonce'] + 1:
-                sender_acc['balance'] -= amount
-                sender_acc['nonce'] = tx_nonce
-                temp_state[sender] = sender_acc
-                selected.append(tx)
+            # 잔액 확인 (Nonce 순서는 멤풀의 송신자별 큐가 보장)
+            sender_acc = self.state.get(sender, {'balance': 0, 'nonce': 0})
+            if sender_acc['balance'] - spent.get(sender, 0) < amount:
+                return False
 
-            # 최대 개수 도달 시 중단
-            if len(selected) >= max_txs:
-                break
+            spent[sender] = spent.get(sender, 0) + amount
+            return True
 
+        selected = self.mempool.select(max_txs, accept)
         return selected
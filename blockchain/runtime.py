@@ -0,0 +1,543 @@
+"""
+asyncio 노드 런타임 모듈
+노드마다 수신함(Inbox) 큐와 메시지 루프를 두고, 노드 상태는 그 루프만 변경
+- 블록 서명 일괄 검증은 검증 실행기로, PoW 탐색은 채굴 프로세스 풀로 넘기고 그동안 다른 노드의 메시지 처리
+  (해시 계산은 GIL을 잡고 있으므로 스레드가 아닌 프로세스에서 nonce 구간 단위로 탐색)
+- 고아 블록 해제는 Node.process_block으로 한 블록씩 처리 (재진입/재귀 없음, 블록 사이에 양보)
+- 메시지 하나의 처리 예외는 기록(stats['failed_messages'])하고 루프는 계속 (drain()/run()이 멈추지 않음)
+- 링크는 전송 순서대로 메시지를 전달하고(events.Link 지연/대역폭 모델), 수신함이 가득 차면 전달 대기
+- 백프레셔: 수신함이 가득 차면 링크 전달과 거래 제출이 기다리고, 밀린 노드는 채굴을 멈추고 수신함부터 처리
+  링크 적체가 config.INBOX_HIGH_WATER에 닿거나 수신 노드가 밀려 있으면 그 링크로의 거래 전달은 버림(load shedding)
+  (전달을 기다리게 하면 순환 토폴로지에서 서로의 메시지 루프가 막혀 교착될 수 있음 -
+   블록은 버리면 부모를 다시 요청할 방법이 없으므로 항상 전달, 블록 수는 채굴 속도로 제한됨)
+
+시간은 벽시계에 비례하는 시뮬레이션 시간 (벽시계 1초 = config.RUNTIME_TIME_SCALE초)
+이므로 실행 결과는 재현되지 않음 (재현이 필요하면 NetworkSimulator.run_event_simulation 사용)
+"""
+
+import asyncio
+import random
+from .block import Block
+from .crypto import CryptoUtils, SignatureCache, get_verify_executor
+from .events import Link
+from .frozen import freeze
+from .mining import (
+    MiningJob, search_nonce_range, effective_mining_workers, get_mining_executor, shutdown_mining_executor
+)
+from .topology import build_topology
+from . import config, encoding
+
+
+class NodeActor:
+    """
+    수신함과 메시지 루프를 가진 노드
+    메시지: ('block', 블록, 송신 액터) / ('tx', 거래, 송신 액터) / ('mined', 채굴한 블록, None)
+    """
+
+    def __init__(self, runtime, node, processing_delay=0):
+        """
+        Args:
+            runtime: 소속 AsyncNetworkRuntime
+            node: 감쌀 Node
+            processing_delay: 메시지당 추가 처리 시간 (시뮬레이션 초, 느린 노드 모의용)
+        """
+        self.runtime = runtime
+        self.node = node
+        self.processing_delay = processing_delay
+        self.peers = []
+        self.inbox = None        # 실행 중에만 존재 (asyncio.Queue는 이벤트 루프에 묶임)
+        self.handled = 0         # 처리한 메시지 수
+        self.failed = 0          # 처리 중 예외가 난 메시지 수
+        self.max_backlog = 0     # 수신함에 쌓였던 최대 메시지 수
+        self.mining_pauses = 0   # 수신함이 밀려 채굴을 미룬 횟수
+        self._queued_nonces = {}  # {송신자: 수신함에 대기 중인 제출 거래 수} - 다음 nonce 계산용
+
+    @property
+    def node_id(self):
+        return self.node.node_id
+
+    def is_behind(self):
+        """수신함이 config.INBOX_HIGH_WATER 이상 밀렸는지 여부"""
+        return self.inbox is not None and self.inbox.qsize() >= config.INBOX_HIGH_WATER
+
+    async def post(self, message):
+        """수신함에 메시지 추가 (가득 차면 빈자리가 생길 때까지 대기 - 백프레셔)"""
+        if self.inbox.full():
+            self.runtime.stats['backpressure_waits'] += 1
+        await self.inbox.put(message)
+        self.max_backlog = max(self.max_backlog, self.inbox.qsize())
+
+    async def serve(self):
+        """
+        메시지 루프: 수신함에서 하나씩 꺼내 처리 (노드 상태는 이 루프에서만 변경)
+        메시지 처리 중 예외는 기록하고 다음 메시지로 넘어감 (루프가 죽으면 drain()이 끝나지 않음)
+        """
+        while True:
+            kind, item, sender = await self.inbox.get()
+            try:
+                self.runtime.tick()
+                if kind == 'block' or kind == 'mined':
+                    await self._handle_block(item, sender)
+                elif kind == 'tx':
+                    self._handle_transaction(item, sender)
+                self.handled += 1
+                if self.processing_delay:
+                    await asyncio.sleep(self.processing_delay / self.runtime.time_scale)
+            except Exception as e:
+                self.failed += 1
+                self.runtime.stats['failed_messages'] += 1
+                print(f"[ERROR] [{self.node_id}] '{kind}' 메시지 처리 중 예외: {type(e).__name__}: {e}")
+            finally:
+                self.inbox.task_done()
+
+    async def _handle_block(self, block, sender):
+        node = self.node
+        pending = [block]
+        while pending:
+            current = pending.pop()
+            if current.hash in node.block_index:
+                continue
+            await self._preverify(current)
+
+            self.runtime.tick()
+            children = node.process_block(current)
+            if current.hash in node.block_index:
+                # 연결된 블록만 전파 (고아 / 무효 블록은 전파하지 않음)
+                self.runtime.relay(self, 'block', current, exclude=sender if current is block else None)
+            pending.extend(reversed(children))
+            await asyncio.sleep(0)  # 긴 고아 사슬도 블록 사이에 다른 노드에게 양보
+
+    async def _preverify(self, block):
+        """캐시에 없는 서명을 검증 실행기에서 일괄 검증해 캐시에 채움 (이후 블록 검증은 캐시 조회)"""
+        pending = self.node.pending_signatures(block.transactions)
+        if not pending:
+            return
+
+        loop = asyncio.get_running_loop()
+        keys = list(pending)
+        results = await loop.run_in_executor(
+            self.runtime.verify_executor, CryptoUtils.verify_transactions, [pending[k] for k in keys]
+        )
+        for cache_key, is_valid in zip(keys, results):
+            self.node.sig_cache.put(cache_key, is_valid)
+        self.runtime.stats['offloaded_verifications'] += len(results)
+
+    def _handle_transaction(self, tx, sender):
+        if sender is None:
+            # 직접 제출된 거래 (submit_transaction)
+            body = tx['body']
+            self._queued_nonces[body['sender']] -= 1
+        if self.node.add_transaction(tx):
+            self.runtime.relay(self, 'tx', tx, exclude=sender)
+
+    def next_nonce(self, sender_address):
+        """제출할 거래의 nonce (확정 nonce + 멤풀 대기 거래 + 수신함 대기 거래)"""
+        node = self.node
+        return (node.get_confirmed_nonce(sender_address) + 1
+                + len(node.mempool.sender_items(sender_address))
+                + self._queued_nonces.get(sender_address, 0))
+
+    async def mine(self):
+        """
+        채굴 루프
+        블록 발견 간격은 이벤트 엔진과 같은 지수 분포, 해답 탐색(PoW)은 채굴 프로세스 풀에서 수행
+        팁이 바뀌면 메시지 루프의 abort_stale_mining()이 작업을 취소 (다음 구간부터 탐색 중단)
+        """
+        runtime = self.runtime
+        node = self.node
+        rng = runtime.node_rng(node)
+
+        while True:
+            if self.is_behind():
+                # 밀린 노드는 낡은 팁 위에서 채굴하지 않고 수신함부터 처리
+                self.mining_pauses += 1
+                await asyncio.sleep(config.LINK_LATENCY / runtime.time_scale)
+                continue
+
+            hash_rate = config.NETWORK_HASH_RATE / len(runtime.actors)
+            delay = rng.expovariate(hash_rate / node.get_tip_block().block_work)
+            await asyncio.sleep(delay / runtime.time_scale)
+            if self.is_behind():
+                continue
+
+            now = runtime.tick()
+            tip = node.get_tip_block()
+            if tip.timestamp >= now:
+                continue  # 블록 시간은 부모보다 커야 함
+
+            node.abort_mining("새 작업 시작")
+            template = node.create_block_template(min(now, tip.timestamp + config.MAX_TIME_JUMP))
+            job = node.mining_job = MiningJob(template)
+            if not await self._search(job):
+                continue  # 탐색 중 팁이 바뀌어 취소됨 (낭비 해시는 abort_mining / _search가 집계)
+
+            node.mining_job = None
+            node.mining_stats['blocks'] += 1
+            node.mining_stats['hashes'] += job.hashes
+            runtime.stats['blocks_mined'] += 1
+            print(f"[MINE]  [{node.node_id}] 블록 채굴 성공! (t={runtime.now():.3f}, H:{job.block.index})")
+            await self.post(('mined', job.block.freeze(), None))
+
+    async def _search(self, job):
+        """
+        PoW 탐색: config.MINING_CHUNK_SIZE개 nonce 구간을 채굴 프로세스 풀에 차례로 맡김
+        (구간 결과가 돌아온 뒤에만 job에 반영하므로 해시 수는 이벤트 루프에서만 갱신)
+
+        Args:
+            job: 탐색할 MiningJob (node.mining_job)
+
+        Returns:
+            bool: 해답을 찾았는지 여부 (취소되면 False)
+        """
+        loop = asyncio.get_running_loop()
+        stats = self.node.mining_stats
+        while not job.cancelled:
+            if job.header_prefix is None:
+                # JSON 호환 모드: 넘길 헤더 앞부분이 없으므로 루프에서 작은 슬라이스씩 탐색하며 양보
+                job.step(config.MINING_SLICE_HASHES)
+                await asyncio.sleep(0)
+            else:
+                start = job.next_nonce
+                nonce, tried = await loop.run_in_executor(
+                    self.runtime.mining_executor, search_nonce_range,
+                    job.header_prefix, job.target, start, start + config.MINING_CHUNK_SIZE
+                )
+                if job.cancelled:
+                    # 구간 탐색 중 취소됨: abort_mining 이후에 끝난 해시도 낭비로 집계
+                    stats['hashes'] += tried
+                    stats['wasted_hashes'] += tried
+                    return False
+                job.record(nonce, tried)
+            if job.done:
+                return True
+        return False
+
+    def __repr__(self):
+        backlog = self.inbox.qsize() if self.inbox is not None else 0
+        return f"NodeActor({self.node_id}, handled={self.handled}, failed={self.failed}, backlog={backlog})"
+
+
+class AsyncNetworkRuntime:
+    """
+    asyncio 기반 네트워크 런타임
+    노드별 메시지 루프 / 채굴 루프와 링크별 전달 루프를 하나의 이벤트 루프에서 실행
+    """
+
+    def __init__(self, seed=None, time_scale=None, inbox_size=None, sig_cache=None):
+        """
+        Args:
+            seed: 토폴로지 / 채굴 간격 난수 시드 (벽시계 기반이므로 실행 결과까지 재현되지는 않음)
+            time_scale: 벽시계 1초당 시뮬레이션 시간 (None이면 config.RUNTIME_TIME_SCALE)
+            inbox_size: 노드별 수신함 크기 (None이면 config.NODE_INBOX_SIZE)
+            sig_cache: 노드 공용 서명 검증 캐시 (없으면 새로 생성)
+        """
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.time_scale = config.RUNTIME_TIME_SCALE if time_scale is None else time_scale
+        self.inbox_size = config.NODE_INBOX_SIZE if inbox_size is None else inbox_size
+        self.sig_cache = sig_cache if sig_cache is not None else SignatureCache(config.SIG_CACHE_SIZE)
+
+        self.genesis_block = self.create_genesis()
+        self.actors = []
+        self.wallets = {}
+        self.links = {}        # {(src_id, dst_id): Link}
+        self._node_rngs = {}
+        self._topology = False  # set_topology를 호출했는지 여부 (아니면 모든 노드가 서로 이웃)
+
+        self._sim_base = config.SIM_TIME
+        self._wall_base = None
+        self._channels = {}    # {(src_id, dst_id): 전달 대기 asyncio.Queue}
+        self._tasks = []
+        self._mining_tasks = []
+        self.mining_executor = None
+        self.verify_executor = None
+
+        self.stats = {'blocks_mined': 0, 'messages': 0, 'bytes': 0,
+                      'backpressure_waits': 0, 'shed_relays': 0, 'offloaded_verifications': 0,
+                      'failed_messages': 0}
+        self.max_link_backlog = 0  # 링크 전달 큐에 쌓였던 최대 메시지 수
+
+    def create_genesis(self):
+        """
+        제네시스 블록 생성 (NetworkSimulator와 같은 블록)
+
+        Returns:
+            Block: 고정된 제네시스 블록
+        """
+        genesis = Block(
+            index=0,
+            timestamp=0,
+            transactions=[],
+            difficulty=config.DEFAULT_DIFFICULTY,
+            previous_hash="0",
+            miner_id="GENESIS"
+        )
+        genesis.mine_block()
+        return genesis.freeze()
+
+    # 구성
+    def add_node(self, node, processing_delay=0):
+        """
+        노드 추가
+
+        Args:
+            node: 추가할 Node (네트워크 공용 서명 캐시 사용)
+            processing_delay: 메시지당 추가 처리 시간 (시뮬레이션 초)
+
+        Returns:
+            NodeActor: 노드의 액터
+        """
+        node.sig_cache = self.sig_cache
+        actor = NodeActor(self, node, processing_delay)
+        self.actors.append(actor)
+        if not self._topology:
+            for other in self.actors:
+                other.peers = [peer for peer in self.actors if peer is not other]
+        return actor
+
+    def register_wallet(self, wallet):
+        """지갑을 네트워크에 등록"""
+        self.wallets[wallet.address] = wallet
+        print(f"[WALLET] 지갑 등록: {wallet.owner_name} ({wallet.address[:16]}...)")
+
+    def set_topology(self, kind="random_regular", degree=None, rewire_prob=None):
+        """
+        피어 연결 구성 (topology.build_topology, 이후 블록/거래는 이웃에게만 전달)
+
+        Returns:
+            dict: {node_id: [이웃 node_id]}
+        """
+        degree = config.PEER_DEGREE if degree is None else degree
+        rewire_prob = config.SMALL_WORLD_REWIRE_PROB if rewire_prob is None else rewire_prob
+        adjacency = build_topology(kind, len(self.actors), self.rng, degree, rewire_prob)
+        for actor, neighbors in zip(self.actors, adjacency):
+            actor.peers = [self.actors[j] for j in sorted(neighbors)]
+        self._topology = True
+        return {actor.node_id: [peer.node_id for peer in actor.peers] for actor in self.actors}
+
+    def set_link(self, src_id, dst_id, latency=None, bandwidth=None, symmetric=True):
+        """
+        두 노드 사이 링크의 지연/대역폭 설정 (NetworkSimulator.set_link와 같은 의미)
+
+        Returns:
+            Link: src -> dst 링크
+        """
+        latency = config.LINK_LATENCY if latency is None else latency
+        bandwidth = config.LINK_BANDWIDTH if bandwidth is None else bandwidth
+        link = self.links[(src_id, dst_id)] = Link(latency, bandwidth)
+        if symmetric:
+            self.links[(dst_id, src_id)] = Link(latency, bandwidth)
+        return link
+
+    def get_link(self, src, dst):
+        """src -> dst 액터 사이 링크 조회 (없으면 기본값 링크 생성)"""
+        link = self.links.get((src.node_id, dst.node_id))
+        if link is None:
+            link = self.set_link(src.node_id, dst.node_id, symmetric=False)
+        return link
+
+    def node_rng(self, node):
+        """노드별 채굴 간격 난수 (시드가 있으면 시드와 node_id로 결정)"""
+        rng = self._node_rngs.get(node.node_id)
+        if rng is None:
+            seed = f"{self.seed}:{node.node_id}" if self.seed is not None else self.rng.getrandbits(64)
+            rng = self._node_rngs[node.node_id] = random.Random(seed)
+        return rng
+
+    def get_actor(self, node_id):
+        """node_id의 액터 (없으면 None)"""
+        for actor in self.actors:
+            if actor.node_id == node_id:
+                return actor
+        return None
+
+    # 시간
+    def now(self):
+        """현재 시뮬레이션 시각 (실행 중이면 벽시계 경과 시간 × time_scale)"""
+        if self._wall_base is None:
+            return self._sim_base
+        return self._sim_base + (asyncio.get_running_loop().time() - self._wall_base) * self.time_scale
+
+    def tick(self):
+        """전역 시뮬레이션 시간을 현재 시각으로 맞추고 반환 (블록 검증의 미래 시간 제한 기준)"""
+        now = self.now()
+        if now > config.SIM_TIME:
+            config.SIM_TIME = now
+        return config.SIM_TIME
+
+    # 전송
+    def relay(self, actor, kind, item, exclude=None):
+        """actor의 이웃에게 블록/거래 전송 (exclude는 보낸 쪽이라 제외)"""
+        if kind == 'block':
+            size = item.serialized_size()
+        else:
+            size = len(encoding.encode_transaction(item))
+        for peer in actor.peers:
+            if peer is not exclude:
+                self.send(actor, peer, (kind, item, actor), size)
+
+    def send(self, src, dst, message, size):
+        """
+        링크로 메시지 전송 (송신자는 기다리지 않음 - 도착 시각 계산 후 링크 전달 큐에 넣음)
+        링크 전달 큐가 config.INBOX_HIGH_WATER만큼 밀렸거나 수신 노드가 밀려 있으면 거래는 보내지 않음
+
+        Args:
+            src: 송신 액터
+            dst: 수신 액터
+            message: (종류, 항목, 송신 액터)
+            size: 메시지 크기 (바이트)
+
+        Returns:
+            bool: 전송 여부 (거래를 버렸으면 False)
+        """
+        key = (src.node_id, dst.node_id)
+        channel = self._channels.get(key)
+        if channel is None:
+            channel = self._channels[key] = asyncio.Queue()
+            self._tasks.append(asyncio.create_task(self._deliver(channel, dst)))
+
+        if message[0] == 'tx' and (channel.qsize() >= config.INBOX_HIGH_WATER or dst.is_behind()):
+            # 느린 수신자 쪽으로 거래가 끝없이 쌓이지 않도록 버림 (블록은 항상 전달)
+            self.stats['shed_relays'] += 1
+            return False
+
+        arrival = self.get_link(src, dst).transmit(self.now(), size)
+        self.stats['messages'] += 1
+        self.stats['bytes'] += size
+        channel.put_nowait((arrival, message))
+        self.max_link_backlog = max(self.max_link_backlog, channel.qsize())
+        return True
+
+    async def _deliver(self, channel, dst):
+        """링크 전달 루프: 도착 시각까지 기다렸다가 수신함에 넣음 (수신함이 가득 차면 대기)"""
+        while True:
+            arrival, message = await channel.get()
+            try:
+                delay = (arrival - self.now()) / self.time_scale
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                await dst.post(message)
+            finally:
+                channel.task_done()
+
+    async def submit_transaction(self, sender_address, recipient_address, amount, origin=None):
+        """
+        서명된 거래를 한 노드의 수신함에 제출 (수신함이 가득 차면 자리가 날 때까지 대기)
+
+        Args:
+            sender_address: 송신자 주소
+            recipient_address: 수신자 주소
+            amount: 금액
+            origin: 거래를 받을 노드 ID (None이면 첫 번째 노드)
+
+        Returns:
+            dict: 제출한 거래 (송신자 지갑이 없으면 None)
+        """
+        sender_wallet = self.wallets.get(sender_address)
+        if not sender_wallet:
+            print(f"[ERROR] 오류: 송신자 지갑을 찾을 수 없습니다 ({sender_address[:16]}...)")
+            return None
+
+        actor = self.get_actor(origin) if origin is not None else self.actors[0]
+        nonce = actor.next_nonce(sender_address)
+        tx = freeze(sender_wallet.create_transaction(recipient_address, amount, nonce))
+        actor._queued_nonces[sender_address] = actor._queued_nonces.get(sender_address, 0) + 1
+        await actor.post(('tx', tx, None))
+        return tx
+
+    # 실행
+    async def start(self, mining=True):
+        """
+        수신함 / 실행기를 만들고 노드별 메시지 루프(와 채굴 루프) 시작
+
+        Args:
+            mining: 채굴 루프 실행 여부
+        """
+        self._sim_base = max(self._sim_base, config.SIM_TIME)
+        self._wall_base = asyncio.get_running_loop().time()
+        if mining:
+            # 해시 계산은 GIL을 놓지 않으므로 스레드가 아닌 워커 프로세스 (mining.get_mining_executor 공용 풀)
+            self.mining_executor = get_mining_executor(effective_mining_workers(config.RUNTIME_MINING_WORKERS))
+        self.verify_executor = get_verify_executor(config.SIG_VERIFY_EXECUTOR, max(1, config.SIG_VERIFY_WORKERS))
+
+        self._mining_tasks = []
+        for actor in self.actors:
+            actor.inbox = asyncio.Queue(maxsize=self.inbox_size)
+            self._tasks.append(asyncio.create_task(actor.serve()))
+            if mining:
+                self._mining_tasks.append(asyncio.create_task(actor.mine()))
+
+    async def drain(self):
+        """전달 중인 메시지와 수신함이 모두 빌 때까지 대기 (처리하면서 생긴 전송 포함)"""
+        while True:
+            await asyncio.gather(*(channel.join() for channel in list(self._channels.values())))
+            await asyncio.gather(*(actor.inbox.join() for actor in self.actors))
+            if all(channel.empty() for channel in self._channels.values()) and \
+                    all(actor.inbox.empty() for actor in self.actors):
+                return
+
+    async def stop_mining(self):
+        """채굴 루프 중단 (프로세스 풀에서 탐색 중인 구간은 끝까지 돌고 결과는 버려짐)"""
+        for task in self._mining_tasks:
+            task.cancel()
+        for actor in self.actors:
+            actor.node.abort_mining("런타임 종료")
+        await asyncio.gather(*self._mining_tasks, return_exceptions=True)
+        self._mining_tasks = []
+
+    async def stop(self):
+        """채굴 중단 -> 남은 메시지 처리 -> 루프 / 실행기 종료 (시각은 종료 시점에 고정)"""
+        await self.stop_mining()
+        await self.drain()
+        self._sim_base = self.tick()
+        self._wall_base = None
+
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._channels = {}
+        for actor in self.actors:
+            actor.inbox = None
+        if self.mining_executor is not None:
+            shutdown_mining_executor()
+            self.mining_executor = None
+
+    async def run(self, duration=20, mining=True):
+        """
+        duration(시뮬레이션 초) 동안 실행한 뒤 남은 메시지를 모두 처리하고 종료
+
+        Args:
+            duration: 실행 시간 (시뮬레이션 초, 벽시계로는 duration / time_scale초)
+            mining: 채굴 루프 실행 여부
+
+        Returns:
+            dict: 런타임 통계
+        """
+        print(f"[START] asyncio 런타임 시작 (노드 {len(self.actors)}개, t={self.now():g} -> "
+              f"{self.now() + duration:g}, 벽시계 {duration / self.time_scale:g}초)")
+        await self.start(mining)
+        try:
+            await asyncio.sleep(duration / self.time_scale)
+        finally:
+            await self.stop()
+
+        stats = self.stats
+        print(f"\n--- Time: {self.now():.3f} ---")
+        print(f"   Blocks={stats['blocks_mined']} | Msgs={stats['messages']} | Bytes={stats['bytes']} | "
+              f"Backpressure waits={stats['backpressure_waits']} | Shed relays={stats['shed_relays']} | Offloaded sigs={stats['offloaded_verifications']} | "
+              f"Failed msgs={stats['failed_messages']}")
+        self.print_network_status()
+        return dict(stats)
+
+    def run_simulation(self, duration=20, mining=True):
+        """run()을 새 이벤트 루프에서 실행 (동기 호출용)"""
+        return asyncio.run(self.run(duration, mining))
+
+    def print_network_status(self):
+        """현재 네트워크 상태 출력"""
+        for actor in self.actors:
+            node = actor.node
+            tip = node.get_tip_block()
+            print(f"   Node[{node.node_id}]: Tip={tip.hash[:6]}(H:{tip.index}, Work:{node.get_chain_work()}) | "
+                  f"Msgs={actor.handled} | Max backlog={actor.max_backlog}")
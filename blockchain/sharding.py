@@ -0,0 +1,528 @@
+"""
+샤드(Shard) 병렬 네트워크 시뮬레이션 모듈
+노드를 여러 워커 프로세스(샤드)에 나누어 이산 사건 시뮬레이션을 CPU 코어에 분산
+
+보수적(Conservative) 시간 동기화:
+- 모든 메시지는 최소 링크 지연(lookahead) 이상 뒤에 도착하므로
+  [T, T + lookahead) 시간 창 안의 이벤트는 샤드마다 독립적으로 처리해도 안전
+- 창이 끝나면(배리어) 샤드 간 메시지를 모아 도착 샤드에 전달하고 다음 창 진행
+- 이벤트 정렬 키와 채굴 난수가 노드별로 정해지므로(NetworkSimulator 참고)
+  같은 시드의 단일 프로세스 run_event_simulation과 노드별 결과가 동일
+"""
+
+import multiprocessing
+import os
+import random
+import sys
+import traceback
+from .node import Node
+from .network import NetworkSimulator, summarize_propagation
+from .crypto import set_reproducible, restore_reproducible
+from .frozen import freeze
+from .topology import build_topology
+from . import config, encoding
+
+
+def effective_shard_workers(cap, node_count):
+    """
+    실제 사용할 샤드 수 (설정 상한, CPU 수, 노드 수 중 가장 작은 값)
+
+    Args:
+        cap: 설정된 샤드 수 상한 (config.SHARD_WORKERS)
+        node_count: 노드 수
+
+    Returns:
+        int: 샤드 수
+    """
+    return max(1, min(cap, os.cpu_count() or 1, node_count))
+
+
+class RemotePeer:
+    """다른 샤드에 있는 노드 (node_id만 가진 대리 객체, 샤드 간 메시지에서 노드 참조로도 사용)"""
+
+    __slots__ = ('node_id',)
+
+    def __init__(self, node_id):
+        self.node_id = node_id
+
+    def __reduce__(self):
+        return (RemotePeer, (self.node_id,))
+
+    def __repr__(self):
+        return f"RemotePeer({self.node_id})"
+
+
+class ShardSimulator(NetworkSimulator):
+    """
+    워커 프로세스 안의 샤드 하나 (자기 노드만 실제로 보유)
+    다른 샤드 노드로 가는 메시지는 바로 예약하지 않고 모아 두었다가 배리어에서 전달
+    """
+
+    def __init__(self, spec):
+        """
+        Args:
+            spec: ShardedNetworkSimulator가 만든 샤드 설정
+                  {'seed', 'node_ids', 'local_ids', 'peers', 'links'}
+        """
+        super().__init__(seed=spec['seed'])
+
+        # 노드 인덱스는 전체 네트워크 기준 (이벤트 정렬 키가 단일 프로세스와 같아야 함)
+        for node_id in spec['node_ids']:
+            self._node_index[node_id] = len(self._node_index)
+
+        local_ids = set(spec['local_ids'])
+        self._members = {}
+        for node_id in spec['node_ids']:
+            if node_id in local_ids:
+                node = Node(node_id, self.genesis_block)
+                self.add_node(node)
+                self._members[node_id] = node
+            else:
+                self._members[node_id] = RemotePeer(node_id)
+        self._all_nodes = list(self._members.values())
+
+        if spec['peers'] is not None:
+            self.peers = {
+                node_id: [self._members[peer_id] for peer_id in spec['peers'][node_id]]
+                for node_id in spec['local_ids']
+            }
+        for (src_id, dst_id), (latency, bandwidth) in spec['links'].items():
+            self.set_link(src_id, dst_id, latency, bandwidth, symmetric=False)
+
+        self._outbound = []  # [(도착 시각, 정렬 키, dst_id, 동작 이름, 인자)]
+
+    def _network_nodes(self):
+        return self._all_nodes
+
+    def _dispatch(self, dst, arrival, key, action, args):
+        if not isinstance(dst, RemotePeer):
+            super()._dispatch(dst, arrival, key, action, args)
+            return
+        # 노드 참조는 node_id로 바꿔 전송 (받는 샤드가 자기 노드 / 대리 객체로 복원)
+        args = tuple(RemotePeer(arg.node_id) if isinstance(arg, (Node, RemotePeer)) else arg for arg in args)
+        self._outbound.append((arrival, key, dst.node_id, action.__name__, args))
+
+    def _deliver_block(self, node, block, sender=None):
+        # 다른 샤드에서 온 블록도 이웃의 getdata에 응답할 수 있도록 보관
+        if block.hash not in self._objects:
+            self._objects[block.hash] = ('block', block.freeze(), block.serialized_size())
+        super()._deliver_block(node, block, sender)
+
+    def _deliver_transaction(self, node, tx, sender=None):
+        txid = node.compute_txid(tx)
+        if txid not in self._objects:
+            self._objects[txid] = ('tx', tx, len(encoding.encode_transaction(tx)))
+        super()._deliver_transaction(node, tx, sender)
+
+    def _accept(self, inbound):
+        """다른 샤드에서 온 메시지를 이벤트로 예약"""
+        for arrival, key, dst_id, action_name, args in inbound:
+            args = tuple(self._members[arg.node_id] if isinstance(arg, RemotePeer) else arg for arg in args)
+            self.scheduler.schedule(arrival, getattr(self, action_name), *args, key=key)
+
+    def _drain(self):
+        outbound, self._outbound = self._outbound, []
+        return outbound
+
+    # 조정자(ShardedNetworkSimulator) 명령
+    def begin(self, start):
+        """실행 시작: 시각 맞춤 후 아직 채굴 이벤트가 없는 노드 예약"""
+        if self.scheduler.now < start:
+            self.scheduler.now = start
+        config.SIM_TIME = self.scheduler.now
+        for node in self.nodes:
+            if node.node_id not in self._mining_epoch:
+                self.schedule_mining(node)
+        return self._drain(), self.scheduler.next_time()
+
+    def run_window(self, end, final, inbound):
+        """
+        시간 창 하나 처리
+
+        Args:
+            end: 창 끝 시각
+            final: 마지막 창 여부 (True면 end 시각의 이벤트까지 처리)
+            inbound: 다른 샤드에서 온 메시지
+
+        Returns:
+            tuple: (다른 샤드로 보낼 메시지, 다음 이벤트 시각, 처리한 이벤트 수)
+        """
+        self._accept(inbound)
+        if final:
+            count = self.scheduler.run(until=end)
+        else:
+            count = self.scheduler.run_before(end)
+        return self._drain(), self.scheduler.next_time(), count
+
+    def finish(self, until, inbound):
+        """실행 종료: 남은 메시지 예약 후 시각을 until로 이동"""
+        self._accept(inbound)
+        self.scheduler.now = max(self.scheduler.now, until)
+        config.SIM_TIME = self.scheduler.now
+        return self.report()
+
+    def next_nonce(self, node_id, sender_address):
+        """node_id 노드 기준 다음 nonce (확정 nonce + 멤풀 대기 거래 수)"""
+        node = self._members[node_id]
+        return node.get_confirmed_nonce(sender_address) + 1 + len(node.mempool.sender_items(sender_address))
+
+    def submit(self, node_id, tx):
+        """서명된 거래를 노드에 추가하고 전파 시작"""
+        node = self._members[node_id]
+        node.add_transaction(tx)
+        self.relay_transaction(node, tx)
+        return self._drain()
+
+    def report(self):
+        """샤드 실행 결과 (노드 요약, 메시지 카운터, 처리 이벤트 수, 전파 기록)"""
+        return {
+            'nodes': self.get_node_summaries(),
+            'event_stats': dict(self.event_stats),
+            'processed': self.scheduler.processed,
+            'propagation': self._propagation,
+        }
+
+
+class ShardError(RuntimeError):
+    """샤드 워커 프로세스에서 발생한 예외 (워커 쪽 traceback 포함)"""
+
+
+def _shard_main(conn, spec, settings):
+    """워커 프로세스: 설정을 맞추고 샤드를 만든 뒤 조정자 명령을 차례로 처리"""
+    for name, value in settings.items():
+        setattr(config, name, value)
+    shard = ShardSimulator(spec)
+
+    while True:
+        command, args = conn.recv()
+        if command == 'close':
+            break
+        try:
+            result = getattr(shard, command)(*args)
+        except Exception:
+            result = ShardError(traceback.format_exc())
+        conn.send(result)
+        sys.stdout.flush()
+    conn.close()
+
+
+class ShardedNetworkSimulator:
+    """
+    샤드 병렬 이산 사건 네트워크 시뮬레이터
+    노드를 연속 구간으로 나누어 워커 프로세스에 배치하고, 최소 링크 지연 단위 시간 창으로 동기화
+    (API와 결과는 같은 시드의 NetworkSimulator.run_event_simulation과 동일, 노드는 ID로 추가)
+    """
+
+    def __init__(self, seed=None, shards=None):
+        """
+        Args:
+            seed: 재현 시드 (NetworkSimulator와 같은 의미, 같은 시드면 단일 프로세스 실행과 결과 동일)
+            shards: 샤드(워커 프로세스) 수 (None이면 config.SHARD_WORKERS를 CPU 수로 제한, 노드 수로도 제한)
+        """
+        self.seed = config.REPRODUCIBLE_SEED if seed is None else seed
+        self._saved_reproducible = set_reproducible(self.seed)  # close()에서 복원
+
+        # 토폴로지 난수 (NetworkSimulator.rng와 같은 순서로 사용)
+        self.rng = random.Random(self.seed)
+
+        self.requested_shards = shards
+        self.node_ids = []
+        self.wallets = {}
+        self.peers = None    # {node_id: [이웃 node_id]}
+        self.links = {}      # {(src_id, dst_id): (지연, 대역폭)}
+        self.now = config.SIM_TIME
+
+        self._workers = None  # [(프로세스, 연결)]
+        self._shard_of = {}   # {node_id: 샤드 번호}
+        self._pending = None  # 샤드별 아직 전달하지 않은 메시지
+        self._reports = None  # 샤드별 마지막 실행 결과
+
+        self.windows = 0               # 동기화 배리어(시간 창) 수
+        self.cross_shard_messages = 0  # 샤드 사이로 전달한 메시지 수
+
+    def add_node(self, node_id):
+        """
+        노드 추가 (노드는 실행 시작 시 워커 프로세스에서 생성)
+
+        Args:
+            node_id: 노드 ID
+        """
+        if self._workers is not None:
+            raise RuntimeError("샤드 실행이 시작된 뒤에는 노드를 추가할 수 없음")
+        self.node_ids.append(node_id)
+
+    def register_wallet(self, wallet):
+        """지갑을 네트워크에 등록 (서명은 조정자 프로세스에서 수행)"""
+        self.wallets[wallet.address] = wallet
+        print(f"[WALLET] 지갑 등록: {wallet.owner_name} ({wallet.address[:16]}...)")
+
+    def set_topology(self, kind="random_regular", degree=None, rewire_prob=None):
+        """
+        피어 연결 구성 (NetworkSimulator.set_topology와 같은 그래프)
+
+        Returns:
+            dict: {node_id: [이웃 node_id]} (kind가 None이면 None)
+        """
+        if self._workers is not None:
+            raise RuntimeError("샤드 실행이 시작된 뒤에는 토폴로지를 바꿀 수 없음")
+        if kind is None:
+            self.peers = None
+            return None
+
+        degree = config.PEER_DEGREE if degree is None else degree
+        rewire_prob = config.SMALL_WORLD_REWIRE_PROB if rewire_prob is None else rewire_prob
+        adjacency = build_topology(kind, len(self.node_ids), self.rng, degree, rewire_prob)
+
+        self.peers = {
+            node_id: [self.node_ids[j] for j in sorted(neighbors)]
+            for node_id, neighbors in zip(self.node_ids, adjacency)
+        }
+        edges = sum(len(neighbors) for neighbors in adjacency) // 2
+        print(f"[TOPOLOGY] {kind}: 노드 {len(self.node_ids)}개, 연결 {edges}개 "
+              f"(평균 이웃 {2 * edges / max(1, len(self.node_ids)):.1f})")
+        return self.peers
+
+    def set_link(self, src_id, dst_id, latency=None, bandwidth=None, symmetric=True):
+        """두 노드 사이 링크의 지연/대역폭 설정 (NetworkSimulator.set_link와 같은 의미)"""
+        if self._workers is not None:
+            raise RuntimeError("샤드 실행이 시작된 뒤에는 링크를 바꿀 수 없음")
+        latency = config.LINK_LATENCY if latency is None else latency
+        bandwidth = config.LINK_BANDWIDTH if bandwidth is None else bandwidth
+        self.links[(src_id, dst_id)] = (latency, bandwidth)
+        if symmetric:
+            self.links[(dst_id, src_id)] = (latency, bandwidth)
+
+    def lookahead(self):
+        """
+        시간 창 크기 = 가장 짧은 링크 지연 (이보다 빨리 도착하는 샤드 간 메시지는 없음)
+
+        Returns:
+            float: lookahead (초)
+        """
+        latency = min([config.LINK_LATENCY] + [latency for latency, _ in self.links.values()])
+        if latency <= 0:
+            raise ValueError("샤드 실행에는 0보다 큰 링크 지연이 필요 (lookahead 없음)")
+        return latency
+
+    @property
+    def shard_count(self):
+        """샤드 수"""
+        if self._workers is not None:
+            return len(self._workers)
+        if self.requested_shards is not None:
+            return max(1, min(self.requested_shards, len(self.node_ids)))
+        return effective_shard_workers(config.SHARD_WORKERS, len(self.node_ids))
+
+    def start(self):
+        """워커 프로세스 시작 (노드를 연속 구간으로 나누어 배치, 이미 시작했으면 무시)"""
+        if self._workers is not None:
+            return
+        if not self.node_ids:
+            raise RuntimeError("노드가 없음")
+
+        shards = self.shard_count
+        count = len(self.node_ids)
+        local = [[] for _ in range(shards)]
+        for i, node_id in enumerate(self.node_ids):
+            shard = i * shards // count
+            local[shard].append(node_id)
+            self._shard_of[node_id] = shard
+
+        settings = {name: value for name, value in vars(config).items() if name.isupper()}
+        sys.stdout.flush()  # fork 시 버퍼 중복 출력 방지
+
+        self._workers = []
+        for shard in range(shards):
+            spec = {
+                'seed': self.seed,
+                'node_ids': self.node_ids,
+                'local_ids': local[shard],
+                'peers': None if self.peers is None else {node_id: self.peers[node_id] for node_id in local[shard]},
+                'links': {pair: value for pair, value in self.links.items()
+                          if self._shard_of.get(pair[0]) == shard},
+            }
+            parent_conn, child_conn = multiprocessing.Pipe()
+            process = multiprocessing.Process(target=_shard_main, args=(child_conn, spec, settings), daemon=True)
+            process.start()
+            child_conn.close()
+            self._workers.append((process, parent_conn))
+
+        self._pending = [[] for _ in range(shards)]
+        print(f"[SHARD] 샤드 {shards}개 시작: " + ", ".join(f"#{i}={len(ids)}노드" for i, ids in enumerate(local)))
+
+    def close(self):
+        """워커 프로세스 종료 (생성 시 바꾼 재현 모드 설정 복원)"""
+        if self._saved_reproducible is not None:
+            restore_reproducible(self._saved_reproducible)
+            self._saved_reproducible = None
+        if self._workers is None:
+            return
+        for process, conn in self._workers:
+            conn.send(('close', ()))
+            conn.close()
+        for process, _ in self._workers:
+            process.join()
+        self._workers = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _call(self, shard, command, *args):
+        """샤드 하나에 명령을 보내고 결과 반환"""
+        conn = self._workers[shard][1]
+        conn.send((command, args))
+        return self._result(conn.recv())
+
+    def _call_all(self, command, args_per_shard):
+        """모든 샤드에 명령을 보내고(동시 실행) 결과를 샤드 순서로 반환"""
+        for (_, conn), args in zip(self._workers, args_per_shard):
+            conn.send((command, args))
+        return [self._result(conn.recv()) for _, conn in self._workers]
+
+    @staticmethod
+    def _result(result):
+        if isinstance(result, ShardError):
+            raise result
+        return result
+
+    def _route(self, outbound):
+        """샤드 간 메시지를 도착 노드의 샤드 대기열에 배정"""
+        for message in outbound:
+            self._pending[self._shard_of[message[2]]].append(message)
+        self.cross_shard_messages += len(outbound)
+
+    def _take_pending(self):
+        pending, self._pending = self._pending, [[] for _ in self._workers]
+        return pending
+
+    def run_event_simulation(self, duration=20):
+        """
+        샤드 병렬 이산 사건 시뮬레이션 실행
+        매 시간 창 [T, T + lookahead)를 모든 샤드가 동시에 처리한 뒤 배리어에서 샤드 간 메시지 교환
+        (T는 모든 샤드와 전달 대기 메시지 중 가장 이른 이벤트 시각 - 빈 구간은 건너뜀)
+
+        Args:
+            duration: 진행할 시뮬레이션 시간 (초)
+
+        Returns:
+            int: 처리한 이벤트 수 (모든 샤드 합계)
+        """
+        self.start()
+        lookahead = self.lookahead()
+        self.now = max(self.now, config.SIM_TIME)
+        until = self.now + duration
+
+        print(f"[START] 샤드 병렬 이산 사건 시뮬레이션 시작 (샤드 {len(self._workers)}개, "
+              f"lookahead={lookahead:g}s, t={self.now:g} -> {until:g})")
+
+        next_times = []
+        for outbound, next_time in self._call_all('begin', [(self.now,)] * len(self._workers)):
+            self._route(outbound)
+            next_times.append(next_time)
+
+        processed = 0
+        while True:
+            times = [t for t in next_times if t is not None]
+            times += [message[0] for messages in self._pending for message in messages]
+            if not times or min(times) > until:
+                break
+
+            end = min(times) + lookahead
+            final = end > until
+            window = (until, True) if final else (end, False)
+            replies = self._call_all('run_window', [window + (inbound,) for inbound in self._take_pending()])
+            self.windows += 1
+
+            next_times = []
+            for outbound, next_time, count in replies:
+                self._route(outbound)
+                next_times.append(next_time)
+                processed += count
+            if final:
+                break
+
+        self._reports = self._call_all('finish', [(until, inbound) for inbound in self._take_pending()])
+        self.now = config.SIM_TIME = until
+
+        stats = self.event_stats
+        print(f"\n--- Time: {self.now:g} ({processed} events, {self.windows} windows, "
+              f"cross-shard msgs={self.cross_shard_messages}) ---")
+        print(f"   Blocks={stats['blocks_mined']} | Block msgs={stats['block_messages']} | "
+              f"Tx msgs={stats['tx_messages']} | Inv msgs={stats['inv_messages']} | Bytes={stats['bytes']}")
+        return processed
+
+    def submit_transaction(self, sender_address, recipient_address, amount, origin=None):
+        """
+        서명된 트랜잭션을 한 노드에 제출하고 전파 (NetworkSimulator.submit_transaction과 같은 의미)
+
+        Args:
+            sender_address: 송신자 주소
+            recipient_address: 수신자 주소
+            amount: 금액
+            origin: 트랜잭션을 받을 노드 ID (None이면 첫 번째 노드)
+
+        Returns:
+            dict: 제출한 트랜잭션 (송신자 지갑이 없으면 None)
+        """
+        sender_wallet = self.wallets.get(sender_address)
+        if not sender_wallet:
+            print(f"[ERROR] 오류: 송신자 지갑을 찾을 수 없습니다 ({sender_address[:16]}...)")
+            return None
+
+        self.start()
+        origin = origin or self.node_ids[0]
+        shard = self._shard_of[origin]
+
+        next_nonce = self._call(shard, 'next_nonce', origin, sender_address)
+        tx = freeze(sender_wallet.create_transaction(recipient_address, amount, next_nonce))
+        self._route(self._call(shard, 'submit', origin, tx))
+        self._reports = None  # 노드 상태가 바뀌었으므로 다음 조회 때 다시 수집
+        return tx
+
+    def _collect(self):
+        if self._reports is None:
+            self._reports = self._call_all('report', [()] * len(self._workers))
+        return self._reports
+
+    @property
+    def event_stats(self):
+        """모든 샤드의 메시지 카운터 합계"""
+        total = {}
+        for report in self._collect():
+            for name, value in report['event_stats'].items():
+                total[name] = total.get(name, 0) + value
+        return total
+
+    @property
+    def processed(self):
+        """모든 샤드가 처리한 이벤트 수 합계"""
+        return sum(report['processed'] for report in self._collect())
+
+    def get_node_summaries(self):
+        """노드별 체인 상태 요약 (NetworkSimulator.get_node_summaries와 같은 형식, 노드 추가 순서)"""
+        merged = {}
+        for report in self._collect():
+            merged.update(report['nodes'])
+        return {node_id: merged[node_id] for node_id in self.node_ids}
+
+    def get_propagation_stats(self, kind='block'):
+        """전파 지연 / 메시지 오버헤드 통계 (NetworkSimulator.get_propagation_stats와 같은 형식)"""
+        propagation = {}
+        for report in self._collect():
+            for item_hash, record in report['propagation'].items():
+                merged = propagation.setdefault(
+                    item_hash, {'kind': record['kind'], 'origin_time': None, 'arrivals': []}
+                )
+                if record['origin_time'] is not None:
+                    merged['origin_time'] = record['origin_time']
+                merged['arrivals'].extend(record['arrivals'])
+        return summarize_propagation(propagation, len(self.node_ids), self.event_stats, kind)
+
+    def print_network_status(self):
+        """현재 네트워크 상태 출력"""
+        for node_id, summary in self.get_node_summaries().items():
+            print(f"   Node[{node_id}]: Tip={summary['tip'][:6]}(H:{summary['height']}, "
+                  f"Work:{summary['chain_work']}) | Bal={summary['balance']}")
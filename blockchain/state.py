@@ -0,0 +1,90 @@
+"""
+상태 스냅샷 모듈
+블록별 계정 상태(잔액/Nonce)를 Copy-on-Write로 공유하고 LRU 캐시로 보관
+"""
+
+from .lru import LRUCache
+
+
+class StateSnapshot:
+    """
+    부모 스냅샷을 공유하는 Copy-on-Write 계정 상태
+    자식은 자신이 바꾼 계정만 보관하고 나머지는 부모에서 조회함
+    (계정 객체는 공유되므로 수정하지 말고 새 dict로 교체해야 함)
+    """
+
+    # 부모 체인이 이 깊이를 넘으면 평탄화 (조회 비용 상한)
+    MAX_DEPTH = 16
+
+    __slots__ = ('_accounts', '_parent', 'depth')
+
+    def __init__(self, accounts=None, parent=None):
+        """
+        Args:
+            accounts: 이 스냅샷이 직접 보관할 계정 딕셔너리
+            parent: 공유할 부모 스냅샷 (없으면 None)
+        """
+        self._accounts = accounts if accounts is not None else {}
+        self._parent = parent
+        self.depth = parent.depth + 1 if parent is not None else 0
+
+    def get(self, address, default=None):
+        """계정 조회 (자신 -> 부모 순서)"""
+        snapshot = self
+        while snapshot is not None:
+            if address in snapshot._accounts:
+                return snapshot._accounts[address]
+            snapshot = snapshot._parent
+        return default
+
+    def __getitem__(self, address):
+        account = self.get(address)
+        if account is None:
+            raise KeyError(address)
+        return account
+
+    def __setitem__(self, address, account):
+        # 쓰기는 항상 자신의 계층에만 기록 (부모는 불변)
+        self._accounts[address] = account
+
+    def __contains__(self, address):
+        return self.get(address) is not None
+
+    def child(self):
+        """
+        이 스냅샷을 부모로 하는 빈 자식 스냅샷 생성 (O(1), 깊이 초과 시 평탄화)
+
+        Returns:
+            StateSnapshot: 자식 스냅샷
+        """
+        if self.depth >= self.MAX_DEPTH:
+            return StateSnapshot(parent=StateSnapshot(self.to_dict()))
+        return StateSnapshot(parent=self)
+
+    def to_dict(self):
+        """
+        부모 체인을 합쳐 일반 딕셔너리로 변환
+
+        Returns:
+            dict: {address: account}
+        """
+        layers = []
+        snapshot = self
+        while snapshot is not None:
+            layers.append(snapshot._accounts)
+            snapshot = snapshot._parent
+
+        merged = {}
+        for accounts in reversed(layers):
+            merged.update(accounts)
+        return merged
+
+    def __repr__(self):
+        return f"StateSnapshot(depth={self.depth}, own={len(self._accounts)})"
+
+
+class StateCache(LRUCache):
+    """
+    블록 해시별 상태 스냅샷 LRU 캐시 (lru.LRUCache)
+    key: 블록 해시, value: StateSnapshot (저장 후에는 수정하지 않음)
+    """
@@ -415,7 +415,7 @@ def test_5_double_spend_reorg():
     config.SIM_TIME = 3
     block3_node2 = node2.try_mine()
     node2.receive_block(block3_node2)
-    print(f"   Node2 총 작업량: {node2.get_tip_block().total_work}")
+    print(f"   Node2 총 작업량: {node2.get_chain_work()}")
 
     # Node1에 Node2의 블록들 전파 → Reorg 발생
     print("\n4. Reorg 발생 (Node1이 Node2 체인 수용)")
@@ -527,8 +527,8 @@ def test_6_deep_reorg():
     block4_alt = node2.try_mine()
     node2.receive_block(block4_alt)
 
-    print(f"   Alt chain 총 작업량: {node2.get_tip_block().total_work}")
-    print(f"   Old chain 총 작업량: {node.get_tip_block().total_work}")
+    print(f"   Alt chain 총 작업량: {node2.get_chain_work()}")
+    print(f"   Old chain 총 작업량: {node.get_chain_work()}")
 
     # Reorg 발생
     print("\n3. Deep Reorg 발생")
@@ -600,7 +600,6 @@ def test_7_orphan_blocks():
         previous_hash=block2.hash,
         miner_id=wallet_alice.address
     )
-    block3.total_work = block2.total_work + block3.block_work
     block3.mine_block()
 
     # block3을 먼저 수신 (부모 block2 없음)
@@ -844,7 +843,7 @@ def test_10_mempool_cleanup_after_reorg():
     block3_alt = node2.try_mine()
     node2.receive_block(block3_alt)
 
-    print(f"   Alt chain 작업량: {node2.get_tip_block().total_work}")
+    print(f"   Alt chain 작업량: {node2.get_chain_work()}")
 
     # Reorg 발생
     print("\n5. Reorg 발생")
@@ -872,7 +871,7 @@ def test_10_mempool_cleanup_after_reorg():
 
     # tx2만 남아야 함 (nonce 2)
     assert len(node.mempool) == 1, "Only tx2 should remain in mempool"
-    assert node.mempool[0]['body']['nonce'] == 2, "Remaining tx should have nonce 2"
+    assert list(node.mempool)[0]['body']['nonce'] == 2, "Remaining tx should have nonce 2"
 
     # 추가 검증: 남은 tx의 서명도 유효한지
     for tx in node.mempool:
@@ -0,0 +1,247 @@
+"""
+네트워크 토폴로지 모듈
+노드 인덱스 0..n-1 사이의 무방향 피어 그래프 생성 (인접 집합 리스트)
+- full_mesh: 모든 노드 쌍 연결 (기준선)
+- random_regular: 모든 노드의 차수가 같은 무작위 그래프
+- small_world: Watts-Strogatz (고리 격자 + 무작위 재연결)
+- scale_free: Barabasi-Albert (선호적 연결, 허브 노드 발생)
+build_topology는 연결 그래프만 반환 (다시 생성하거나 연결 요소 사이에 다리 연결 추가)
+"""
+
+
+TOPOLOGIES = ("full_mesh", "random_regular", "small_world", "scale_free")
+
+
+def full_mesh(n):
+    """
+    완전 그래프
+
+    Args:
+        n: 노드 수
+
+    Returns:
+        list: 노드별 이웃 인덱스 집합
+    """
+    return [set(range(n)) - {i} for i in range(n)]
+
+
+def random_regular(n, degree, rng, max_attempts=100):
+    """
+    무작위 정규 그래프 (Pairing 모델: 노드별 degree개의 연결 끝을 섞어 짝지음)
+    자기 연결/중복 연결이 된 짝만 다시 섞어 짝짓고, 막히면 처음부터 다시 시도
+
+    Args:
+        n: 노드 수
+        degree: 노드별 이웃 수 (n * degree는 짝수, n - 1보다 크면 n - 1로 제한)
+        rng: random.Random 인스턴스
+        max_attempts: 최대 재시도 횟수
+
+    Returns:
+        list: 노드별 이웃 인덱스 집합
+    """
+    degree = min(degree, max(0, n - 1))
+    if degree < 0 or (n * degree) % 2:
+        raise ValueError(f"정규 그래프를 만들 수 없음: n={n}, degree={degree}")
+
+    for _ in range(max_attempts):
+        adjacency = [set() for _ in range(n)]
+        stubs = [node for node in range(n) for _ in range(degree)]
+
+        for _ in range(max_attempts):
+            rng.shuffle(stubs)
+            leftover = []
+            for i in range(0, len(stubs), 2):
+                u, v = stubs[i], stubs[i + 1]
+                if u == v or v in adjacency[u]:
+                    leftover += (u, v)
+                else:
+                    adjacency[u].add(v)
+                    adjacency[v].add(u)
+            if not leftover:
+                return adjacency
+            if len(leftover) == len(stubs):
+                break  # 남은 연결 끝으로는 더 이상 짝을 지을 수 없음
+            stubs = leftover
+
+    raise ValueError(f"정규 그래프 생성 실패: n={n}, degree={degree}")
+
+
+def small_world(n, degree, rewire_prob, rng):
+    """
+    Watts-Strogatz 작은 세상 그래프
+    각 노드를 고리에서 양쪽 degree/2개 이웃과 연결한 뒤, 각 연결을 rewire_prob 확률로 무작위 노드에 재연결
+
+    Args:
+        n: 노드 수
+        degree: 고리 격자의 이웃 수 (짝수, n - 1 이하의 가장 큰 짝수로 제한)
+        rewire_prob: 재연결 확률 (0이면 격자, 1이면 무작위 그래프에 가까움)
+        rng: random.Random 인스턴스
+
+    Returns:
+        list: 노드별 이웃 인덱스 집합
+    """
+    if degree % 2 or degree < 0:
+        raise ValueError(f"작은 세상 그래프를 만들 수 없음: n={n}, degree={degree}")
+    degree = min(degree, max(0, n - 1 - (n - 1) % 2))
+
+    adjacency = [set() for _ in range(n)]
+    for u in range(n):
+        for offset in range(1, degree // 2 + 1):
+            v = (u + offset) % n
+            adjacency[u].add(v)
+            adjacency[v].add(u)
+
+    for offset in range(1, degree // 2 + 1):
+        for u in range(n):
+            v = (u + offset) % n
+            if v not in adjacency[u] or rng.random() >= rewire_prob:
+                continue
+            if len(adjacency[u]) >= n - 1:
+                continue  # 이미 모든 노드와 연결됨
+            w = rng.randrange(n)
+            while w == u or w in adjacency[u]:
+                w = rng.randrange(n)
+            adjacency[u].discard(v)
+            adjacency[v].discard(u)
+            adjacency[u].add(w)
+            adjacency[w].add(u)
+    return adjacency
+
+
+def scale_free(n, links, rng):
+    """
+    Barabasi-Albert 척도 없는 그래프
+    links + 1개 노드의 완전 그래프에서 시작해, 새 노드마다 차수에 비례한 확률로 기존 노드 links개와 연결
+
+    Args:
+        n: 노드 수
+        links: 새 노드당 연결 수 (평균 차수는 약 2 * links, n - 1보다 크면 n - 1로 제한)
+        rng: random.Random 인스턴스
+
+    Returns:
+        list: 노드별 이웃 인덱스 집합
+    """
+    if links < 1:
+        raise ValueError(f"척도 없는 그래프를 만들 수 없음: n={n}, links={links}")
+    links = min(links, max(0, n - 1))
+
+    adjacency = [set() for _ in range(n)]
+    endpoints = []  # 연결 끝 목록 (노드가 차수만큼 등장 -> 균등 추출이 곧 선호적 연결)
+    for u in range(links + 1):
+        for v in range(u + 1, links + 1):
+            adjacency[u].add(v)
+            adjacency[v].add(u)
+            endpoints += (u, v)
+
+    for u in range(links + 1, n):
+        targets = set()
+        while len(targets) < links:
+            targets.add(endpoints[rng.randrange(len(endpoints))])
+        for v in sorted(targets):
+            adjacency[u].add(v)
+            adjacency[v].add(u)
+            endpoints += (u, v)
+    return adjacency
+
+
+def build_topology(kind, n, rng, degree=8, rewire_prob=0.1, max_attempts=10):
+    """
+    이름으로 토폴로지 생성 (항상 연결 그래프)
+    연결되지 않은 그래프가 나오면 같은 rng의 다음 난수로 다시 생성하고,
+    max_attempts번 모두 실패하면 연결 요소 사이에 다리 연결을 추가 (전파 통계가 분리된 네트워크를 재지 않도록)
+
+    Args:
+        kind: TOPOLOGIES 중 하나
+        n: 노드 수
+        rng: random.Random 인스턴스
+        degree: 목표 평균 차수 (노드 수보다 크면 n - 1로 제한)
+        rewire_prob: small_world 재연결 확률
+        max_attempts: 연결 그래프가 나올 때까지 다시 생성할 최대 횟수
+
+    Returns:
+        list: 노드별 이웃 인덱스 집합
+    """
+    if kind not in TOPOLOGIES:
+        raise ValueError(f"알 수 없는 토폴로지: {kind} (지원: {', '.join(TOPOLOGIES)})")
+
+    degree = max(0, min(degree, n - 1))
+    for _ in range(max_attempts):
+        adjacency = _generate(kind, n, rng, degree, rewire_prob)
+        if is_connected(adjacency):
+            return adjacency
+    return connect_components(adjacency, rng)
+
+
+def _generate(kind, n, rng, degree, rewire_prob):
+    if kind == "full_mesh":
+        return full_mesh(n)
+    if kind == "random_regular":
+        if (n * degree) % 2:
+            degree -= 1
+        return random_regular(n, degree, rng)
+    if kind == "small_world":
+        return small_world(n, degree - degree % 2, rewire_prob, rng)
+    return scale_free(n, max(1, degree // 2), rng)
+
+
+def connected_components(adjacency):
+    """
+    연결 요소 목록 (BFS, 각 요소는 가장 작은 노드 인덱스 순)
+
+    Args:
+        adjacency: 노드별 이웃 인덱스 집합
+
+    Returns:
+        list: 연결 요소별 노드 인덱스 리스트 (정렬됨)
+    """
+    seen = set()
+    components = []
+    for start in range(len(adjacency)):
+        if start in seen:
+            continue
+        seen.add(start)
+        component = [start]
+        frontier = [start]
+        while frontier:
+            nxt = []
+            for u in frontier:
+                for v in adjacency[u]:
+                    if v not in seen:
+                        seen.add(v)
+                        nxt.append(v)
+            component += nxt
+            frontier = nxt
+        components.append(sorted(component))
+    return components
+
+
+def connect_components(adjacency, rng):
+    """
+    이웃한 연결 요소마다 무작위 노드 한 쌍을 이어 연결 그래프로 만듦 (adjacency를 직접 수정)
+
+    Args:
+        adjacency: 노드별 이웃 인덱스 집합
+        rng: random.Random 인스턴스
+
+    Returns:
+        list: 연결된 adjacency
+    """
+    components = connected_components(adjacency)
+    for left, right in zip(components, components[1:]):
+        u, v = rng.choice(left), rng.choice(right)
+        adjacency[u].add(v)
+        adjacency[v].add(u)
+    return adjacency
+
+
+def is_connected(adjacency):
+    """
+    그래프 연결 여부 (BFS)
+
+    Args:
+        adjacency: 노드별 이웃 인덱스 집합
+
+    Returns:
+        bool: 모든 노드가 하나의 연결 요소인지 여부
+    """
+    return len(connected_components(adjacency)) <= 1
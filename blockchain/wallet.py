@@ -4,7 +4,10 @@
 """
 
 import json
-from .crypto import CryptoUtils
+from itertools import repeat
+from . import config
+from .crypto import CryptoUtils, get_sign_executor, is_deterministic_signing
+from .encoding import tx_body_bytes
 
 
 class Wallet:
@@ -13,15 +16,18 @@ class Wallet:
     개인키를 안전하게 보관하고 트랜잭션에 서명하는 기능 제공
     """
 
-    def __init__(self, owner_name=None):
+    def __init__(self, owner_name=None, key_pair=None):
         """
         새 지갑 생성
 
         Args:
             owner_name: 지갑 소유자 이름 (선택적)
+            key_pair: 미리 생성한 (private_key, public_key) (없으면 새로 생성)
         """
         # 새로운 키 쌍 생성
-        self.private_key, self.public_key = CryptoUtils.generate_key_pair()
+        if key_pair is None:
+            key_pair = CryptoUtils.generate_key_pair()
+        self.private_key, self.public_key = key_pair
 
         # 공개키에서 주소 생성
         self.address = CryptoUtils.public_key_to_address(self.public_key)
@@ -29,6 +35,26 @@ class Wallet:
         # 소유자 이름 (디버깅/표시용)
         self.owner_name = owner_name if owner_name else self.address[:8]
 
+        # 트랜잭션에 넣는 압축 공개키 16진수 (처음 필요할 때 한 번만 직렬화)
+        self._public_key_hex = None
+
+    @classmethod
+    def create_wallets(cls, count, name_prefix=None):
+        """
+        지갑 여러 개 생성 (부하 테스트용)
+
+        Args:
+            count: 생성할 지갑 수
+            name_prefix: 소유자 이름 접두사 (주어지면 "접두사0", "접두사1", ...)
+
+        Returns:
+            list: 생성된 지갑 리스트
+        """
+        return [
+            cls(f"{name_prefix}{i}" if name_prefix else None, key_pair=key_pair)
+            for i, key_pair in enumerate(CryptoUtils.generate_key_pairs(count))
+        ]
+
     @classmethod
     def from_private_key(cls, private_key_bytes, owner_name=None):
         """
@@ -41,12 +67,8 @@ class Wallet:
         Returns:
             Wallet: 복원된 지갑 객체
         """
-        wallet = cls.__new__(cls)
-        wallet.private_key = CryptoUtils.bytes_to_private_key(private_key_bytes)
-        wallet.public_key = wallet.private_key.public_key()
-        wallet.address = CryptoUtils.public_key_to_address(wallet.public_key)
-        wallet.owner_name = owner_name if owner_name else wallet.address[:8]
-        return wallet
+        private_key = CryptoUtils.bytes_to_private_key(private_key_bytes)
+        return cls(owner_name, key_pair=(private_key, private_key.public_key()))
 
     def get_address(self):
         """
@@ -57,23 +79,35 @@ class Wallet:
         """
         return self.address
 
-    def get_public_key_bytes(self):
+    def get_public_key_bytes(self, compressed=False):
         """
         공개키를 바이트로 반환
 
+        Args:
+            compressed: True면 SEC1 압축 형식(33바이트), False면 PEM 형식
+
         Returns:
             bytes: 직렬화된 공개키
         """
+        if compressed:
+            return CryptoUtils.public_key_to_compressed_bytes(self.public_key)
         return CryptoUtils.public_key_to_bytes(self.public_key)
 
-    def get_public_key_hex(self):
+    def get_public_key_hex(self, compressed=False):
         """
         공개키를 16진수 문자열로 반환
 
+        Args:
+            compressed: True면 SEC1 압축 형식(66자), False면 PEM 형식
+
         Returns:
             str: 16진수 공개키
         """
-        return self.get_public_key_bytes().hex()
+        if not compressed:
+            return self.get_public_key_bytes().hex()
+        if self._public_key_hex is None:
+            self._public_key_hex = self.get_public_key_bytes(compressed=True).hex()
+        return self._public_key_hex
 
     def sign_transaction(self, tx_body):
         """
@@ -85,7 +119,7 @@ class Wallet:
         Returns:
             str: 서명 (16진수 문자열)
         """
-        signature = CryptoUtils.sign_message(self.private_key, tx_body)
+        signature = CryptoUtils.sign_message(self.private_key, tx_body_bytes(tx_body))
         return CryptoUtils.signature_to_hex(signature)
 
     def create_transaction(self, recipient, amount, nonce):
@@ -111,15 +145,59 @@ class Wallet:
         # 서명 생성
         signature = self.sign_transaction(tx_body)
 
-        # 공개키도 포함 (검증을 위해)
+        # 공개키도 포함 (검증을 위해, SEC1 압축 형식 33바이트)
         transaction = {
             "body": tx_body,
             "signature": signature,
-            "public_key": self.get_public_key_hex()
+            "public_key": self.get_public_key_hex(compressed=True)
         }
 
         return transaction
 
+    def create_transactions(self, batch, workers=None):
+        """
+        트랜잭션 여러 개를 한 번에 생성 및 서명 (부하 테스트용)
+        워커 수가 2 이상이고 배치가 SIGN_BATCH_MIN 이상이면 프로세스 풀로 나눠 서명
+        (본문 직렬화는 현재 프로세스에서 하므로 결과는 create_transaction과 같은 형식)
+
+        Args:
+            batch: (recipient, amount, nonce) 튜플의 반복 가능 객체
+            workers: 서명 워커 프로세스 수 (None이면 config.SIGN_WORKERS)
+
+        Returns:
+            list: 서명된 트랜잭션 리스트 (batch 순서)
+        """
+        bodies = [
+            {"sender": self.address, "recipient": recipient, "amount": amount, "nonce": nonce}
+            for recipient, amount, nonce in batch
+        ]
+        messages = [tx_body_bytes(body) for body in bodies]
+
+        if workers is None:
+            workers = config.SIGN_WORKERS
+        if workers > 1 and len(messages) >= config.SIGN_BATCH_MIN:
+            signatures = self._sign_parallel(messages, workers)
+        else:
+            signatures = CryptoUtils.sign_messages(self.private_key, messages)
+
+        public_key = self.get_public_key_hex(compressed=True)
+        return [
+            {"body": body, "signature": signature, "public_key": public_key}
+            for body, signature in zip(bodies, signatures)
+        ]
+
+    def _sign_parallel(self, messages, workers):
+        # 워커당 여러 청크를 주어 부하를 고르게 나눔 (개인키는 워커에서 청크마다 캐시 조회)
+        chunk_size = max(1, -(-len(messages) // (workers * 4)))
+        chunks = [messages[i:i + chunk_size] for i in range(0, len(messages), chunk_size)]
+
+        executor = get_sign_executor(workers)
+        results = executor.map(
+            CryptoUtils.sign_messages, repeat(self.export_private_key()), chunks,
+            repeat(is_deterministic_signing())
+        )
+        return [signature for chunk in results for signature in chunk]
+
     def export_private_key(self):
         """
         개인키를 내보내기 (백업용)
@@ -230,7 +308,7 @@ def demo():
     public_key = CryptoUtils.bytes_to_public_key(public_key_bytes)
     signature = CryptoUtils.hex_to_signature(tx['signature'])
 
-    is_valid = CryptoUtils.verify_signature(public_key, tx['body'], signature)
+    is_valid = CryptoUtils.verify_signature(public_key, tx_body_bytes(tx['body']), signature)
     print(f"   검증 결과: {'[OK] 성공' if is_valid else '[FAIL] 실패'}")
 
     # 4. 지갑 매니저 사용
@@ -19,6 +19,27 @@ Available scenarios:
 12. wallet_recovery - Wallet backup and recovery
 13. wallet_manager - Multi-wallet management
 14. network_broadcast - Network broadcasting
+15. incremental_state - Incremental state with undo logs
+16. state_snapshot_cache - State snapshot cache
+17. ancestor_index - Height index and skip pointers
+18. mempool_index - Txid-indexed mempool
+19. tx_index - Confirmed transaction index
+20. signature_cache - Signature verification cache
+21. parallel_signature_verification - Parallel batch signature verification
+22. compact_public_key - Compact public keys and parse cache
+23. binary_encoding - Canonical binary encoding
+24. merkle_proof - Merkle root and inclusion proofs
+25. mining_engine - Midstate mining engine
+26. parallel_mining - Parallel mining
+27. cancellable_mining - Cancellable sliced mining
+28. fractional_difficulty - Compact target and fractional difficulty
+29. batch_signing - Batch key generation and signing
+30. reproducible_crypto - Reproducible keys and deterministic signing
+31. event_network - Discrete-event network engine (link latency/bandwidth)
+32. zero_copy_sharing - Zero-copy immutable block/transaction sharing
+33. gossip_topology - Peer topologies and inv/getdata gossip relay
+34. sharded_simulation - Sharded multi-process simulation with barrier sync
+35. async_runtime - asyncio node runtime with inboxes and backpressure
 """
 
 from .sequential_nonce import test_sequential_nonce
@@ -35,6 +56,27 @@ from .difficulty_adjustment import test_difficulty_adjustment
 from .wallet_recovery import test_wallet_recovery
 from .wallet_manager import test_wallet_manager
 from .network_broadcast import test_network_broadcast
+from .incremental_state import test_incremental_state
+from .state_snapshot_cache import test_state_snapshot_cache
+from .ancestor_index import test_ancestor_index
+from .mempool_index import test_mempool_index
+from .tx_index import test_tx_index
+from .signature_cache import test_signature_cache
+from .parallel_signature_verification import test_parallel_signature_verification
+from .compact_public_key import test_compact_public_key
+from .binary_encoding import test_binary_encoding
+from .merkle_proof import test_merkle_proof
+from .mining_engine import test_mining_engine
+from .parallel_mining import test_parallel_mining
+from .cancellable_mining import test_cancellable_mining
+from .fractional_difficulty import test_fractional_difficulty
+from .batch_signing import test_batch_signing
+from .reproducible_crypto import test_reproducible_crypto
+from .event_network import test_event_network
+from .zero_copy_sharing import test_zero_copy_sharing
+from .gossip_topology import test_gossip_topology
+from .sharded_simulation import test_sharded_simulation
+from .async_runtime import test_async_runtime
 
 __all__ = [
     'test_sequential_nonce',
@@ -51,4 +93,25 @@ __all__ = [
     'test_wallet_recovery',
     'test_wallet_manager',
     'test_network_broadcast',
+    'test_incremental_state',
+    'test_state_snapshot_cache',
+    'test_ancestor_index',
+    'test_mempool_index',
+    'test_tx_index',
+    'test_signature_cache',
+    'test_parallel_signature_verification',
+    'test_compact_public_key',
+    'test_binary_encoding',
+    'test_merkle_proof',
+    'test_mining_engine',
+    'test_parallel_mining',
+    'test_cancellable_mining',
+    'test_fractional_difficulty',
+    'test_batch_signing',
+    'test_reproducible_crypto',
+    'test_event_network',
+    'test_zero_copy_sharing',
+    'test_gossip_topology',
+    'test_sharded_simulation',
+    'test_async_runtime',
 ]
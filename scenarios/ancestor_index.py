@@ -0,0 +1,140 @@
+"""
+시나리오 17: 높이 인덱스 + Skip 포인터 조상 탐색
+
+메인 체인은 높이 -> 해시 배열로 O(1) 조회하고,
+곁가지 블록은 Skip 포인터로 O(log n) 점프하여
+한 칸씩 거슬러 올라간 결과와 동일한 조상을 찾아야 함
+Reorg 시 공통 조상은 높이 기반 이진 탐색으로 찾고, 구간은 뷰(BlockRange)로 전달
+"""
+
+import sys
+import os
+import copy
+import types
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from blockchain import Node, NetworkSimulator, Wallet, config
+from blockchain.chain import get_skip_height, BlockRange
+
+
+def walk_ancestor(node, block, target_height):
+    """비교용: 부모를 한 칸씩 타고 올라가는 기존 방식"""
+    curr = block
+    while curr and curr.index > target_height:
+        curr = node.block_index.get(curr.previous_hash)
+    return curr
+
+
+def walk_path(node, tip_hash):
+    """비교용: Tip에서 Genesis까지의 해시 목록 (높이 순)"""
+    path = []
+    curr = node.block_index.get(tip_hash)
+    while curr:
+        path.append(curr.hash)
+        curr = node.block_index.get(curr.previous_hash)
+    return list(reversed(path))
+
+
+def test_ancestor_index():
+    """높이 인덱스 및 Skip 포인터 테스트"""
+    print("[TEST] 시나리오: 높이 인덱스 + Skip 포인터 조상 탐색")
+
+    network = NetworkSimulator()
+    wallet_alice = Wallet("Alice")
+    wallet_bob = Wallet("Bob")
+
+    node = Node(wallet_alice.address, network.genesis_block)
+    node2 = Node(wallet_bob.address, network.genesis_block)
+
+    # Case A: Skip 높이는 항상 자신보다 낮음
+    print("\n1. Skip 높이 계산")
+    for height in range(2, 200):
+        skip = get_skip_height(height)
+        assert 0 <= skip < height, f"Skip height of {height} should be below it, got {skip}"
+    print(f"   예시: 16 -> {get_skip_height(16)}, 17 -> {get_skip_height(17)}, 100 -> {get_skip_height(100)}")
+
+    # Case B: 메인 체인 높이 인덱스 (블록 간격 2초 = 목표 시간, 난이도 유지)
+    print("\n2. 메인 체인 16블록 구축")
+    main_blocks = []
+    for i in range(1, 17):
+        config.SIM_TIME = 2 * i
+        block = node.try_mine()
+        node.receive_block(block)
+        main_blocks.append(block)
+        if i <= 4:
+            node2.receive_block(copy.deepcopy(block))
+
+    assert node.main_chain == walk_path(node, node.chain_tip), "Height index should match the main chain path"
+    ancestor = node.get_ancestor(node.get_tip_block(), 3)
+    assert ancestor.hash == main_blocks[2].hash, "Main chain ancestor lookup should use the height index"
+
+    # Case C: 곁가지 (높이 4에서 분기, 10블록 - 메인보다 가벼움)
+    print("\n3. 높이 4에서 분기한 곁가지 10블록")
+    branch = []
+    for i in range(10):
+        config.SIM_TIME = 9 + 2 * i
+        block = node2.try_mine()
+        node2.receive_block(block)
+        branch.append(block)
+
+    for block in branch:
+        node.receive_block(copy.deepcopy(block))
+
+    assert node.chain_tip == main_blocks[-1].hash, "Lighter branch should not become the tip"
+    branch_tip = node.block_index[branch[-1].hash]
+    assert not node.is_on_main_chain(branch_tip), "Branch tip should be off the main chain"
+
+    for height in range(0, branch_tip.index + 1):
+        expected = walk_ancestor(node, branch_tip, height)
+        actual = node.get_ancestor(branch_tip, height)
+        assert actual is not None and actual.hash == expected.hash, f"Ancestor mismatch at height {height}"
+    print(f"   곁가지 Tip(H:{branch_tip.index})의 모든 높이 조상 일치")
+
+    # Case D: 공통 조상 탐색 및 구간 뷰
+    print("\n4. 공통 조상 탐색 (이진 탐색)")
+    main_tip = node.get_tip_block()
+    fork_point = node.find_fork_point(main_tip, branch_tip)
+    print(f"   공통 조상: H:{fork_point.index} ({fork_point.hash[:8]}...)")
+    assert fork_point.hash == main_blocks[3].hash, "Fork point should be block 4"
+
+    discarded = BlockRange(node.block_index, main_tip, fork_point.index)
+    adopted = BlockRange(node.block_index, branch_tip, fork_point.index)
+    assert len(discarded) == 12 and len(adopted) == 10, "Range lengths should be computed without walking"
+    assert [b.hash for b in adopted] == [b.hash for b in branch], "Adopted range should iterate fork -> tip"
+    assert [b.hash for b in reversed(discarded)] == [b.hash for b in reversed(main_blocks[4:])], \
+        "Discarded range should iterate tip -> fork in reverse"
+    indexed = BlockRange(node.block_index, branch_tip, fork_point.index, node.get_ancestor)
+    assert [b.hash for b in indexed] == [b.hash for b in adopted], "Skip-pointer lookup should give the same order"
+    forward = iter(indexed)
+    assert isinstance(forward, types.GeneratorType), "Forward iteration should be lazy, not a list copy"
+    assert next(forward).hash == branch[0].hash, "First block should be the one right after the fork"
+
+    # Case E: Reorg 후 높이 인덱스 갱신
+    print("\n5. 곁가지 연장으로 Reorg")
+    for i in range(10, 14):
+        config.SIM_TIME = 9 + 2 * i
+        block = node2.try_mine()
+        node2.receive_block(block)
+        node.receive_block(copy.deepcopy(block))
+
+    print(f"   새 Tip 높이: {node.get_tip_block().index}, 인덱스 길이: {len(node.main_chain)}")
+    assert node.chain_tip == node2.chain_tip, "Heavier branch should be adopted"
+    assert node.main_chain == walk_path(node, node.chain_tip), "Height index should follow the reorg"
+    assert not node.is_on_main_chain(main_blocks[-1]), "Old tip should leave the main chain"
+
+    print("\n[OK] 시나리오 17 검증 완료")
+    return True
+
+
+if __name__ == "__main__":
+    try:
+        test_ancestor_index()
+        print("\n[OK] Ancestor Index Test PASSED")
+        sys.exit(0)
+    except AssertionError as e:
+        print(f"\n[FAIL] Test FAILED: {e}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n[FAIL] Test ERROR: {e}")
+        sys.exit(1)
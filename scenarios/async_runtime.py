@@ -0,0 +1,216 @@
+"""
+시나리오 35: asyncio 노드 런타임
+
+노드마다 수신함과 메시지 루프를 두고 상태는 그 루프에서만 변경
+- 긴 고아 사슬도 재귀 없이 처리 (Node.receive_block / 런타임 모두)
+- 블록 서명 검증과 PoW 탐색은 실행기에서 수행
+- 수신함이 가득 차면 링크 전달/거래 제출이 대기하고(백프레셔), 밀린 노드는 채굴을 멈춤
+- 멈춘 수신자 쪽 링크는 적체 한도에서 거래 전달을 버림 (송신 노드는 막히지 않음)
+- 메시지 처리 중 예외는 기록만 하고 메시지 루프는 계속 (run()이 멈추지 않음)
+"""
+
+import sys
+import os
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from blockchain import Node, Wallet, config
+from blockchain.runtime import AsyncNetworkRuntime
+
+
+def _mine_chain(node, length, transfers=()):
+    """node에서 블록 length개를 차례로 채굴 (transfers의 거래는 첫 블록 뒤에 포함)"""
+    blocks = []
+    for height in range(length):
+        if height == 1:
+            for tx in transfers:
+                node.add_transaction(tx)
+        config.SIM_TIME = node.get_tip_block().timestamp + config.MAX_TIME_JUMP  # 간격을 벌려 난이도를 최소로 유지
+        block = node.try_mine()
+        node.receive_block(block)
+        blocks.append(block.freeze())
+    return blocks
+
+
+def _build_runtime(count, inbox_size=None, seed=3):
+    runtime = AsyncNetworkRuntime(seed=seed, inbox_size=inbox_size)
+    for i in range(count):
+        runtime.add_node(Node(f"N{i}", runtime.genesis_block))
+    return runtime
+
+
+def test_async_runtime():
+    """asyncio 노드 런타임 테스트"""
+    print("[TEST] 시나리오: asyncio 노드 런타임")
+
+    saved = (config.SIM_TIME, config.INBOX_HIGH_WATER, sys.getrecursionlimit())
+    try:
+        # Case A: 긴 고아 사슬 - 역순 도착해도 재귀 한도와 무관
+        print("\n1. 긴 고아 사슬 (재귀 없음)")
+        config.SIM_TIME = 0
+        runtime = _build_runtime(3)
+        alice, bob = Wallet("Alice"), Wallet("Bob")
+        miner = Node(alice.address, runtime.genesis_block)
+        transfers = [alice.create_transaction(bob.address, 5, nonce) for nonce in (1, 2, 3)]
+        chain = _mine_chain(miner, 300, transfers)
+        end_time = config.SIM_TIME
+
+        sys.setrecursionlimit(200)  # 재귀 처리였다면 사슬 길이만큼 깊어짐
+        node = Node("Direct", runtime.genesis_block)
+        for block in reversed(chain):
+            node.receive_block(block)
+        sys.setrecursionlimit(saved[2])
+        assert node.chain_tip == chain[-1].hash, "Reversed orphan chain should connect without recursion"
+        assert not node.orphan_pool, "Orphan pool should be empty after the chain connects"
+        print(f"   Node.receive_block: 역순 {len(chain)}블록 연결 (재귀 한도 200)")
+
+        async def deliver_reversed():
+            await runtime.start(mining=False)
+            first = runtime.actors[0]
+            for block in reversed(chain):
+                await first.post(('block', block, None))
+            await runtime.stop()
+
+        config.SIM_TIME = end_time
+        asyncio.run(deliver_reversed())
+        assert all(actor.node.chain_tip == chain[-1].hash for actor in runtime.actors), \
+            "Runtime should connect and relay the reversed chain"
+        assert runtime.actors[0].handled == len(chain), "First node should handle each block message once"
+        # 공용 캐시에 없던 블록 서명은 실행기에서 한 번만 검증
+        assert runtime.stats['offloaded_verifications'] == len(transfers), \
+            "Block signatures should be verified once, off the event loop"
+        print(f"   런타임: 첫 노드 메시지 {runtime.actors[0].handled}개 처리, 모든 노드 팁 일치, "
+              f"실행기 서명 검증 {runtime.stats['offloaded_verifications']}개")
+
+        # Case B: 채굴 + 전파 - 종료 후 모든 노드가 같은 누적 작업량
+        print("\n2. 채굴 루프 + 메시지 루프")
+        config.SIM_TIME = 0
+        runtime = _build_runtime(8)
+        runtime.set_topology("random_regular", degree=3)
+        stats = runtime.run_simulation(duration=20)
+        nodes = [actor.node for actor in runtime.actors]
+        tips = {node.chain_tip for node in nodes}
+        assert stats['blocks_mined'] > 0, "Nodes should mine blocks"
+        assert all(tip in node.block_index for node in nodes for tip in tips), "Every block should reach every node"
+        assert len({node.get_chain_work() for node in nodes}) == 1, "Nodes should agree on the heaviest chain work"
+        assert all(node.mining_job is None for node in nodes), "Mining jobs should be stopped"
+        assert sum(node.mining_stats['blocks'] for node in nodes) == stats['blocks_mined'], \
+            "Mined blocks should be counted per node"
+        assert all(node.mining_stats['wasted_hashes'] <= node.mining_stats['hashes'] for node in nodes), \
+            "Wasted hashes should be part of the hash count"
+
+        # PoW는 GIL과 무관한 워커 프로세스에서 탐색
+        async def executor_kind():
+            await runtime.start(mining=True)
+            kind = type(runtime.mining_executor)
+            await runtime.stop()
+            return kind
+        assert asyncio.run(executor_kind()) is ProcessPoolExecutor, "PoW search should run on a process pool"
+        print(f"   블록 {stats['blocks_mined']}개, 메시지 {stats['messages']}개, 팁 {len(tips)}종류")
+
+        # Case C: 백프레셔 - 느린 노드의 수신함은 한도를 넘지 않고, 제출자는 대기, 채굴은 일시 중지
+        print("\n3. 백프레셔")
+        config.SIM_TIME = 0
+        config.INBOX_HIGH_WATER = 2
+        inbox_size = 4
+        runtime = AsyncNetworkRuntime(seed=5, inbox_size=inbox_size)
+        carol = Wallet("Carol")
+        runtime.register_wallet(carol)
+        fast = runtime.add_node(Node(carol.address, runtime.genesis_block))
+        slow = runtime.add_node(Node("Slow", runtime.genesis_block), processing_delay=0.5)
+        funding = _mine_chain(fast.node, 1)[0]  # Carol 채굴 보상으로 거래 자금 마련
+        slow.node.receive_block(funding)
+        count = 30
+
+        async def flood():
+            await runtime.start(mining=True)
+            submitted = [await runtime.submit_transaction(carol.address, bob.address, 1, origin="Slow")
+                         for _ in range(count)]
+            await runtime.stop()
+            return submitted
+
+        submitted = asyncio.run(flood())
+        assert runtime.stats['backpressure_waits'] > 0, "Submitting to a full inbox should wait"
+        assert slow.max_backlog <= inbox_size, "Inbox should never exceed its bound"
+        assert slow.mining_pauses > 0, "A node that falls behind should pause mining"
+        nonces = [tx['body']['nonce'] for tx in submitted]
+        assert nonces == list(range(1, count + 1)), "Queued submissions should get consecutive nonces"
+        for actor in (fast, slow):
+            txids = {actor.node.compute_txid(tx) for tx in submitted}
+            assert all(txid in actor.node.mempool or actor.node.is_confirmed(txid) for txid in txids), \
+                "Every submitted tx should reach every node after draining"
+        print(f"   대기 {runtime.stats['backpressure_waits']}회, 최대 적체 {slow.max_backlog}/{inbox_size}, "
+              f"채굴 일시 중지 {slow.mining_pauses}회")
+
+        # Case D: 멈춘 수신자 - 송신 노드는 막히지 않고, 링크 적체는 한도에서 멈추며 넘치는 거래는 버림
+        print("\n4. 멈춘 수신자 (링크 적체 / 거래 버림)")
+        config.SIM_TIME = 0
+        runtime = AsyncNetworkRuntime(seed=7, inbox_size=inbox_size)
+        dave = Wallet("Dave")
+        runtime.register_wallet(dave)
+        sender = runtime.add_node(Node("Sender", runtime.genesis_block))
+        stalled = runtime.add_node(Node("Stalled", runtime.genesis_block), processing_delay=5)
+        count = 40
+
+        async def flood_stalled():
+            await runtime.start(mining=False)
+            for _ in range(count):
+                await runtime.submit_transaction(dave.address, bob.address, 1, origin="Sender")
+            await sender.inbox.join()  # 송신 노드가 제출 거래를 모두 처리할 때까지만 대기
+            handled_while_flooding = stalled.handled
+            await runtime.stop()
+            return handled_while_flooding
+
+        handled_while_flooding = asyncio.run(flood_stalled())
+        assert sender.handled == count and len(sender.node.mempool) == count, "Sender should keep up with submissions"
+        assert handled_while_flooding < count // 4, "Stalled node should lag far behind the sender"
+        assert runtime.stats['shed_relays'] > 0, "Relays to a stalled peer should be shed"
+        assert runtime.max_link_backlog <= config.INBOX_HIGH_WATER, "Link backlog should stop at the high-water mark"
+        assert stalled.max_backlog <= inbox_size, "Stalled inbox should never exceed its bound"
+        delivered = len(stalled.node.mempool)
+        assert delivered + runtime.stats['shed_relays'] == count, "Every relay is either delivered or shed"
+        print(f"   송신 {sender.handled}개 처리, 멈춘 노드 처리 {handled_while_flooding}개 (송신 종료 시점), "
+              f"링크 최대 적체 {runtime.max_link_backlog}, 버린 거래 {runtime.stats['shed_relays']}개")
+
+        # Case E: 메시지 처리 예외 - 실패한 메시지만 기록하고 액터는 계속 처리, run()은 정상 종료
+        print("\n5. 메시지 처리 예외")
+        config.SIM_TIME = 0
+        runtime = _build_runtime(3, seed=11)
+        faulty = runtime.actors[1]
+        original_process = faulty.node.process_block
+        failures = []
+
+        def process_failing_once(block):
+            if not failures:
+                failures.append(faulty.handled)
+                raise RuntimeError("injected failure")
+            return original_process(block)
+
+        faulty.node.process_block = process_failing_once
+        stats = asyncio.run(asyncio.wait_for(runtime.run(duration=20), timeout=120))
+        del faulty.node.process_block
+        assert failures, "Injected failure should trigger"
+        assert stats['failed_messages'] == 1 and faulty.failed == 1, "The failing message should be recorded once"
+        assert faulty.handled > failures[0], "Actor should keep serving after a failing message"
+        assert all(actor.inbox is None for actor in runtime.actors), "Runtime should stop cleanly"
+        print(f"   실패 메시지 {stats['failed_messages']}개, 이후 처리 {faulty.handled - failures[0]}개, run() 종료")
+    finally:
+        config.SIM_TIME, config.INBOX_HIGH_WATER = saved[:2]
+        sys.setrecursionlimit(saved[2])
+
+    print("\n[OK] 시나리오 35 검증 완료")
+
+
+if __name__ == "__main__":
+    try:
+        test_async_runtime()
+        print("\n[OK] Async Runtime Test PASSED")
+        sys.exit(0)
+    except AssertionError as e:
+        print(f"\n[FAIL] Test FAILED: {e}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n[FAIL] Test ERROR: {e}")
+        sys.exit(1)
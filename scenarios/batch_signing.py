@@ -0,0 +1,113 @@
+"""
+시나리오 29: 대량 키 생성과 일괄 서명
+
+부하 테스트용 지갑/트랜잭션을 한 번에 만들 수 있어야 하며,
+일괄 서명(프로세스 풀 포함) 결과는 create_transaction과 같은 형식으로 검증을 통과해야 함
+"""
+
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from blockchain import Node, NetworkSimulator, Wallet, CryptoUtils, config
+from blockchain.crypto import shutdown_sign_executor
+
+
+def test_batch_signing():
+    """대량 키 생성과 일괄 서명 테스트"""
+    print("[TEST] 시나리오: 대량 키 생성과 일괄 서명")
+
+    saved = (config.SERIALIZATION_FORMAT, config.SIGN_WORKERS, config.SIGN_BATCH_MIN)
+    try:
+        config.SERIALIZATION_FORMAT = "binary"
+
+        # Case A: 대량 키/지갑 생성
+        print("\n1. 대량 지갑 생성")
+        pairs = CryptoUtils.generate_key_pairs(5)
+        assert len(pairs) == 5, "Should generate n key pairs"
+        assert len({CryptoUtils.public_key_to_address(pub) for _, pub in pairs}) == 5, "Keys should be distinct"
+
+        start = time.perf_counter()
+        wallets = Wallet.create_wallets(200, "user")
+        elapsed = time.perf_counter() - start
+        assert len({w.address for w in wallets}) == 200, "Wallet addresses should be unique"
+        assert wallets[7].owner_name == "user7", "Owner names should use the prefix"
+        for wallet in wallets[:5]:
+            assert wallet.address == CryptoUtils.public_key_to_address(wallet.private_key.public_key()), \
+                "Address should match the private key"
+        print(f"   지갑 200개 생성: {elapsed:.3f}초")
+
+        # Case B: 일괄 서명 (현재 프로세스)
+        print("\n2. 일괄 서명")
+        alice, bob = wallets[0], wallets[1]
+        batch = [(bob.address, 1 + i % 3, i + 1) for i in range(100)]
+
+        start = time.perf_counter()
+        txs = alice.create_transactions(batch, workers=1)
+        elapsed = time.perf_counter() - start
+        assert len(txs) == len(batch), "Should create one tx per batch entry"
+        single = alice.create_transaction(bob.address, 1, 1)
+        assert txs[0]['body'] == single['body'] and txs[0]['public_key'] == single['public_key'], \
+            "Batch tx should have the same shape as create_transaction"
+        assert all(tx['public_key'] is txs[0]['public_key'] for tx in txs), \
+            "Encoded public key should be computed once per wallet"
+        assert [tx['body']['nonce'] for tx in txs] == list(range(1, 101)), "Batch order should be preserved"
+        assert all(CryptoUtils.verify_transaction(tx) for tx in txs), "Every batch signature should verify"
+        print(f"   100건 서명: {elapsed:.3f}초 ({len(txs) / elapsed:.0f} tx/s)")
+
+        # Case C: 프로세스 풀 서명
+        print("\n3. 프로세스 풀 서명")
+        config.SIGN_BATCH_MIN = 8
+        txs = alice.create_transactions(batch, workers=2)
+        assert [tx['body']['nonce'] for tx in txs] == list(range(1, 101)), "Pool signing should keep order"
+        assert all(CryptoUtils.verify_transaction(tx) for tx in txs), "Pool signatures should verify"
+
+        # 본문 직렬화는 호출 프로세스의 형식 설정을 따름
+        config.SERIALIZATION_FORMAT = "json"
+        json_txs = alice.create_transactions(batch[:10], workers=2)
+        assert all(CryptoUtils.verify_transaction(tx) for tx in json_txs), "JSON-mode pool signatures should verify"
+        config.SERIALIZATION_FORMAT = "binary"
+        assert not any(CryptoUtils.verify_transaction(tx) for tx in json_txs[:3]), \
+            "JSON-mode signatures should not verify in binary mode"
+
+        # 작은 배치는 풀을 쓰지 않음
+        config.SIGN_BATCH_MIN = 1000
+        assert all(CryptoUtils.verify_transaction(tx) for tx in alice.create_transactions(batch[:5], workers=2)), \
+            "Small batches should be signed in-process"
+        print("   순서 유지 / 검증 통과 / 형식 설정 반영")
+
+        # Case D: 노드가 일괄 생성 거래를 수용
+        print("\n4. 노드 수용")
+        network = NetworkSimulator()
+        node = Node(alice.address, network.genesis_block)
+        config.SIM_TIME = 1
+        block1 = node.try_mine()
+        node.receive_block(block1)
+
+        accepted = sum(node.add_transaction(tx) is not False for tx in alice.create_transactions(batch[:5]))
+        assert len(node.mempool) == 5, f"All batch txs should enter the mempool (accepted {accepted})"
+        config.SIM_TIME = 2
+        block2 = node.try_mine()
+        node.receive_block(block2)
+        assert node.chain_tip == block2.hash and len(block2.transactions) == 6, "Batch txs should be mined"
+        print(f"   블록 2에 일괄 생성 거래 {len(block2.transactions) - 1}건 포함")
+    finally:
+        config.SERIALIZATION_FORMAT, config.SIGN_WORKERS, config.SIGN_BATCH_MIN = saved
+        shutdown_sign_executor()
+
+    print("\n[OK] 시나리오 29 검증 완료")
+
+
+if __name__ == "__main__":
+    try:
+        test_batch_signing()
+        print("\n[OK] Batch Signing Test PASSED")
+        sys.exit(0)
+    except AssertionError as e:
+        print(f"\n[FAIL] Test FAILED: {e}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n[FAIL] Test ERROR: {e}")
+        sys.exit(1)
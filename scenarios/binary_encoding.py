@@ -0,0 +1,116 @@
+"""
+시나리오 23: 정규 바이너리 직렬화
+
+트랜잭션 본문/트랜잭션/블록 헤더는 버전이 붙은 길이 접두 바이너리로 인코딩되어
+키 순서와 무관하게 같은 바이트가 나오고, 디코딩하면 원래 값으로 복원되어야 함
+JSON 호환 모드에서는 기존 json.dumps(sort_keys=True) 해시가 그대로 유지되어야 함
+"""
+
+import sys
+import os
+import copy
+import json
+import hashlib
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from blockchain import Node, NetworkSimulator, Wallet, config
+from blockchain import encoding
+
+
+def test_binary_encoding():
+    """정규 바이너리 직렬화 테스트"""
+    print("[TEST] 시나리오: 정규 바이너리 직렬화")
+
+    saved_format = config.SERIALIZATION_FORMAT
+    try:
+        config.SERIALIZATION_FORMAT = "binary"
+        network = NetworkSimulator()
+        wallet_alice = Wallet("Alice")
+        wallet_bob = Wallet("Bob")
+
+        # Case A: 왕복 변환 (본문 / 서명 트랜잭션 / 코인베이스)
+        print("\n1. 인코딩 -> 디코딩 왕복")
+        tx = wallet_alice.create_transaction(wallet_bob.address, 10, 1)
+        coinbase = {"body": {"sender": "SYSTEM", "recipient": wallet_alice.address,
+                             "amount": config.MINING_REWARD, "nonce": 0}, "sig": None}
+
+        assert encoding.decode_tx_body(encoding.encode_tx_body(tx['body'])) == tx['body']
+        assert encoding.decode_transaction(encoding.encode_transaction(tx)) == tx
+        assert encoding.decode_transaction(encoding.encode_transaction(coinbase)) == coinbase
+        print(f"   본문 크기: binary={len(encoding.encode_tx_body(tx['body']))}, "
+              f"json={len(encoding.json_bytes(tx['body']))}")
+
+        # Case B: 정규성 (키 순서와 무관, 첫 바이트는 형식 버전)
+        print("\n2. 정규성")
+        reordered = dict(reversed(list(tx['body'].items())))
+        assert encoding.encode_tx_body(reordered) == encoding.encode_tx_body(tx['body']), \
+            "Encoding should not depend on key order"
+        assert encoding.encode_tx_body(tx['body'])[0] == encoding.FORMAT_VERSION, "First byte should be the format version"
+
+        # Case C: 손상/버전 불일치 데이터 거부
+        print("\n3. 손상된 데이터")
+        data = encoding.encode_transaction(tx)
+        for bad in (data[:-1], data + b'\x00', bytes([encoding.FORMAT_VERSION + 1]) + data[1:]):
+            try:
+                encoding.decode_transaction(bad)
+                assert False, "Corrupted data should be rejected"
+            except encoding.EncodingError as e:
+                print(f"   거부: {e}")
+
+        # Case D: 블록 헤더 인코딩 및 해시
+        print("\n4. 블록 헤더")
+        node = Node(wallet_alice.address, network.genesis_block)
+        config.SIM_TIME = 1
+        block1 = node.try_mine()
+        node.receive_block(block1)
+        node.add_transaction(tx)
+        config.SIM_TIME = 2
+        block2 = node.try_mine()
+        node.receive_block(block2)
+
+        header = encoding.decode_block_header(block2.encode_header())
+        print(f"   헤더: index={header['index']}, nonce={header['nonce']}")
+        assert header['previous_hash'] == block1.hash and header['nonce'] == block2.nonce
+        assert header['merkle_root'] == block2.compute_merkle_root()
+        assert block2.hash == hashlib.sha256(block2.encode_header()).hexdigest(), "Block hash should cover the header"
+        assert node.state[wallet_bob.address]['balance'] == 10, "Binary-signed tx should be confirmed"
+
+        tampered = copy.deepcopy(block2)
+        tampered.transactions[1]['body']['amount'] = 1000
+        assert tampered.calculate_hash() != block2.hash, "Tampered transactions should change the block hash"
+
+        # Case E: JSON 호환 모드는 기존 해시 유지
+        print("\n5. JSON 호환 모드")
+        config.SERIALIZATION_FORMAT = "json"
+        legacy_txid = hashlib.sha256(json.dumps(tx['body'], sort_keys=True).encode()).hexdigest()
+        assert node.compute_txid(tx) == legacy_txid, "JSON mode should keep the legacy txid"
+
+        legacy_block_hash = hashlib.sha256(json.dumps({
+            "index": block2.index, "timestamp": block2.timestamp, "transactions": block2.transactions,
+            "difficulty": block2.difficulty, "previous_hash": block2.previous_hash, "nonce": block2.nonce
+        }, sort_keys=True).encode()).hexdigest()
+        assert block2.calculate_hash() == legacy_block_hash, "JSON mode should keep the legacy block hash"
+
+        json_node = Node(wallet_alice.address, network.genesis_block)
+        json_tx = wallet_alice.create_transaction(wallet_bob.address, 5, 1)
+        assert json_node.verify_transaction_signature(json_tx), "JSON-mode signature should verify"
+        print(f"   기존 txid 유지: {legacy_txid[:16]}...")
+    finally:
+        config.SERIALIZATION_FORMAT = saved_format
+
+    print("\n[OK] 시나리오 23 검증 완료")
+    return True
+
+
+if __name__ == "__main__":
+    try:
+        test_binary_encoding()
+        print("\n[OK] Binary Encoding Test PASSED")
+        sys.exit(0)
+    except AssertionError as e:
+        print(f"\n[FAIL] Test FAILED: {e}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n[FAIL] Test ERROR: {e}")
+        sys.exit(1)
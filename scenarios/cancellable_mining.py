@@ -0,0 +1,169 @@
+"""
+시나리오 27: 중단 가능한 시분할 채굴
+
+채굴은 슬라이스 단위 해시 예산으로 나눠 진행되는 작업이며,
+경쟁 블록이 도착해 팁이 바뀌면 진행 중이던 작업을 취소하고 낭비된 해시를 집계해야 함
+"""
+
+import sys
+import os
+import copy
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from blockchain import Block, Node, NetworkSimulator, Wallet, config
+from blockchain.mining import MiningJob, CancelToken, search_nonce_range
+
+
+def test_cancellable_mining():
+    """중단 가능한 시분할 채굴 테스트"""
+    print("[TEST] 시나리오: 중단 가능한 시분할 채굴")
+
+    saved_format = config.SERIALIZATION_FORMAT
+    try:
+        template = Block(index=1, timestamp=1, transactions=[], difficulty=3,
+                         previous_hash="0" * 64, miner_id="miner")
+
+        # Case A: 슬라이스로 나눠도 한 번에 채굴한 결과와 동일
+        print("\n1. 슬라이스 채굴 결과")
+        for fmt in ("binary", "json"):
+            config.SERIALIZATION_FORMAT = fmt
+            expected = copy.deepcopy(template)
+            expected.mine_block()
+
+            job = MiningJob(copy.deepcopy(template))
+            slices = 1
+            while not job.step(100):
+                slices += 1
+            assert (job.block.nonce, job.block.hash) == (expected.nonce, expected.hash), \
+                f"Sliced mining should match mine_block ({fmt})"
+            assert job.hashes == expected.nonce + 1, "Sliced job should try each nonce once"
+            assert job.block.hash == job.block.calculate_hash(), "Mined hash should verify"
+            print(f"   {fmt}: nonce {job.block.nonce} ({slices} 슬라이스)")
+        config.SERIALIZATION_FORMAT = "binary"
+
+        # 다른 프로세스에 맡긴 구간 결과를 record()로 반영해도 같은 결과
+        expected = copy.deepcopy(template)
+        expected.mine_block()
+        job = MiningJob(copy.deepcopy(template))
+        while not job.done:
+            start = job.next_nonce
+            job.record(*search_nonce_range(job.header_prefix, job.target, start, start + 100))
+        assert (job.block.nonce, job.block.hash) == (expected.nonce, expected.hash), \
+            "Recorded chunk results should match mine_block"
+        assert job.hashes == expected.nonce + 1, "Recorded chunks should count each nonce once"
+
+        # Case B: 취소 토큰
+        print("\n2. 취소 토큰")
+        job = MiningJob(copy.deepcopy(template))
+        assert not job.step(1) or job.block.nonce == 0, "First slice should try one nonce"
+        job.cancel("test")
+        hashes = job.hashes
+        assert not job.step(10000), "Cancelled job should not progress"
+        assert job.hashes == hashes and job.token.reason == "test", "Cancelled job should keep its counters"
+
+        # 탐색 도중 취소 (다른 스레드/콜백에서 토큰 취소 시 다음 확인 시점에 중단)
+        token = CancelToken()
+        impossible = copy.deepcopy(template)
+        impossible.difficulty = 64
+        job = MiningJob(impossible, token)
+        job.target = 0
+        calls = []
+
+        class Tripwire:
+            """두 번째 확인 시점에 취소되는 토큰 흉내"""
+            reason = None
+
+            @property
+            def cancelled(self):
+                calls.append(1)
+                return len(calls) >= 2
+
+        job.token = Tripwire()
+        assert not job.step(1 << 20), "Impossible target should not be solved"
+        assert job.hashes < 1 << 20, "Search should stop early when the token is cancelled mid-slice"
+        print(f"   슬라이스 도중 취소: {job.hashes} hashes 후 중단")
+
+        # Case C: 팁 변경 시 낡은 작업 중단
+        print("\n3. 팁 변경 시 중단")
+        network = NetworkSimulator()
+        alice, bob = Wallet("Alice"), Wallet("Bob")
+        node_a = Node(alice.address, network.genesis_block)
+        node_b = Node(bob.address, network.genesis_block)
+
+        config.SIM_TIME = 1
+        while node_a.mine_step(1) is not None:
+            pass  # 운 좋게 1해시에 풀리면 다시 시작 (받지 않은 블록은 버림)
+        stale_job = node_a.mining_job
+        assert stale_job is not None and stale_job.hashes >= 1, "Node A should have a job in progress"
+        wasted_before = node_a.mining_stats['wasted_hashes']
+
+        competing = node_b.try_mine()
+        node_b.receive_block(competing)
+        node_a.receive_block(copy.deepcopy(competing))
+
+        assert node_a.chain_tip == competing.hash, "Node A should switch to the competing block"
+        assert node_a.mining_job is None and stale_job.cancelled, "Stale job should be aborted"
+        assert node_a.mining_stats['wasted_hashes'] == wasted_before + stale_job.hashes, \
+            "Aborted hashes should be counted as wasted"
+        assert node_a.mining_stats['aborted_jobs'] >= 1, "Aborted job count should increase"
+
+        # 새 작업은 새 팁 위에서 시작 (팁과 같은 시각에는 대기)
+        assert node_a.mine_step(1) is None and node_a.mining_job is None, \
+            "No job should start at the tip's timestamp"
+        config.SIM_TIME = 2
+        while node_a.mine_step(1) is not None:
+            pass
+        assert node_a.mining_job.block.previous_hash == competing.hash, "New job should build on the new tip"
+        print(f"   낭비 해시 {stale_job.hashes}, 새 작업 부모 {competing.hash[:6]}")
+
+        # Case D: 팁이 바뀌지 않는 블록은 작업 유지
+        print("\n4. 팁 유지 시 작업 유지")
+        job = node_a.mining_job
+        side = Block(index=1, timestamp=1, transactions=[{"body": {"sender": "SYSTEM", "recipient": alice.address,
+                                                                   "amount": config.MINING_REWARD, "nonce": 0},
+                                                          "sig": None}],
+                     difficulty=config.DEFAULT_DIFFICULTY, previous_hash=network.genesis_block.hash,
+                     miner_id=alice.address)
+        side.mine_block()
+        node_a.receive_block(side)
+        assert node_a.chain_tip == competing.hash, "Equal-work side block should not change the tip"
+        assert node_a.mining_job is job and not job.cancelled, "Job should survive a non-tip block"
+        print("   곁가지 블록 수신 후에도 작업 유지")
+
+        # Case E: 시분할 시뮬레이션
+        print("\n5. 시분할 시뮬레이션")
+        config.SIM_TIME = 0
+        network = NetworkSimulator()
+        nodes = [Node(Wallet(name).address, network.genesis_block) for name in ("N1", "N2", "N3")]
+        for node in nodes:
+            network.add_node(node)
+        network.run_sliced_simulation(steps=20, slice_hashes=64)
+
+        totals = [node.get_mining_stats() for node in nodes]
+        blocks = sum(stats['blocks'] for stats in totals)
+        wasted = sum(stats['wasted_hashes'] for stats in totals)
+        assert blocks > 0, "Some blocks should be mined"
+        assert wasted > 0, "Competing blocks should waste some in-progress work"
+        for stats in totals:
+            assert stats['wasted_hashes'] <= stats['hashes'], "Wasted hashes are part of all hashes"
+        best = max(node.get_tip_block().index for node in nodes)
+        assert best >= 1, "Chain should grow"
+        print(f"   블록 {blocks}개, 낭비 해시 {wasted}, 최고 높이 {best}")
+    finally:
+        config.SERIALIZATION_FORMAT = saved_format
+
+    print("\n[OK] 시나리오 27 검증 완료")
+
+
+if __name__ == "__main__":
+    try:
+        test_cancellable_mining()
+        print("\n[OK] Cancellable Mining Test PASSED")
+        sys.exit(0)
+    except AssertionError as e:
+        print(f"\n[FAIL] Test FAILED: {e}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n[FAIL] Test ERROR: {e}")
+        sys.exit(1)
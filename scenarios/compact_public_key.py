@@ -0,0 +1,91 @@
+"""
+시나리오 22: 압축 공개키 + 공개키 파싱 캐시
+
+트랜잭션은 SEC1 압축 공개키(33바이트)를 사용하되 기존 PEM 형식도 계속 허용해야 하며,
+같은 공개키는 파싱/주소 계산을 반복하지 않고 캐시에서 꺼내야 함
+"""
+
+import sys
+import os
+import copy
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from blockchain import Node, NetworkSimulator, Wallet, CryptoUtils, config
+
+
+def test_compact_public_key():
+    """압축 공개키 + 공개키 파싱 캐시 테스트"""
+    print("[TEST] 시나리오: 압축 공개키 + 공개키 파싱 캐시")
+
+    network = NetworkSimulator()
+    wallet_alice = Wallet("Alice")
+    wallet_bob = Wallet("Bob")
+    wallet_eve = Wallet("Eve")
+
+    node = Node(wallet_alice.address, network.genesis_block)
+    config.SIM_TIME = 1
+    block1 = node.try_mine()
+    node.receive_block(block1)
+
+    # Case A: 트랜잭션의 공개키는 33바이트 압축 형식
+    print("\n1. 압축 공개키 크기")
+    tx_compact = wallet_alice.create_transaction(wallet_bob.address, 10, 1)
+    compact_size = len(bytes.fromhex(tx_compact['public_key']))
+    legacy_size = len(wallet_alice.get_public_key_bytes())
+    print(f"   압축: {compact_size} bytes, PEM: {legacy_size} bytes")
+    assert compact_size == 33, "Transaction public key should be a 33-byte compressed point"
+    assert bytes.fromhex(tx_compact['public_key'])[0] in (2, 3), "Compressed point prefix should be 0x02/0x03"
+
+    # Case B: 두 형식 모두 같은 주소로 복원
+    print("\n2. 형식별 주소 일치")
+    _, compact_address = CryptoUtils.load_public_key(wallet_alice.get_public_key_bytes(compressed=True))
+    _, legacy_address = CryptoUtils.load_public_key(wallet_alice.get_public_key_bytes())
+    assert compact_address == legacy_address == wallet_alice.address, "Both encodings should map to the same address"
+
+    # Case C: 기존 PEM 형식 트랜잭션도 허용
+    print("\n3. 기존 PEM 형식 호환")
+    tx_legacy = copy.deepcopy(tx_compact)
+    tx_legacy['public_key'] = wallet_alice.get_public_key_hex()
+    assert node.verify_transaction_signature(tx_compact), "Compressed-key tx should verify"
+    assert node.verify_transaction_signature(tx_legacy), "Legacy PEM-key tx should verify"
+
+    # Case D: 다른 사람의 압축 공개키는 거부
+    print("\n4. 공개키/송신자 불일치")
+    tx_forged = copy.deepcopy(tx_compact)
+    tx_forged['public_key'] = wallet_eve.get_public_key_hex(compressed=True)
+    assert not node.verify_transaction_signature(tx_forged), "Key of another wallet should be rejected"
+
+    # Case E: 공개키 파싱 캐시 적중
+    print("\n5. 공개키 파싱 캐시")
+    key_bytes = wallet_bob.get_public_key_bytes(compressed=True)
+    CryptoUtils.load_public_key(key_bytes)
+    hits = CryptoUtils.load_public_key.cache_info().hits
+    CryptoUtils.load_public_key(key_bytes)
+    print(f"   캐시 정보: {CryptoUtils.load_public_key.cache_info()}")
+    assert CryptoUtils.load_public_key.cache_info().hits == hits + 1, "Repeated key should hit the parse cache"
+
+    # Case F: 압축 공개키 거래가 블록에 포함되어 확정
+    print("\n6. 블록 확정")
+    node.add_transaction(tx_compact)
+    config.SIM_TIME = 2
+    block2 = node.try_mine()
+    node.receive_block(block2)
+    assert node.chain_tip == block2.hash, "Block should be accepted"
+    assert node.state[wallet_bob.address]['balance'] == 10, "Compressed-key tx should be confirmed"
+
+    print("\n[OK] 시나리오 22 검증 완료")
+    return True
+
+
+if __name__ == "__main__":
+    try:
+        test_compact_public_key()
+        print("\n[OK] Compact Public Key Test PASSED")
+        sys.exit(0)
+    except AssertionError as e:
+        print(f"\n[FAIL] Test FAILED: {e}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n[FAIL] Test ERROR: {e}")
+        sys.exit(1)
@@ -74,8 +74,8 @@ def test_deep_reorg():
     block4_alt = node2.try_mine()
     node2.receive_block(block4_alt)
 
-    print(f"   Alt chain 총 작업량: {node2.get_tip_block().total_work}")
-    print(f"   Old chain 총 작업량: {node.get_tip_block().total_work}")
+    print(f"   Alt chain 총 작업량: {node2.get_chain_work()}")
+    print(f"   Old chain 총 작업량: {node.get_chain_work()}")
 
     # Reorg 발생
     print("\n3. Deep Reorg 발생")
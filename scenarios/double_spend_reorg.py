@@ -66,7 +66,7 @@ def test_double_spend_reorg():
     config.SIM_TIME = 3
     block3_node2 = node2.try_mine()
     node2.receive_block(block3_node2)
-    print(f"   Node2 총 작업량: {node2.get_tip_block().total_work}")
+    print(f"   Node2 총 작업량: {node2.get_chain_work()}")
 
     # Node1에 Node2의 블록들 전파 → Reorg 발생
     print("\n4. Reorg 발생 (Node1이 Node2 체인 수용)")
@@ -0,0 +1,145 @@
+"""
+시나리오 31: 이산 사건 네트워크 엔진
+
+블록/거래 도착은 링크 지연과 대역폭으로 정해진 시각의 이벤트로 처리되고,
+엔진은 다음 이벤트 시각으로 바로 이동하므로 처리 비용이 시뮬레이션 시간이 아니라 이벤트 수에 비례해야 함
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from blockchain import Node, NetworkSimulator, Wallet, config
+from blockchain.events import EventScheduler, Link
+
+
+def _build_network(seed, count=4, first_id=None):
+    """시드로 노드 count개짜리 네트워크 구성 (first_id가 주어지면 첫 노드 ID로 사용)"""
+    config.SIM_TIME = 0
+    network = NetworkSimulator(seed=seed)
+    for i in range(count):
+        node_id = first_id if i == 0 and first_id else f"N{i}"
+        network.add_node(Node(node_id, network.genesis_block))
+    return network
+
+
+def test_event_network():
+    """이산 사건 네트워크 엔진 테스트"""
+    print("[TEST] 시나리오: 이산 사건 네트워크 엔진")
+
+    saved = (config.SIM_TIME, config.LINK_LATENCY, config.LINK_BANDWIDTH)
+    try:
+        # Case A: 이벤트는 시각순, 같은 시각은 예약순으로 처리되고 시간은 이벤트 시각으로 점프
+        print("\n1. 이벤트 큐 순서와 시간 점프")
+        scheduler = EventScheduler()
+        log = []
+        scheduler.schedule(5.0, lambda: log.append(('b', scheduler.now)))
+        scheduler.schedule(1000.0, lambda: log.append(('d', scheduler.now)))
+        scheduler.schedule(5.0, lambda: log.append(('c', scheduler.now)))
+        scheduler.schedule(0.5, lambda: log.append(('a', scheduler.now)))
+
+        processed = scheduler.run(until=100)
+        assert processed == 3, "Events after 'until' should stay queued"
+        assert log == [('a', 0.5), ('b', 5.0), ('c', 5.0)], f"Unexpected order: {log}"
+        assert scheduler.now == 100 and config.SIM_TIME == 100, "Clock should advance to 'until'"
+        assert len(scheduler) == 1 and scheduler.next_time() == 1000.0, "Later event should remain"
+
+        scheduler.run()
+        assert log[-1] == ('d', 1000.0) and scheduler.processed == 4, "Remaining event should run"
+        print(f"   {scheduler} (1000초를 이벤트 4개로 진행)")
+
+        # Case B: 링크 모델 - 도착 = 전송 시작 + 크기/대역폭 + 지연, 앞 메시지가 링크를 점유
+        print("\n2. 링크 지연/대역폭 모델")
+        link = Link(latency=0.2, bandwidth=1000)
+        first = link.transmit(0, 500)     # 0 ~ 0.5 전송, 0.7 도착
+        second = link.transmit(0.1, 500)  # 0.5까지 대기 -> 1.0 전송 완료, 1.2 도착
+        third = link.transmit(3, 100)     # 링크가 비어 있음 -> 3.1 완료, 3.3 도착
+        assert abs(first - 0.7) < 1e-9, f"First arrival should be 0.7, got {first}"
+        assert abs(second - 1.2) < 1e-9, f"Second message should queue behind first, got {second}"
+        assert abs(third - 3.3) < 1e-9, f"Idle link should not queue, got {third}"
+        assert link.messages == 3 and link.bytes_sent == 1100, "Link counters mismatch"
+        assert Link(latency=0.2, bandwidth=None).transmit(1, 10 ** 9) == 1.2, "Unlimited bandwidth"
+        print(f"   도착 시각: {first:.1f}, {second:.1f}, {third:.1f}")
+
+        # Case C: 느린 링크로 보낸 블록은 지연만큼 늦게 도착
+        print("\n3. 링크별 블록 도착 시각")
+        network = _build_network(seed=1, count=3)
+        fast, slow = network.nodes[1], network.nodes[2]
+        network.set_link(network.nodes[0], fast, latency=0.1, bandwidth=None)
+        network.set_link(network.nodes[0], slow, latency=2.0, bandwidth=None)
+
+        config.SIM_TIME = network.scheduler.now = 1
+        block = network.nodes[0].try_mine()
+        network.nodes[0].receive_block(block)
+        network.relay_block(network.nodes[0], block)
+
+        network.scheduler.run(until=1.5)
+        assert block.hash in fast.block_index, "Fast peer should have the block after 0.1s"
+        assert block.hash not in slow.block_index, "Slow peer should not have the block yet"
+        network.scheduler.run(until=3.5)
+        assert block.hash in slow.block_index, "Slow peer should have the block after 2.0s"
+        assert network.links[(network.nodes[0].node_id, slow.node_id)].messages == 1, "One message on slow link"
+        print("   빠른 링크 0.1초, 느린 링크 2.0초 후 수신")
+
+        # Case D: 트랜잭션도 링크를 통해 전파되어 채굴됨
+        print("\n4. 트랜잭션 전파와 수렴")
+        alice, bob = Wallet("Alice"), Wallet("Bob")
+        network = _build_network(seed=5, first_id=alice.address)  # 채굴 보상으로 잔액 확보
+        for wallet in (alice, bob):
+            network.register_wallet(wallet)
+        network.run_event_simulation(duration=20)
+
+        tx = network.submit_transaction(alice.address, bob.address, 10)
+        assert tx is not None, "Transaction should be submitted"
+        assert network.event_stats['tx_messages'] == len(network.nodes) - 1, "Tx should be relayed to peers"
+        network.run_event_simulation(duration=40)
+
+        tips = {node.chain_tip for node in network.nodes}
+        assert len(tips) == 1, f"Nodes should converge on one tip, got {len(tips)}"
+        txid = network.nodes[0].compute_txid(tx)
+        assert all(node.get_transaction_location(txid) for node in network.nodes), \
+            "Relayed transaction should be confirmed on every node"
+        tip = network.nodes[0].get_tip_block()
+        print(f"   팁 수렴: {tip.hash[:6]} (H:{tip.index}), 거래 확정")
+
+        # Case E: 비용은 이벤트 수에 비례 (빈 시간은 건너뜀)
+        print("\n5. 이벤트 수 비례 비용")
+        stats = network.event_stats
+        expected_events = (stats['blocks_mined'] + stats['block_messages'] + stats['tx_messages'])
+        assert network.scheduler.processed >= expected_events, "Every mined block and message is an event"
+        assert network.scheduler.processed <= 4 * expected_events, \
+            f"Event count should scale with blocks/messages, got {network.scheduler.processed}"
+
+        idle = EventScheduler()
+        idle.schedule(10 ** 6, lambda: None)
+        assert idle.run() == 1 and idle.now == 10 ** 6, "Idle time should be skipped in one event"
+        print(f"   처리 이벤트 {network.scheduler.processed}개 (블록 {stats['blocks_mined']}, "
+              f"메시지 {stats['block_messages'] + stats['tx_messages']})")
+
+        # Case F: 같은 시드면 이벤트 순서와 체인이 동일
+        print("\n6. 시드 재현성")
+        runs = []
+        for _ in range(2):
+            network = _build_network(seed=11)
+            network.run_event_simulation(duration=30)
+            runs.append((network.scheduler.processed, [node.chain_tip for node in network.nodes]))
+        assert runs[0] == runs[1], "Same seed should give identical event runs"
+        print(f"   두 실행 동일: 이벤트 {runs[0][0]}개, 팁 {runs[0][1][0][:6]}")
+    finally:
+        config.SIM_TIME, config.LINK_LATENCY, config.LINK_BANDWIDTH = saved
+
+    print("\n[OK] 시나리오 31 검증 완료")
+
+
+if __name__ == "__main__":
+    try:
+        test_event_network()
+        print("\n[OK] Event Network Test PASSED")
+        sys.exit(0)
+    except AssertionError as e:
+        print(f"\n[FAIL] Test FAILED: {e}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n[FAIL] Test ERROR: {e}")
+        sys.exit(1)
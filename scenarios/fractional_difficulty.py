@@ -0,0 +1,131 @@
+"""
+시나리오 28: 압축 목표값과 소수 난이도
+
+난이도는 헤더에 압축 목표값(nBits)으로 기록되고 해시는 정수 비교로 검증되며,
+조정 주기마다 목표값이 소요 시간에 비례해 조정되어야 함 (작업량은 목표값에서 계산)
+"""
+
+import sys
+import os
+import copy
+import math
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from blockchain import Block, Node, NetworkSimulator, Wallet, config
+from blockchain.mining import (
+    difficulty_to_target, target_to_difficulty, target_to_bits, bits_to_target, target_work
+)
+
+
+def _mine_at(node, sim_time):
+    config.SIM_TIME = sim_time
+    block = node.try_mine()
+    node.receive_block(block)
+    assert node.chain_tip == block.hash, f"Block at time {sim_time} should extend the chain"
+    return block
+
+
+def test_fractional_difficulty():
+    """압축 목표값과 소수 난이도 테스트"""
+    print("[TEST] 시나리오: 압축 목표값과 소수 난이도")
+
+    # Case A: 압축 표현
+    print("\n1. 압축 표현 (nBits)")
+    assert bits_to_target(0x1d00ffff) == 0xffff << (8 * 26), "Bitcoin genesis bits should decode"
+    assert target_to_bits(0xffff << (8 * 26)) == 0x1d00ffff, "Bitcoin genesis target should encode"
+    for difficulty in range(0, 8):
+        target = difficulty_to_target(difficulty)
+        assert bits_to_target(target_to_bits(target)) == target, "Integer difficulty should round-trip exactly"
+        assert target_work(target) == 16 ** difficulty, "Work of integer difficulty d should be 16^d"
+    for difficulty in (1.1, 2.25, 2.5, 3.333, 5.9):
+        target = difficulty_to_target(difficulty)
+        compact = bits_to_target(target_to_bits(target))
+        assert compact <= target and (target - compact) / target < 2 ** -15, "Compact target should lose < 2^-15"
+        assert abs(target_to_difficulty(compact) - difficulty) < 1e-4, "Difficulty should survive the round trip"
+    print("   정수 난이도는 정확히, 소수 난이도는 2^-15 이내로 복원")
+
+    saved = (config.SERIALIZATION_FORMAT, config.SIM_TIME)
+    try:
+        config.SERIALIZATION_FORMAT = "binary"
+
+        # Case B: 소수 난이도 블록
+        print("\n2. 소수 난이도 블록")
+        block = Block(index=1, timestamp=1, transactions=[], difficulty=2.5,
+                      previous_hash="0" * 64, miner_id="miner")
+        block.mine_block()
+        assert block.difficulty == 2.5, "Difficulty should be derived from bits"
+        assert int(block.hash, 16) < block.target, "Mined hash should be below the target"
+        assert block.block_work == 1024, "Work of difficulty 2.5 should be 16^2.5"
+        assert Block(0, 0, [], 2, "0", "x").block_work == 256, "Work of difficulty 2 should be 256"
+        print(f"   난이도 {block.difficulty}, bits {block.bits:#010x}, work {block.block_work}")
+
+        # Case C: 비례 조정 (빠른 블록 -> 소요 시간 비율만큼 난이도 증가)
+        print("\n3. 비례 난이도 조정")
+        network = NetworkSimulator()
+        alice = Wallet("Alice")
+        node = Node(alice.address, network.genesis_block)
+        verifier = Node(Wallet("Verifier").address, network.genesis_block)
+
+        blocks = [_mine_at(node, t) for t in (1, 2, 3, 4, 5)]
+        block6 = _mine_at(node, 6)
+
+        # 블록 3 -> 5: 2초 (목표 6초) -> 목표값 1/3
+        expected_time = config.TARGET_BLOCK_TIME * config.ADJUSTMENT_INTERVAL
+        expected = config.DEFAULT_DIFFICULTY + math.log(expected_time / 2, 16)
+        assert abs(block6.difficulty - expected) < 1e-4, f"Difficulty should be {expected:.4f}"
+        assert block6.target == bits_to_target(target_to_bits(blocks[-1].target * 2 // expected_time)), \
+            "Target should scale by time_taken / expected_time"
+        print(f"   블록 6 난이도: {block6.difficulty:.4f} (기대 {expected:.4f})")
+
+        for b in blocks + [block6]:
+            verifier.receive_block(copy.deepcopy(b))
+        assert verifier.chain_tip == block6.hash, "Other node should accept the fractional difficulty block"
+
+        # Case D: 조정 폭 제한 (매우 느린 블록 -> MAX_RETARGET_FACTOR배까지만)
+        print("\n4. 조정 폭 제한")
+        _mine_at(node, 7)
+        _mine_at(node, 100)
+        block9 = _mine_at(node, 200)
+        delta = block6.difficulty - block9.difficulty
+        assert abs(delta - math.log(config.MAX_RETARGET_FACTOR, 16)) < 1e-4, \
+            "Slow period should lower difficulty by at most MAX_RETARGET_FACTOR"
+        print(f"   {block6.difficulty:.4f} -> {block9.difficulty:.4f} (목표값 {config.MAX_RETARGET_FACTOR}배)")
+
+        # Case E: 규칙과 다른 bits 거부
+        print("\n5. 조작된 목표값 거부")
+        config.SIM_TIME = 201
+        forged = node.create_block_template()
+        forged.difficulty = forged.difficulty - 0.25
+        forged.mine_block()
+        tip = node.chain_tip
+        node.receive_block(forged)
+        assert node.chain_tip == tip, "Block with wrong bits should be rejected"
+        assert forged.hash not in node.block_index, "Rejected block should not be stored"
+
+        # 목표값을 넘는 해시 거부
+        easy = node.create_block_template()
+        easy.mine_block()
+        while int(easy.hash, 16) < easy.target:
+            easy.nonce += 1
+            easy.hash = easy.calculate_hash()
+        node.receive_block(easy)
+        assert node.chain_tip == tip, "Hash above the target should be rejected"
+        print("   bits 조작 / 목표값 초과 해시 모두 거부")
+    finally:
+        config.SERIALIZATION_FORMAT, config.SIM_TIME = saved
+
+    print("\n[OK] 시나리오 28 검증 완료")
+
+
+if __name__ == "__main__":
+    try:
+        test_fractional_difficulty()
+        print("\n[OK] Fractional Difficulty Test PASSED")
+        sys.exit(0)
+    except AssertionError as e:
+        print(f"\n[FAIL] Test FAILED: {e}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n[FAIL] Test ERROR: {e}")
+        sys.exit(1)
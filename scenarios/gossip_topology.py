@@ -0,0 +1,195 @@
+"""
+시나리오 33: 피어 토폴로지와 Gossip 전파
+
+노드는 이웃에게 블록/거래 해시만 알리고(inv), 갖고 있지 않은 이웃만 본문을 요청(getdata)하므로
+모든 노드가 각 항목을 정확히 한 번 받아야 하고, 메시지 수는 노드 수 × 이웃 수에 비례해야 함
+(풀 메시 기준선은 노드 수의 제곱)
+"""
+
+import sys
+import os
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from blockchain import Node, NetworkSimulator, Wallet, config
+from blockchain.topology import (
+    TOPOLOGIES, build_topology, full_mesh, small_world, random_regular, scale_free, is_connected, connected_components
+)
+
+
+def _build_network(count, kind=None, degree=4, seed=7, first_id=None):
+    """노드 count개 네트워크 구성 후 토폴로지 설정 (kind가 None이면 직접 전송)"""
+    config.SIM_TIME = 0
+    network = NetworkSimulator(seed=seed)
+    for i in range(count):
+        node_id = first_id if i == 0 and first_id else f"N{i}"
+        network.add_node(Node(node_id, network.genesis_block))
+    if kind:
+        network.set_topology(kind, degree=degree)
+    return network
+
+
+def _propagate_block(network, miner_index=0, wait=30):
+    """한 노드가 블록을 채굴해 전파하고, 전파가 끝날 때까지 이벤트 처리"""
+    scheduler = network.scheduler
+    config.SIM_TIME = scheduler.now = scheduler.now + 1
+    miner = network.nodes[miner_index]
+    block = miner.try_mine()
+    miner.receive_block(block)
+    network.relay_block(miner, block)
+    scheduler.run(until=scheduler.now + wait)
+    return block
+
+
+def test_gossip_topology():
+    """피어 토폴로지와 Gossip 전파 테스트"""
+    print("[TEST] 시나리오: 피어 토폴로지와 Gossip 전파")
+
+    saved = (config.SIM_TIME, config.LINK_LATENCY, config.LINK_BANDWIDTH)
+    try:
+        config.LINK_LATENCY = 0.1
+        config.LINK_BANDWIDTH = None  # 지연만으로 홉 수를 확인
+
+        # Case A: 토폴로지 생성기
+        print("\n1. 토폴로지 생성")
+        n = 1000
+        regular = build_topology("random_regular", n, random.Random(1), degree=8)
+        assert all(len(neighbors) == 8 for neighbors in regular), "Random regular graph should be 8-regular"
+        assert all(i not in neighbors for i, neighbors in enumerate(regular)), "No self loops"
+        assert all(i in regular[j] for i, neighbors in enumerate(regular) for j in neighbors), "Edges are undirected"
+        assert regular == build_topology("random_regular", n, random.Random(1), degree=8), "Same seed, same graph"
+
+        lattice = small_world(20, 4, 0.0, random.Random(1))
+        assert lattice[0] == {1, 2, 18, 19}, "Zero rewiring should give a ring lattice"
+        rewired = build_topology("small_world", n, random.Random(1), degree=8, rewire_prob=0.2)
+        assert sum(map(len, rewired)) == 8 * n, "Rewiring should keep the edge count"
+
+        hubs = build_topology("scale_free", n, random.Random(1), degree=8)
+        degrees = sorted(map(len, hubs))
+        assert min(degrees) >= 4 and degrees[-1] > 5 * (sum(degrees) / n), "Scale-free graph should have hubs"
+        for graph in (regular, rewired, hubs):
+            assert is_connected(graph), "Generated topology should be connected"
+
+        for bad in (lambda: random_regular(5, 3, random.Random(1)),
+                    lambda: build_topology("ring", 10, random.Random(1))):
+            try:
+                bad()
+                assert False, "Invalid topology parameters should raise ValueError"
+            except ValueError:
+                pass
+        print(f"   regular 차수 8, small-world 연결 {sum(map(len, rewired)) // 2}개, "
+              f"scale-free 최대 차수 {degrees[-1]}")
+
+        # 분리된 그래프는 다시 생성하거나 다리 연결을 추가해 항상 연결 그래프 반환
+        assert not is_connected(random_regular(60, 2, random.Random(4))), "Degree-2 regular graph should split"
+        assert len(connected_components(small_world(60, 2, 1.0, random.Random(4)))) > 1, \
+            "Fully rewired ring should split"
+        for kind in ("random_regular", "small_world"):
+            graph = build_topology(kind, 60, random.Random(4), degree=2, rewire_prob=1.0)
+            assert is_connected(graph), f"{kind} should be regenerated or bridged into a connected graph"
+        bridged = build_topology("small_world", 60, random.Random(4), degree=2, rewire_prob=1.0, max_attempts=1)
+        assert is_connected(bridged), "Bridge edges should connect the components"
+
+        # 노드 수가 적으면 차수/연결 수를 n - 1로 제한 (예외 없음)
+        assert scale_free(3, 5, random.Random(1)) == full_mesh(3), "Links should be capped at n - 1"
+        assert random_regular(4, 9, random.Random(1)) == full_mesh(4), "Degree should be capped at n - 1"
+        for kind in TOPOLOGIES:
+            for count in (1, 2, 3, 5):
+                graph = build_topology(kind, count, random.Random(1), degree=8)
+                assert len(graph) == count and is_connected(graph), f"{kind} with {count} nodes should be connected"
+                assert all(len(neighbors) <= count - 1 for neighbors in graph), "Degree should be capped at n - 1"
+        print("   분리된 그래프 복구, 작은 네트워크(1~5노드) 연결 확인")
+
+        # Case B: inv/getdata - 각 노드는 블록을 한 번만 요청/수신
+        print("\n2. inv/getdata 블록 전파")
+        count, degree = 30, 4
+        network = _build_network(count, "random_regular", degree)
+        block = _propagate_block(network)
+        stats = network.event_stats
+
+        assert all(block.hash in node.block_index for node in network.nodes), "Every node should get the block"
+        assert stats['getdata_messages'] == count - 1, "Each node should request the block once"
+        assert stats['block_messages'] == count - 1, "Each node should receive the block body once"
+        # 채굴자는 이웃 모두에게, 나머지는 받은 이웃을 제외하고 알림
+        assert stats['inv_messages'] == degree + (count - 1) * (degree - 1), "Unexpected inv count"
+        assert stats['redundant_invs'] == stats['inv_messages'] - stats['getdata_messages'], \
+            "Every inv is either a request or a duplicate"
+        print(f"   inv {stats['inv_messages']}, getdata {stats['getdata_messages']}, "
+              f"블록 {stats['block_messages']}, 중복 inv {stats['redundant_invs']}")
+
+        # Case C: 거래 gossip
+        print("\n3. 거래 gossip")
+        alice, bob = Wallet("Alice"), Wallet("Bob")
+        network = _build_network(count, "small_world", degree, first_id=alice.address)
+        network.register_wallet(alice)
+        _propagate_block(network)  # Alice 노드 채굴 보상
+
+        before = network.event_stats['tx_messages']
+        tx = network.submit_transaction(alice.address, bob.address, 5)
+        network.scheduler.run(until=network.scheduler.now + 30)
+        txid = network.nodes[0].compute_txid(tx)
+        assert all(txid in node.mempool for node in network.nodes), "Every mempool should get the tx"
+        assert network.event_stats['tx_messages'] - before == count - 1, "Each node should fetch the tx once"
+        tx_stats = network.get_propagation_stats('tx')
+        assert tx_stats['items'] == 1 and tx_stats['coverage'] == 1.0, "Tx propagation should be complete"
+        print(f"   거래 {txid[:8]} 전파 완료 (최대 지연 {tx_stats['max_delay']:.2f}초)")
+
+        # Case D: 기준선과 비교 - 직접 전송 / 풀 메시 gossip / 무작위 정규 gossip
+        print("\n4. 전파 지연 / 메시지 오버헤드 비교")
+        count = 60
+        results = {}
+        for kind in (None, "full_mesh", "random_regular", "scale_free"):
+            network = _build_network(count, kind, degree=6)
+            _propagate_block(network)
+            results[kind] = network.get_propagation_stats()
+            network.print_propagation_stats()
+
+        push, mesh, regular = results[None], results["full_mesh"], results["random_regular"]
+        assert all(r['coverage'] == 1.0 for r in results.values()), "Every topology should reach all nodes"
+        assert push['inv_messages'] == 0 and push['data_messages'] == count - 1, "Direct push sends bodies only"
+        assert abs(push['max_delay'] - 0.1) < 1e-9, "Direct push takes one latency"
+        assert abs(mesh['max_delay'] - 0.3) < 1e-9, "Full-mesh gossip takes one inv/getdata/block round"
+        assert mesh['inv_messages'] >= (count - 1) * (count - 2), "Full-mesh gossip announces O(N^2)"
+        assert regular['inv_messages'] < mesh['inv_messages'] / 5, "Sparse gossip should send far fewer invs"
+        assert regular['max_delay'] >= 0.6, "Sparse gossip needs multiple hops"
+        assert regular['data_messages'] == mesh['data_messages'] == count - 1, "Bodies are fetched once per node"
+
+        # Case E: 큰 네트워크 - 메시지 수는 노드 수 × 이웃 수
+        print("\n5. 큰 네트워크 전파")
+        count, degree = 2000, 8
+        network = _build_network(count, "random_regular", degree)
+        block = _propagate_block(network, wait=60)
+        stats = network.get_propagation_stats()
+        assert stats['coverage'] == 1.0, "Block should reach all 2000 nodes"
+        assert stats['inv_messages'] == degree + (count - 1) * (degree - 1), "Inv count should be O(N * degree)"
+        print(f"   {count}노드: inv {stats['inv_messages']} (풀 메시라면 {count * (count - 1)}), "
+              f"최대 지연 {stats['max_delay']:.1f}초")
+
+        # Case F: 채굴 포함 시뮬레이션 재현성 (같은 시드 -> 같은 토폴로지와 결과)
+        print("\n6. 시드 재현성")
+        runs = []
+        for _ in range(2):
+            network = _build_network(40, "scale_free", degree=4, seed=21)
+            network.run_event_simulation(duration=20)
+            runs.append((network.scheduler.processed, dict(network.event_stats),
+                         [node.chain_tip for node in network.nodes]))
+        assert runs[0] == runs[1], "Same seed should give identical gossip runs"
+        print(f"   두 실행 동일: 이벤트 {runs[0][0]}개, inv {runs[0][1]['inv_messages']}개")
+    finally:
+        config.SIM_TIME, config.LINK_LATENCY, config.LINK_BANDWIDTH = saved
+
+    print("\n[OK] 시나리오 33 검증 완료")
+
+
+if __name__ == "__main__":
+    try:
+        test_gossip_topology()
+        print("\n[OK] Gossip Topology Test PASSED")
+        sys.exit(0)
+    except AssertionError as e:
+        print(f"\n[FAIL] Test FAILED: {e}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n[FAIL] Test ERROR: {e}")
+        sys.exit(1)
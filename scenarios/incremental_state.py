@@ -0,0 +1,102 @@
+"""
+시나리오 15: 증분 상태 + Undo Log
+
+팁 이동 시 새 블록만 상태에 적용하고,
+Reorg 시 공통 조상까지만 롤백한 뒤 새 가지를 재생해도
+제네시스부터 전체 Replay한 결과와 동일해야 함
+"""
+
+import sys
+import os
+import copy
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from blockchain import Node, NetworkSimulator, Wallet, config
+
+
+def test_incremental_state():
+    """증분 상태 적용 및 Undo Log 롤백 테스트"""
+    print("[TEST] 시나리오: 증분 상태 + Undo Log")
+
+    network = NetworkSimulator()
+    wallet_alice = Wallet("Alice")
+    wallet_bob = Wallet("Bob")
+
+    network.register_wallet(wallet_alice)
+    network.register_wallet(wallet_bob)
+
+    node = Node(wallet_alice.address, network.genesis_block)
+
+    # Case A: 단순 연장 시 증분 적용
+    print("\n1. 단순 연장 (블록 1-3)")
+    config.SIM_TIME = 1
+    block1 = node.try_mine()
+    node.receive_block(block1)
+
+    tx1 = wallet_alice.create_transaction(wallet_bob.address, 10, 1)
+    node.add_transaction(tx1)
+    config.SIM_TIME = 2
+    block2 = node.try_mine()
+    node.receive_block(block2)
+
+    tx2 = wallet_alice.create_transaction(wallet_bob.address, 5, 2)
+    node.add_transaction(tx2)
+    config.SIM_TIME = 3
+    block3 = node.try_mine()
+    node.receive_block(block3)
+
+    replayed = node.get_state_at(node.chain_tip).to_dict()
+    print(f"   증분 상태: {node.state.get(wallet_alice.address)}")
+    print(f"   전체 Replay: {replayed.get(wallet_alice.address)}")
+    assert node.state == replayed, "Incremental state should match full replay"
+    assert block3.hash in node.undo_logs, "Tip block should have an undo log"
+
+    # Case B: Reorg 시 공통 조상까지만 롤백
+    print("\n2. block1에서 분기한 더 무거운 체인으로 Reorg")
+    node2 = Node(wallet_bob.address, network.genesis_block)
+    node2.receive_block(copy.deepcopy(block1))
+
+    tx_alt = wallet_alice.create_transaction(wallet_bob.address, 20, 1)
+    node2.add_transaction(tx_alt)
+    alt_blocks = []
+    for t in (4, 5, 6):
+        config.SIM_TIME = t
+        block = node2.try_mine()
+        node2.receive_block(block)
+        alt_blocks.append(block)
+
+    for block in alt_blocks:
+        node.receive_block(copy.deepcopy(block))
+
+    alice_state = node.state.get(wallet_alice.address, {'balance': 0, 'nonce': 0})
+    bob_state = node.state.get(wallet_bob.address, {'balance': 0, 'nonce': 0})
+    print(f"   Alice: balance={alice_state['balance']}, nonce={alice_state['nonce']}")
+    print(f"   Bob: balance={bob_state['balance']}, nonce={bob_state['nonce']}")
+
+    assert node.chain_tip == alt_blocks[-1].hash, "Alt chain should be adopted"
+    assert node.state == node.get_state_at(node.chain_tip).to_dict(), "State after reorg should match full replay"
+    assert alice_state['balance'] == 50 - 20, "Alice balance incorrect after reorg"
+    assert alice_state['nonce'] == 1, "Alice nonce incorrect after reorg"
+    assert bob_state['balance'] == 20 + 50 * 3, "Bob balance incorrect after reorg"
+
+    # 버려진 블록의 Undo Log는 제거되어야 함
+    assert block2.hash not in node.undo_logs, "Discarded block undo log should be dropped"
+    assert block3.hash not in node.undo_logs, "Discarded block undo log should be dropped"
+    assert all(b.hash in node.undo_logs for b in alt_blocks), "Adopted blocks should have undo logs"
+
+    print("\n[OK] 시나리오 15 검증 완료")
+    return True
+
+
+if __name__ == "__main__":
+    try:
+        test_incremental_state()
+        print("\n[OK] Incremental State Test PASSED")
+        sys.exit(0)
+    except AssertionError as e:
+        print(f"\n[FAIL] Test FAILED: {e}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n[FAIL] Test ERROR: {e}")
+        sys.exit(1)
@@ -69,7 +69,7 @@ def test_mempool_cleanup_after_reorg():
     block3_alt = node2.try_mine()
     node2.receive_block(block3_alt)
 
-    print(f"   Alt chain 작업량: {node2.get_tip_block().total_work}")
+    print(f"   Alt chain 작업량: {node2.get_chain_work()}")
 
     # Reorg 발생
     print("\n5. Reorg 발생")
@@ -97,7 +97,7 @@ def test_mempool_cleanup_after_reorg():
 
     # tx2만 남아야 함 (nonce 2)
     assert len(node.mempool) == 1, "Only tx2 should remain in mempool"
-    assert node.mempool[0]['body']['nonce'] == 2, "Remaining tx should have nonce 2"
+    assert list(node.mempool)[0]['body']['nonce'] == 2, "Remaining tx should have nonce 2"
 
     # 추가 검증: 남은 tx의 서명도 유효한지
     for tx in node.mempool:
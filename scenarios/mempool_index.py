@@ -0,0 +1,140 @@
+"""
+시나리오 18: txid 인덱스 멤풀
+
+멤풀은 txid(body 해시)로 인덱싱되어
+중복 제출은 삽입 시점에 거부되고, 조회/삭제는 txid로 즉시 처리되며
+순회 시 도착 순서가 유지되어야 함
+블록 템플릿은 송신자별 nonce 큐에서 실행 가능한 거래만 꺼내 구성
+팁 변경 시에는 영향받은 송신자만 재검증
+"""
+
+import sys
+import os
+import copy
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from blockchain import Node, NetworkSimulator, Wallet, config
+
+
+def test_mempool_index():
+    """txid 인덱스 멤풀 테스트"""
+    print("[TEST] 시나리오: txid 인덱스 멤풀")
+
+    network = NetworkSimulator()
+    wallet_alice = Wallet("Alice")
+    wallet_bob = Wallet("Bob")
+
+    node = Node(wallet_alice.address, network.genesis_block)
+
+    config.SIM_TIME = 1
+    block1 = node.try_mine()
+    node.receive_block(block1)
+
+    # Case A: 중복 제출 거부
+    print("\n1. 중복 제출 거부")
+    tx1 = wallet_alice.create_transaction(wallet_bob.address, 10, 1)
+    tx2 = wallet_alice.create_transaction(wallet_bob.address, 5, 2)
+
+    assert node.add_transaction(tx1), "First submission should be accepted"
+    assert not node.add_transaction(copy.deepcopy(tx1)), "Duplicate submission should be rejected"
+    assert node.add_transaction(tx2), "Different tx should be accepted"
+    print(f"   Mempool 크기: {len(node.mempool)}")
+    assert len(node.mempool) == 2, "Mempool should hold 2 unique transactions"
+
+    # Case B: txid / 트랜잭션으로 조회
+    print("\n2. txid 조회")
+    txid1 = node.compute_txid(tx1)
+    assert txid1 in node.mempool, "Membership by txid should work"
+    assert tx1 in node.mempool, "Membership by tx should work"
+    assert node.mempool.get(txid1) is tx1, "Lookup by txid should return the stored tx"
+
+    # Case C: 도착 순서 유지
+    print("\n3. 도착 순서 유지")
+    nonces = [tx['body']['nonce'] for tx in node.mempool]
+    print(f"   순회 순서 (nonce): {nonces}")
+    assert nonces == [1, 2], "Iteration should follow arrival order"
+
+    # Case D: 블록 확정 시 txid로 제거
+    print("\n4. 블록 확정 후 제거")
+    config.SIM_TIME = 2
+    block2 = node.try_mine()
+    node.receive_block(block2)
+    print(f"   Mempool 크기: {len(node.mempool)}")
+    assert len(node.mempool) == 0, "Confirmed transactions should be removed"
+    assert txid1 not in node.mempool, "Removed txid should not be found"
+
+    # Case E: 송신자별 nonce 큐 기반 선택 (역순 도착)
+    print("\n5. nonce 역순 도착 거래의 블록 템플릿 선택")
+    alice_nonce = node.get_confirmed_nonce(wallet_alice.address)
+    alice_balance = node.state[wallet_alice.address]['balance']
+    print(f"   Alice: balance={alice_balance}, nonce={alice_nonce}")
+
+    tx_c = wallet_alice.create_transaction(wallet_bob.address, 1, alice_nonce + 3)
+    tx_b = wallet_alice.create_transaction(wallet_bob.address, 1, alice_nonce + 2)
+    assert node.add_transaction(tx_c) and node.add_transaction(tx_b)
+    assert wallet_alice.address not in node.mempool.ready_senders(), "Sender should not be ready with a nonce gap"
+
+    tx_a = wallet_alice.create_transaction(wallet_bob.address, 1, alice_nonce + 1)
+    node.add_transaction(tx_a)
+    assert wallet_alice.address in node.mempool.ready_senders(), "Sender should be ready once the next nonce arrives"
+
+    selected = node.select_txs_for_block(max_txs=5)
+    nonces = [tx['body']['nonce'] for tx in selected]
+    print(f"   선택된 nonce: {nonces}")
+    assert nonces == [alice_nonce + 1, alice_nonce + 2, alice_nonce + 3], "Selection should follow nonce order"
+    assert len(node.select_txs_for_block(max_txs=2)) == 2, "Selection should stop at max_txs"
+
+    # Case F: 잔액 한도 초과 거래는 선택하지 않음
+    print("\n6. 잔액 한도")
+    tx_big = wallet_alice.create_transaction(wallet_bob.address, alice_balance, alice_nonce + 4)
+    node.add_transaction(tx_big)
+    selected = node.select_txs_for_block(max_txs=5)
+    print(f"   선택된 거래 수: {len(selected)}")
+    assert tx_big not in selected, "Transaction exceeding the remaining balance should not be selected"
+    assert len(selected) == 3, "Affordable transactions should still be selected"
+
+    # Case G: 증분 재검증 (영향받은 송신자만)
+    print("\n7. 팁 변경 시 증분 재검증")
+    wallet_carol = Wallet("Carol")
+    tx_carol = wallet_carol.create_transaction(wallet_bob.address, 1, 1)  # 잔액 없음
+    node.add_transaction(tx_carol)
+
+    revalidated = []
+    original_revalidate = node.revalidate_sender
+
+    def recording_revalidate(sender):
+        revalidated.append(sender)
+        original_revalidate(sender)
+
+    node.revalidate_sender = recording_revalidate
+
+    config.SIM_TIME = 3
+    block3 = node.try_mine()
+    node.receive_block(block3)
+
+    print(f"   재검증된 송신자 수: {len(revalidated)}, Mempool 크기: {len(node.mempool)}")
+    assert sorted(revalidated) == sorted([wallet_alice.address, wallet_carol.address]), \
+        "Only touched senders and senders with new transactions should be revalidated"
+    assert tx_big in node.mempool, "Next-nonce transaction affordable after the coinbase should be kept"
+    assert tx_carol not in node.mempool, "Unfunded transaction should be evicted"
+    assert len(node.mempool) == 1, "Only the still-valid transaction should remain"
+    assert not node.mempool.pop_dirty(), "No sender should remain dirty after revalidation"
+
+    del node.revalidate_sender
+
+    print("\n[OK] 시나리오 18 검증 완료")
+    return True
+
+
+if __name__ == "__main__":
+    try:
+        test_mempool_index()
+        print("\n[OK] Mempool Index Test PASSED")
+        sys.exit(0)
+    except AssertionError as e:
+        print(f"\n[FAIL] Test FAILED: {e}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n[FAIL] Test ERROR: {e}")
+        sys.exit(1)
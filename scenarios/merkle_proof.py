@@ -0,0 +1,128 @@
+"""
+시나리오 24: 머클 루트 + 포함 증명
+
+블록 해시는 머클 루트를 담은 고정 크기 헤더만 해싱하고,
+확정 거래는 블록 전체 없이 머클 포함 증명으로 검증할 수 있어야 함
+"""
+
+import sys
+import os
+import copy
+import hashlib
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from blockchain import Node, NetworkSimulator, Wallet, config
+from blockchain import encoding
+from blockchain.merkle import merkle_root, merkle_proof, verify_merkle_proof, EMPTY_ROOT
+
+
+def test_merkle_proof():
+    """머클 루트 + 포함 증명 테스트"""
+    print("[TEST] 시나리오: 머클 루트 + 포함 증명")
+
+    # Case A: 리프 수별 모든 위치의 증명 검증
+    print("\n1. 리프 수별 포함 증명")
+    assert merkle_root([]) == EMPTY_ROOT, "Empty tree should have the empty root"
+    for count in (1, 2, 3, 5, 8):
+        leaves = [hashlib.sha256(bytes([i])).digest() for i in range(count)]
+        root = merkle_root(leaves)
+        for position in range(count):
+            proof = merkle_proof(leaves, position)
+            assert verify_merkle_proof(leaves[position], proof, root), f"Proof should verify ({count}, {position})"
+        assert not verify_merkle_proof(hashlib.sha256(b'x').digest(), merkle_proof(leaves, 0), root), \
+            "Foreign leaf should not verify"
+        print(f"   리프 {count}개: 증명 길이 {len(merkle_proof(leaves, 0))}")
+
+    saved = (config.SERIALIZATION_FORMAT, config.MAX_TXS_PER_BLOCK)
+    try:
+        config.SERIALIZATION_FORMAT = "binary"
+        config.MAX_TXS_PER_BLOCK = 10
+
+        network = NetworkSimulator()
+        wallet_alice = Wallet("Alice")
+        wallet_bob = Wallet("Bob")
+
+        node = Node(wallet_alice.address, network.genesis_block)
+        config.SIM_TIME = 1
+        block1 = node.try_mine()
+        node.receive_block(block1)
+
+        txs = [wallet_alice.create_transaction(wallet_bob.address, 1, nonce) for nonce in range(1, 8)]
+        for tx in txs:
+            node.add_transaction(tx)
+        config.SIM_TIME = 3
+        block2 = node.try_mine()
+        node.receive_block(block2)
+        assert node.chain_tip == block2.hash, "Block should be accepted"
+
+        # Case B: 헤더 크기는 트랜잭션 수와 무관
+        print("\n2. 고정 크기 헤더")
+        empty = copy.deepcopy(block2)
+        empty.transactions = []
+        print(f"   헤더 크기: 거래 {len(block2.transactions)}개={len(block2.encode_header())}, "
+              f"거래 0개={len(empty.encode_header())} bytes")
+        assert len(block2.encode_header()) == len(empty.encode_header()), \
+            "Header size should not depend on the number of transactions"
+        header = encoding.decode_block_header(block2.encode_header())
+        assert header['merkle_root'] == block2.compute_merkle_root(), "Header should commit to the Merkle root"
+
+        # Case C: 노드의 확정 거래 포함 증명
+        print("\n3. 확정 거래 포함 증명")
+        for tx in txs:
+            block_hash, root, proof = node.get_transaction_proof(node.compute_txid(tx))
+            assert block_hash == block2.hash
+            assert verify_merkle_proof(encoding.transaction_hash(tx), proof, root), "Confirmed tx proof should verify"
+        print(f"   {len(txs)}개 거래 증명 검증 완료")
+        assert node.get_transaction_proof("0" * 64) is None, "Unknown txid should have no proof"
+
+        # Case D: 서명까지 커밋 (서명 변경 시 루트/해시 변경)
+        print("\n4. 변조 감지")
+        tampered = copy.deepcopy(block2)
+        tampered.transactions[1]['signature'] = tampered.transactions[2]['signature']
+        assert tampered.compute_merkle_root() != block2.compute_merkle_root(), "Signature change should change the root"
+        assert tampered.calculate_hash() != block2.hash, "Signature change should change the block hash"
+
+        # Case E: 마지막 리프 복제 변조 (CVE-2012-2459) - [a,b,c]와 [a,b,c,c]의 루트가 달라야 함
+        print("\n5. 마지막 리프 복제 변조")
+        a, b, c = (hashlib.sha256(bytes([i])).digest() for i in range(3))
+        assert merkle_root([a, b, c]) != merkle_root([a, b, c, c]), "Duplicated last leaf should change the root"
+        leaves6 = [hashlib.sha256(bytes([i])).digest() for i in range(6)]
+        assert merkle_root(leaves6) != merkle_root(leaves6 + leaves6[4:]), \
+            "Duplicated odd subtree should change the root"
+
+        for nonce in (8, 9):
+            node.add_transaction(wallet_alice.create_transaction(wallet_bob.address, 1, nonce))
+        config.SIM_TIME = 5
+        block3 = node.try_mine()
+        assert len(block3.transactions) == 3, "Block should have an odd number of transactions"
+        mutated = copy.deepcopy(block3)
+        mutated.transactions.append(copy.deepcopy(block3.transactions[-1]))
+        mutated.hash = mutated.calculate_hash()
+        assert mutated.hash != block3.hash, "Mutated transaction list should not share the block hash"
+
+        # 변조본을 먼저 받아 거부해도 원본 블록은 별개의 해시이므로 그대로 수락
+        peer = Node("Peer", network.genesis_block)
+        for block in (block1, block2, mutated, block3):
+            peer.receive_block(block)
+        assert mutated.hash not in peer.block_index, "Mutated block should be rejected"
+        assert peer.chain_tip == block3.hash, "Original block should still be accepted after the mutated copy"
+        print(f"   원본 {block3.hash[:8]} / 변조본 {mutated.hash[:8]} - 해시 다름, 원본 수락")
+    finally:
+        config.SERIALIZATION_FORMAT, config.MAX_TXS_PER_BLOCK = saved
+
+    print("\n[OK] 시나리오 24 검증 완료")
+    return True
+
+
+if __name__ == "__main__":
+    try:
+        test_merkle_proof()
+        print("\n[OK] Merkle Proof Test PASSED")
+        sys.exit(0)
+    except AssertionError as e:
+        print(f"\n[FAIL] Test FAILED: {e}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n[FAIL] Test ERROR: {e}")
+        sys.exit(1)
@@ -0,0 +1,97 @@
+"""
+시나리오 25: Midstate 채굴 엔진
+
+채굴 루프는 nonce를 제외한 헤더 앞부분을 한 번만 해싱해 두고 nonce마다 복사해서 이어 해싱하며,
+다이제스트를 정수 목표값과 비교해도 기존 루프와 같은 nonce/해시를 찾아야 함
+"""
+
+import sys
+import os
+import copy
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from blockchain import Block, Node, NetworkSimulator, Wallet, config
+from blockchain.mining import difficulty_to_target
+
+
+def test_mining_engine():
+    """Midstate 채굴 엔진 테스트"""
+    print("[TEST] 시나리오: Midstate 채굴 엔진")
+
+    # Case A: 정수 목표값 == 16진수 선행 0 조건
+    print("\n1. 정수 목표값")
+    for difficulty in range(0, 6):
+        target = difficulty_to_target(difficulty)
+        boundary = format(target - 1, '064x') if difficulty else "f" * 64
+        assert boundary.startswith("0" * difficulty), "Largest valid hash should have the required zeros"
+        if difficulty:
+            assert not format(target, '064x').startswith("0" * difficulty), "Target itself should be invalid"
+    print("   난이도 0-5 경계 확인")
+
+    saved_format = config.SERIALIZATION_FORMAT
+    try:
+        config.SERIALIZATION_FORMAT = "binary"
+
+        network = NetworkSimulator()
+        wallet_alice = Wallet("Alice")
+        wallet_bob = Wallet("Bob")
+
+        node = Node(wallet_alice.address, network.genesis_block)
+        config.SIM_TIME = 1
+        block1 = node.try_mine()
+        node.receive_block(block1)
+        node.add_transaction(wallet_alice.create_transaction(wallet_bob.address, 10, 1))
+
+        # Case B: 기존 루프와 같은 결과
+        print("\n2. 기존 루프와 결과 비교")
+        template = Block(
+            index=2,
+            timestamp=2,
+            transactions=[{"body": {"sender": "SYSTEM", "recipient": wallet_alice.address,
+                                    "amount": config.MINING_REWARD, "nonce": 0}, "sig": None}]
+                         + copy.deepcopy(list(node.mempool)),
+            difficulty=4,
+            previous_hash=block1.hash,
+            miner_id=wallet_alice.address
+        )
+        fast = copy.deepcopy(template)
+        fast_stats = fast.mine_block()
+
+        legacy = copy.deepcopy(template)
+        start = time.perf_counter()
+        legacy_stats = legacy.mine_block_legacy()
+        legacy_elapsed = time.perf_counter() - start
+
+        print(f"   Midstate: {fast_stats.hash_rate:.0f} H/s, 기존 루프: {legacy_stats / legacy_elapsed:.0f} H/s")
+        print(f"   nonce: midstate={fast.nonce}, legacy={legacy.nonce}")
+        assert (fast.nonce, fast.hash) == (legacy.nonce, legacy.hash), "Both loops should find the same nonce"
+        assert fast.hash == fast.calculate_hash(), "Mined hash should match the header hash"
+        assert fast_stats.hashes == legacy_stats == fast.nonce + 1, "Hash count should be reported"
+        assert fast_stats.hash_rate > 0, "Hash rate should be reported"
+
+        # Case C: 채굴한 블록이 검증을 통과
+        print("\n3. 채굴 블록 검증")
+        config.SIM_TIME = 3
+        block2 = node.try_mine()
+        node.receive_block(block2)
+        assert node.chain_tip == block2.hash, "Block mined with the midstate loop should be accepted"
+    finally:
+        config.SERIALIZATION_FORMAT = saved_format
+
+    print("\n[OK] 시나리오 25 검증 완료")
+    return True
+
+
+if __name__ == "__main__":
+    try:
+        test_mining_engine()
+        print("\n[OK] Mining Engine Test PASSED")
+        sys.exit(0)
+    except AssertionError as e:
+        print(f"\n[FAIL] Test FAILED: {e}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n[FAIL] Test ERROR: {e}")
+        sys.exit(1)
@@ -4,12 +4,11 @@
 블록과 트랜잭션의 네트워크 전파 기능 검증
 - 블록 브로드캐스트 (모든 노드에 전파)
 - 트랜잭션 브로드캐스트
-- 각 노드가 독립적인 복사본을 받는지 확인 (deepcopy)
+- 각 노드가 복사본 대신 고정(freeze)된 같은 객체를 공유하는지 확인
 """
 
 import sys
 import os
-import copy
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -68,23 +67,33 @@ def test_network_broadcast():
     assert node2.get_tip_block().hash == block1.hash, "Node2 tip should be block1"
     assert node3.get_tip_block().hash == block1.hash, "Node3 tip should be block1"
 
-    # Case C: deepcopy 확인 (각 노드가 독립적인 블록 객체를 가지는지)
-    print("\n3. Deepcopy 검증 (각 노드의 블록 객체 독립성)")
+    # Case C: 공유 확인 (모든 노드가 고정된 같은 블록 객체를 가지는지)
+    print("\n3. 불변 블록 공유 검증 (복사 없이 같은 객체)")
     block1_node1 = node1.block_index[block1.hash]
     block1_node2 = node2.block_index[block1.hash]
     block1_node3 = node3.block_index[block1.hash]
 
-    # 객체 ID가 다른지 확인 (다른 메모리 주소)
     print(f"   Node1 block1 id: {id(block1_node1)}")
     print(f"   Node2 block1 id: {id(block1_node2)}")
     print(f"   Node3 block1 id: {id(block1_node3)}")
 
-    assert id(block1_node1) != id(block1_node2), "Nodes should have different block objects"
-    assert id(block1_node2) != id(block1_node3), "Nodes should have different block objects"
-    assert id(block1_node1) != id(block1_node3), "Nodes should have different block objects"
+    assert block1_node1 is block1_node2 is block1_node3, "Nodes should share one block object"
+    assert block1_node1.frozen, "Shared block should be frozen"
+    assert block1_node1.hash == block1_node1.calculate_hash(), "Freezing should not change the hash"
 
-    # 하지만 내용은 같아야 함
-    assert block1_node1.hash == block1_node2.hash == block1_node3.hash, "Block hashes should match"
+    # 공유 객체는 수정할 수 없음 (노드별 누적 작업량은 노드가 보관)
+    try:
+        block1_node2.nonce += 1
+        assert False, "Frozen block should reject attribute assignment"
+    except AttributeError:
+        pass
+    try:
+        block1_node2.transactions[0]['body']['amount'] = 10 ** 6
+        assert False, "Frozen transaction should reject item assignment"
+    except TypeError:
+        pass
+    assert node1.get_chain_work() == node2.get_chain_work() == node3.get_chain_work(), \
+        "Every node should compute the same chain work"
 
     # Case D: 트랜잭션 브로드캐스트
     print("\n4. 트랜잭션 네트워크 브로드캐스트")
@@ -102,17 +111,21 @@ def test_network_broadcast():
     assert len(node3.mempool) == 1, "Node3 should have 1 transaction"
 
     # 트랜잭션 내용 확인
-    tx_node1 = node1.mempool[0]
-    tx_node2 = node2.mempool[0]
-    tx_node3 = node3.mempool[0]
+    tx_node1 = list(node1.mempool)[0]
+    tx_node2 = list(node2.mempool)[0]
+    tx_node3 = list(node3.mempool)[0]
 
     assert tx_node1['body']['sender'] == wallet_alice.address, "Sender should be Alice"
     assert tx_node1['body']['recipient'] == wallet_bob.address, "Recipient should be Bob"
     assert tx_node1['body']['amount'] == 10, "Amount should be 10"
 
-    # 각 노드가 독립적인 트랜잭션 객체를 가지는지 확인
-    assert id(tx_node1) != id(tx_node2), "Transactions should be different objects"
-    assert id(tx_node2) != id(tx_node3), "Transactions should be different objects"
+    # 모든 노드가 고정된 같은 트랜잭션 객체를 공유하는지 확인
+    assert tx_node1 is tx_node2 is tx_node3, "Nodes should share one transaction object"
+    try:
+        tx_node2['body']['amount'] = 10 ** 6
+        assert False, "Shared transaction should be immutable"
+    except TypeError:
+        pass
 
     # Case E: Node2가 블록 채굴 및 브로드캐스트
     print("\n5. Node2가 블록 채굴 (트랜잭션 포함)")
@@ -44,7 +44,6 @@ def test_orphan_blocks():
         previous_hash=block2.hash,
         miner_id=wallet_alice.address
     )
-    block3.total_work = block2.total_work + block3.block_work
     block3.mine_block()
 
     # block3을 먼저 수신 (부모 block2 없음)
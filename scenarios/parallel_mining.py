@@ -0,0 +1,107 @@
+"""
+시나리오 26: 병렬 채굴
+
+nonce 공간을 구간으로 나눠 여러 워커 프로세스가 동시에 탐색해도
+단일 프로세스 채굴과 같은 nonce/해시(가장 작은 유효 nonce)를 찾아야 함
+"""
+
+import sys
+import os
+import copy
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from blockchain import Block, config
+from blockchain import mining
+from blockchain.encoding import encode_block_header_prefix
+from blockchain.mining import (
+    mine_header, mine_header_parallel, search_nonce_range, effective_mining_workers,
+    shutdown_mining_executor, difficulty_to_target
+)
+
+
+def test_parallel_mining():
+    """병렬 채굴 테스트"""
+    print("[TEST] 시나리오: 병렬 채굴")
+
+    saved = (config.SERIALIZATION_FORMAT, config.MINING_WORKERS, config.MINING_CHUNK_SIZE)
+    try:
+        config.SERIALIZATION_FORMAT = "binary"
+
+        # Case A: 구간 탐색
+        print("\n1. 구간 탐색")
+        prefix = encode_block_header_prefix(1, 1, 3, "0" * 64, bytes(32))
+        target = difficulty_to_target(3)
+        nonce, _, _ = mine_header(prefix, target)
+        found, tried = search_nonce_range(prefix, target, 0, nonce)
+        assert found is None and tried == nonce, "Range before the solution should have no hit"
+        found, tried = search_nonce_range(prefix, target, nonce, nonce + 10)
+        assert found == nonce and tried == 1, "Range starting at the solution should hit immediately"
+        found, tried = search_nonce_range(prefix, 0, 0, None, should_abort=lambda: True)
+        assert found is None and tried == mining.ABORT_CHECK_INTERVAL, "Abort should stop at the first check"
+        print(f"   해답 nonce {nonce}, 중단 시 {tried}개에서 멈춤")
+
+        # Case B: 단일 프로세스와 같은 결과 (여러 헤더 / 워커 수 / 구간 크기)
+        print("\n2. 단일 프로세스와 결과 비교")
+        for index in range(1, 6):
+            prefix = encode_block_header_prefix(index, index, 3, "ab" * 32, bytes([index]) * 32)
+            expected_nonce, expected_hash, _ = mine_header(prefix, target)
+            for workers, chunk_size in ((2, 64), (3, 257), (4, 1000)):
+                nonce, block_hash, hashes = mine_header_parallel(prefix, target, workers, chunk_size)
+                assert (nonce, block_hash) == (expected_nonce, expected_hash), \
+                    f"Parallel result differs (workers={workers}, chunk={chunk_size})"
+                assert hashes >= expected_nonce + 1, "Hash count should cover every nonce up to the solution"
+            print(f"   헤더 {index}: nonce {expected_nonce} 일치")
+
+        # Case C: 여러 구간에 해답이 있으면 가장 낮은 구간이 이김
+        print("\n3. 가장 작은 nonce 선택")
+        easy = difficulty_to_target(1)
+        prefix = encode_block_header_prefix(7, 7, 1, "cd" * 32, bytes(32))
+        expected = mine_header(prefix, easy)
+        for _ in range(5):
+            assert mine_header_parallel(prefix, easy, 4, 4)[:2] == expected[:2], "Lowest nonce should win"
+        assert mining._found_chunk.value == mining._NO_SOLUTION, "Shared cancel flag should be reset"
+        print(f"   nonce {expected[0]} (구간 크기 4, 5회 반복 동일)")
+
+        # Case D: 워커 수 상한
+        print("\n4. 워커 수 상한")
+        cpus = os.cpu_count() or 1
+        assert effective_mining_workers(1) == 1, "Cap 1 should mean single process"
+        assert effective_mining_workers(0) == 1, "Cap below 1 should mean single process"
+        assert effective_mining_workers(1024) == cpus, "Cap should be limited by CPU count"
+        print(f"   CPU {cpus}개 -> 상한 1024는 {effective_mining_workers(1024)}개")
+
+        # Case E: Block.mine_block 경로
+        print("\n5. 블록 채굴 결과")
+        template = Block(index=1, timestamp=1, transactions=[], difficulty=3,
+                         previous_hash="0" * 64, miner_id="miner")
+        single = copy.deepcopy(template)
+        config.MINING_WORKERS = 1
+        single.mine_block()
+
+        parallel = copy.deepcopy(template)
+        config.MINING_WORKERS = 1024
+        config.MINING_CHUNK_SIZE = 128
+        parallel.mine_block()
+        assert (parallel.nonce, parallel.hash) == (single.nonce, single.hash), \
+            "Block mined with MINING_WORKERS > 1 should match single process"
+        assert parallel.hash == parallel.calculate_hash(), "Mined hash should verify"
+        print(f"   nonce {parallel.nonce} 일치")
+    finally:
+        config.SERIALIZATION_FORMAT, config.MINING_WORKERS, config.MINING_CHUNK_SIZE = saved
+        shutdown_mining_executor()
+
+    print("\n[OK] 시나리오 26 검증 완료")
+
+
+if __name__ == "__main__":
+    try:
+        test_parallel_mining()
+        print("\n[OK] Parallel Mining Test PASSED")
+        sys.exit(0)
+    except AssertionError as e:
+        print(f"\n[FAIL] Test FAILED: {e}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n[FAIL] Test ERROR: {e}")
+        sys.exit(1)
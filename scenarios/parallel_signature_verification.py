@@ -0,0 +1,116 @@
+"""
+시나리오 21: 블록 서명 병렬 일괄 검증
+
+블록의 서명은 잔액/nonce 순차 검증 이전에 워커 풀에서 일괄 검증되며,
+스레드 풀 / 프로세스 풀 / 순차 검증 모두 같은 수락/거부 결과를 내야 함
+"""
+
+import sys
+import os
+import copy
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from blockchain import Block, Node, NetworkSimulator, Wallet, SignatureCache, config
+from blockchain.crypto import shutdown_verify_executor
+
+
+# (실행기 종류, 워커 수) - 워커 수 0은 순차 검증
+MODES = (("thread", 0), ("thread", 4), ("process", 2))
+
+
+def validate_with(mode, workers, network, block1, block):
+    """새 서명 캐시를 가진 노드로 블록 검증"""
+    config.SIG_VERIFY_EXECUTOR = mode
+    config.SIG_VERIFY_WORKERS = workers
+
+    node = Node("validator", network.genesis_block, sig_cache=SignatureCache(config.SIG_CACHE_SIZE))
+    node.receive_block(copy.deepcopy(block1))
+    return node.validate_block(copy.deepcopy(block), node.get_tip_block())
+
+
+def test_parallel_signature_verification():
+    """블록 서명 병렬 일괄 검증 테스트"""
+    print("[TEST] 시나리오: 블록 서명 병렬 일괄 검증")
+
+    saved = (config.SIG_VERIFY_WORKERS, config.SIG_VERIFY_EXECUTOR,
+             config.SIG_VERIFY_BATCH_MIN, config.MAX_TXS_PER_BLOCK)
+    try:
+        config.SIG_VERIFY_BATCH_MIN = 1
+        config.MAX_TXS_PER_BLOCK = 20
+
+        network = NetworkSimulator()
+        wallet_alice = Wallet("Alice")
+        wallet_bob = Wallet("Bob")
+
+        node = Node(wallet_alice.address, network.genesis_block)
+        config.SIM_TIME = 1
+        block1 = node.try_mine()
+        node.receive_block(block1)
+
+        for nonce in range(1, 21):
+            node.add_transaction(wallet_alice.create_transaction(wallet_bob.address, 1, nonce))
+
+        config.SIM_TIME = 3
+        valid_block = node.try_mine()
+        print(f"   블록 거래 수: {len(valid_block.transactions)}")
+        assert len(valid_block.transactions) == 21, "Block should hold 20 txs plus the coinbase"
+
+        # 서명 하나만 바꾼 같은 내용의 블록 (해시/PoW는 유효)
+        bad_txs = copy.deepcopy(valid_block.transactions)
+        bad_txs[15]['signature'] = bad_txs[14]['signature']
+        bad_block = Block(
+            index=valid_block.index,
+            timestamp=valid_block.timestamp,
+            transactions=bad_txs,
+            difficulty=valid_block.difficulty,
+            previous_hash=valid_block.previous_hash,
+            miner_id=valid_block.miner_id
+        )
+        bad_block.mine_block()
+
+        # Case A: 유효한 블록 - 모든 방식에서 수락
+        print("\n1. 유효한 블록")
+        results = {f"{mode}x{workers}": validate_with(mode, workers, network, block1, valid_block)
+                   for mode, workers in MODES}
+        print(f"   결과: {results}")
+        assert all(results.values()), "Valid block should be accepted in every mode"
+
+        # Case B: 서명 하나가 잘못된 블록 - 모든 방식에서 거부
+        print("\n2. 서명 하나가 잘못된 블록")
+        results = {f"{mode}x{workers}": validate_with(mode, workers, network, block1, bad_block)
+                   for mode, workers in MODES}
+        print(f"   결과: {results}")
+        assert not any(results.values()), "Block with a bad signature should be rejected in every mode"
+
+        # Case C: 일괄 검증 결과는 캐시에 남아 순차 검증 단계에서 재사용
+        print("\n3. 일괄 검증 결과 캐시")
+        config.SIG_VERIFY_EXECUTOR = "thread"
+        config.SIG_VERIFY_WORKERS = 4
+        cache = SignatureCache(config.SIG_CACHE_SIZE)
+        validator = Node("validator", network.genesis_block, sig_cache=cache)
+        validator.receive_block(copy.deepcopy(block1))
+        validator.receive_block(copy.deepcopy(valid_block))
+        print(f"   캐시 통계: {cache.stats()}")
+        assert validator.chain_tip == valid_block.hash, "Valid block should be connected"
+        assert cache.misses == 20, "Each signature should be verified exactly once"
+    finally:
+        (config.SIG_VERIFY_WORKERS, config.SIG_VERIFY_EXECUTOR,
+         config.SIG_VERIFY_BATCH_MIN, config.MAX_TXS_PER_BLOCK) = saved
+        shutdown_verify_executor()
+
+    print("\n[OK] 시나리오 21 검증 완료")
+    return True
+
+
+if __name__ == "__main__":
+    try:
+        test_parallel_signature_verification()
+        print("\n[OK] Parallel Signature Verification Test PASSED")
+        sys.exit(0)
+    except AssertionError as e:
+        print(f"\n[FAIL] Test FAILED: {e}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n[FAIL] Test ERROR: {e}")
+        sys.exit(1)
@@ -0,0 +1,185 @@
+"""
+시나리오 30: 재현 가능한 키 생성과 결정적 서명
+
+재현 모드에서는 키를 시드에서 유도하고 RFC 6979 결정적 k로 서명하므로
+같은 시드의 시뮬레이션은 키/서명/블록 해시까지 실행마다 바이트 단위로 같아야 함
+(시드 없는 시뮬레이터는 앞서 만든 시드 시뮬레이터와 무관하게 무작위 키 사용)
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.hazmat.primitives.asymmetric.utils import decode_dss_signature
+from cryptography.exceptions import UnsupportedAlgorithm
+
+from blockchain import Node, NetworkSimulator, Wallet, CryptoUtils, config, crypto
+from blockchain.crypto import set_reproducible, is_reproducible, is_deterministic_signing, shutdown_sign_executor
+
+
+def _run_network(seed, sig_cache=None):
+    """시드로 작은 시뮬레이션을 돌리고 메인 체인 블록 해시와 거래 서명을 반환"""
+    config.SIM_TIME = 0
+    network = NetworkSimulator(seed=seed, sig_cache=sig_cache)
+    wallets = [Wallet(name) for name in ("Alice", "Bob", "Carol")]
+    for wallet in wallets:
+        network.register_wallet(wallet)
+        network.add_node(Node(wallet.address, network.genesis_block))
+
+    network.run_simulation(steps=6)
+    network.add_transaction_to_network(wallets[0].address, wallets[1].address, 5)
+    network.add_transaction_to_network(wallets[1].address, wallets[2].address, 3)
+    network.run_simulation(steps=6)
+
+    node = network.nodes[0]
+    chain = [node.main_chain[h] for h in range(len(node.main_chain))]
+    signatures = [tx.get('signature') for h in chain for tx in node.block_index[h].transactions]
+    return network, [w.address for w in wallets], chain, signatures
+
+
+def test_reproducible_crypto():
+    """재현 가능한 키 생성과 결정적 서명 테스트"""
+    print("[TEST] 시나리오: 재현 가능한 키 생성과 결정적 서명")
+
+    saved = (config.SERIALIZATION_FORMAT, config.SIGN_BATCH_MIN, config.SIM_TIME)
+    try:
+        config.SERIALIZATION_FORMAT = "binary"
+
+        # Case A: RFC 6979 테스트 벡터 (부록 A.2.5, P-256 / SHA-256 / "sample")
+        print("\n1. RFC 6979 테스트 벡터")
+        set_reproducible("vector")
+        key = ec.derive_private_key(
+            0xC9AFA9D845BA75166B5C215767B1D6934E50C3DB36E89B127B8A622B120F6721, ec.SECP256R1()
+        )
+        r, s = decode_dss_signature(CryptoUtils.sign_message(key, "sample"))
+        assert r == 0xEFD48B2AACB6A8FD1140DD9CD45E81D69D2C877B56AAF991C34D0EA84EAF3716, "r should match RFC 6979"
+        assert s == 0xF7CB1C942D657C41D436C7A1B6E29F65F3E900DBB9AFF4064DC4AB2F843ACDA8, "s should match RFC 6979"
+        print("   r, s 일치")
+
+        # Case B: 시드 기반 키 유도
+        print("\n2. 시드 기반 키 유도")
+        set_reproducible("bench-1")
+        first = [Wallet().address for _ in range(3)]
+        more = Wallet.create_wallets(2)
+        set_reproducible("bench-1")
+        again = [Wallet().address for _ in range(3)]
+        assert first == again, "Same seed should derive the same wallets"
+        assert [w.address for w in Wallet.create_wallets(2)] == [w.address for w in more], \
+            "Batch key generation should continue the same sequence"
+        assert len(set(first)) == 3, "Derived keys should be distinct"
+        set_reproducible("bench-2")
+        assert Wallet().address != first[0], "Different seed should derive different keys"
+        private_key, _ = CryptoUtils.derive_key_pair("bench-1", 0)
+        assert CryptoUtils.public_key_to_address(private_key.public_key()) == first[0], \
+            "derive_key_pair(seed, i) should be the i-th seeded key"
+        print(f"   시드 bench-1 첫 주소: {first[0][:16]}...")
+
+        # Case C: 결정적 서명
+        print("\n3. 결정적 서명")
+        set_reproducible("bench-1")
+        alice, bob = Wallet("Alice"), Wallet("Bob")
+        tx1 = alice.create_transaction(bob.address, 10, 1)
+        tx2 = alice.create_transaction(bob.address, 10, 1)
+        assert tx1 == tx2, "Same body should produce the same signature"
+        assert CryptoUtils.verify_transaction(tx1), "Deterministic signature should verify"
+
+        batch = [(bob.address, 10, 1)] + [(bob.address, 1, n) for n in range(2, 21)]
+        config.SIGN_BATCH_MIN = 4
+        for workers in (1, 2):
+            txs = alice.create_transactions(batch, workers=workers)
+            assert txs[0] == tx1, f"Batch signing (workers={workers}) should match create_transaction"
+            assert txs == alice.create_transactions(batch, workers=workers), "Batch signing should be deterministic"
+        print(f"   서명: {tx1['signature'][:32]}...")
+
+        # Case D: 시뮬레이션 전체 재현
+        print("\n4. 시뮬레이션 재현")
+        network1, wallets1, chain1, sigs1 = _run_network("sim-seed")
+        network2, wallets2, chain2, sigs2 = _run_network("sim-seed", sig_cache=network1.sig_cache)
+        assert wallets1 == wallets2, "Wallets should be identical across runs"
+        assert chain1 == chain2, "Main chain block hashes should be identical across runs"
+        assert sigs1 == sigs2, "Transaction signatures should be identical across runs"
+        assert len(chain1) > 1, "Simulation should mine blocks"
+        assert network2.sig_cache.hits > 0, "Second run should reuse cached signature results"
+
+        _, wallets3, chain3, _ = _run_network("other-seed")
+        assert wallets3 != wallets1 and chain3 != chain1, "Different seed should give a different run"
+        print(f"   메인 체인 {len(chain1)}블록 동일, 서명 캐시 적중 {network2.sig_cache.hits}회")
+
+        # Case E: 재현 모드 해제
+        print("\n5. 재현 모드 해제")
+        set_reproducible(None)
+        assert not is_reproducible(), "Reproducible mode should be off"
+        assert Wallet().address != Wallet().address, "Random keys should differ"
+        tx_a = alice.create_transaction(bob.address, 10, 1)
+        assert tx_a['signature'] != alice.create_transaction(bob.address, 10, 1)['signature'], \
+            "Randomized ECDSA should differ per signature"
+        print("   무작위 키/서명으로 복귀")
+
+        # Case F: 시드 시뮬레이터 뒤에 만든 시드 없는 시뮬레이터는 무작위 키 사용
+        print("\n6. 시드 없는 시뮬레이터")
+        seeded = NetworkSimulator(seed="leak-seed")
+        seeded_keys = [Wallet().address for _ in range(2)]
+        unseeded = NetworkSimulator()
+        assert not is_reproducible(), "Unseeded simulator should turn reproducible mode off"
+        random_keys = [Wallet().address for _ in range(2)]
+        assert random_keys[0] != random_keys[1], "Unseeded keys should be random"
+        assert not set(random_keys) & set(seeded_keys), "Unseeded keys should not follow the earlier seed"
+        derived = [CryptoUtils.public_key_to_address(CryptoUtils.derive_key_pair("leak-seed", i)[0].public_key())
+                   for i in range(4)]
+        assert not set(random_keys) & set(derived), "Unseeded keys should not continue the seeded sequence"
+
+        # close()는 생성 전 설정으로 복원 (시드 시뮬레이터는 자기 키 순서를 이어 감)
+        unseeded.close()
+        assert is_reproducible() and Wallet().address == derived[2], "Closing should restore the seeded mode"
+        seeded.close()
+        assert not is_reproducible(), "Closing the seeded simulator should restore the previous mode"
+        with NetworkSimulator(seed="leak-seed"):
+            assert Wallet().address == derived[0], "A new seeded simulator should start its own sequence"
+        assert not is_reproducible(), "Leaving the simulator context should turn reproducible mode off"
+        print(f"   시드 없는 시뮬레이터 키: {random_keys[0][:16]}... (무작위)")
+
+        # Case G: RFC 6979 미지원 백엔드 - 재현 모드 설정 시 한 번 확인하고 무작위 k 서명으로 대체
+        print("\n7. RFC 6979 미지원 백엔드")
+        original_ecdsa = crypto._rfc6979_ecdsa
+
+        def unsupported():
+            raise UnsupportedAlgorithm("RFC 6979 not supported (simulated)")
+
+        crypto._rfc6979_ecdsa = unsupported
+        crypto.rfc6979_supported.cache_clear()
+        try:
+            set_reproducible("bench-1")
+            assert is_reproducible() and not is_deterministic_signing(), "Should fall back to randomized signing"
+            fallback = Wallet("Alice")
+            assert fallback.address == first[0], "Keys should still be derived from the seed"
+            txs = [fallback.create_transaction(bob.address, 10, 1) for _ in range(2)]
+            assert all(CryptoUtils.verify_transaction(tx) for tx in txs), "Fallback signatures should verify"
+            assert txs[0]['signature'] != txs[1]['signature'], "Fallback signatures should use a random k"
+            batch_txs = fallback.create_transactions(batch, workers=2)
+            assert all(CryptoUtils.verify_transaction(tx) for tx in batch_txs), "Batch signing should not fail"
+            assert not crypto.rfc6979_supported(), "Support should be checked once and cached"
+        finally:
+            crypto._rfc6979_ecdsa = original_ecdsa
+            crypto.rfc6979_supported.cache_clear()
+        print("   시드 키 유지, 서명은 무작위 k로 대체")
+    finally:
+        config.SERIALIZATION_FORMAT, config.SIGN_BATCH_MIN, config.SIM_TIME = saved
+        set_reproducible(None)
+        shutdown_sign_executor()
+
+    print("\n[OK] 시나리오 30 검증 완료")
+
+
+if __name__ == "__main__":
+    try:
+        test_reproducible_crypto()
+        print("\n[OK] Reproducible Crypto Test PASSED")
+        sys.exit(0)
+    except AssertionError as e:
+        print(f"\n[FAIL] Test FAILED: {e}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n[FAIL] Test ERROR: {e}")
+        sys.exit(1)
@@ -24,7 +24,28 @@ from scenarios import (
     test_difficulty_adjustment,
     test_wallet_recovery,
     test_wallet_manager,
-    test_network_broadcast
+    test_network_broadcast,
+    test_incremental_state,
+    test_state_snapshot_cache,
+    test_ancestor_index,
+    test_mempool_index,
+    test_tx_index,
+    test_signature_cache,
+    test_parallel_signature_verification,
+    test_compact_public_key,
+    test_binary_encoding,
+    test_merkle_proof,
+    test_mining_engine,
+    test_parallel_mining,
+    test_cancellable_mining,
+    test_fractional_difficulty,
+    test_batch_signing,
+    test_reproducible_crypto,
+    test_event_network,
+    test_zero_copy_sharing,
+    test_gossip_topology,
+    test_sharded_simulation,
+    test_async_runtime
 )
 
 
@@ -88,7 +109,7 @@ def main():
     print("=" * 70)
     print("BLOCKCHAIN SIMULATOR - COMPREHENSIVE TEST SUITE")
     print("=" * 70)
-    print("\nTesting 14 comprehensive blockchain scenarios:")
+    print("\nTesting 35 comprehensive blockchain scenarios:")
     print("1. Sequential nonce handling")
     print("2. Replay attack prevention")
     print("3. Invalid signature detection")
@@ -103,6 +124,27 @@ def main():
     print("12. Wallet backup and recovery")
     print("13. Multi-wallet management")
     print("14. Network broadcasting")
+    print("15. Incremental state with undo logs")
+    print("16. State snapshot cache")
+    print("17. Height index and skip pointers")
+    print("18. Txid-indexed mempool")
+    print("19. Confirmed transaction index")
+    print("20. Signature verification cache")
+    print("21. Parallel batch signature verification")
+    print("22. Compact public keys and parse cache")
+    print("23. Canonical binary encoding")
+    print("24. Merkle root and inclusion proofs")
+    print("25. Midstate mining engine")
+    print("26. Parallel mining")
+    print("27. Cancellable sliced mining")
+    print("28. Compact target and fractional difficulty")
+    print("29. Batch key generation and signing")
+    print("30. Reproducible keys and deterministic signing")
+    print("31. Discrete-event network engine (link latency/bandwidth)")
+    print("32. Zero-copy immutable block/transaction sharing")
+    print("33. Peer topologies and inv/getdata gossip relay")
+    print("34. Sharded multi-process simulation with barrier sync")
+    print("35. asyncio node runtime with inboxes and backpressure")
 
     # Run all tests
     runner.run_test("Scenario 1: Sequential Nonce", test_sequential_nonce)
@@ -119,6 +161,27 @@ def main():
     runner.run_test("Scenario 12: Wallet Recovery", test_wallet_recovery)
     runner.run_test("Scenario 13: Wallet Manager", test_wallet_manager)
     runner.run_test("Scenario 14: Network Broadcast", test_network_broadcast)
+    runner.run_test("Scenario 15: Incremental State", test_incremental_state)
+    runner.run_test("Scenario 16: State Snapshot Cache", test_state_snapshot_cache)
+    runner.run_test("Scenario 17: Ancestor Index", test_ancestor_index)
+    runner.run_test("Scenario 18: Mempool Index", test_mempool_index)
+    runner.run_test("Scenario 19: Tx Index", test_tx_index)
+    runner.run_test("Scenario 20: Signature Cache", test_signature_cache)
+    runner.run_test("Scenario 21: Parallel Signature Verification", test_parallel_signature_verification)
+    runner.run_test("Scenario 22: Compact Public Key", test_compact_public_key)
+    runner.run_test("Scenario 23: Binary Encoding", test_binary_encoding)
+    runner.run_test("Scenario 24: Merkle Proof", test_merkle_proof)
+    runner.run_test("Scenario 25: Mining Engine", test_mining_engine)
+    runner.run_test("Scenario 26: Parallel Mining", test_parallel_mining)
+    runner.run_test("Scenario 27: Cancellable Mining", test_cancellable_mining)
+    runner.run_test("Scenario 28: Fractional Difficulty", test_fractional_difficulty)
+    runner.run_test("Scenario 29: Batch Signing", test_batch_signing)
+    runner.run_test("Scenario 30: Reproducible Crypto", test_reproducible_crypto)
+    runner.run_test("Scenario 31: Event Network", test_event_network)
+    runner.run_test("Scenario 32: Zero Copy Sharing", test_zero_copy_sharing)
+    runner.run_test("Scenario 33: Gossip Topology", test_gossip_topology)
+    runner.run_test("Scenario 34: Sharded Simulation", test_sharded_simulation)
+    runner.run_test("Scenario 35: Async Runtime", test_async_runtime)
 
     # Print summary
     runner.print_summary()
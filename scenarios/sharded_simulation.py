@@ -0,0 +1,142 @@
+"""
+시나리오 34: 샤드 병렬 시뮬레이션
+
+노드를 여러 워커 프로세스에 나누어 실행해도(최소 링크 지연 단위 시간 창 + 배리어 동기화)
+같은 시드의 단일 프로세스 이산 사건 시뮬레이션과 노드별 체인/멤풀, 메시지 수, 전파 지연이 모두 같아야 함
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from blockchain import Node, NetworkSimulator, Wallet, config
+from blockchain.sharding import ShardedNetworkSimulator, effective_shard_workers
+from blockchain.main import demo_sharding_benchmark
+
+
+def _drive(network, node_ids, add_node, origin_of, kind="small_world"):
+    """같은 순서로 네트워크 구성 / 실행 / 거래 제출 (단일 / 샤드 공용)"""
+    wallets = [Wallet(f"User{i}") for i in range(3)]
+    for wallet in wallets:
+        network.register_wallet(wallet)
+    ids = [wallet.address for wallet in wallets] + node_ids
+    for node_id in ids:
+        add_node(node_id)
+    if kind:
+        network.set_topology(kind, degree=4)
+    network.set_link(ids[0], ids[1], latency=0.05, bandwidth=5_000)
+    network.set_link(ids[3], ids[-1], latency=0.3)
+
+    network.run_event_simulation(duration=8)
+    for i in range(6):
+        sender = wallets[i % 3]
+        network.submit_transaction(sender.address, wallets[(i + 1) % 3].address, 1, origin=origin_of(network, i * 3))
+    network.run_event_simulation(duration=7)
+    network.submit_transaction(wallets[0].address, wallets[2].address, 1)
+    network.run_event_simulation(duration=5)
+
+
+def _single_run(count, seed, kind):
+    config.SIM_TIME = 0
+    network = NetworkSimulator(seed=seed)
+    _drive(network, [f"N{i}" for i in range(count)],
+           lambda node_id: network.add_node(Node(node_id, network.genesis_block)),
+           lambda net, i: net.nodes[i], kind)
+    return network, network.scheduler.processed
+
+
+def _sharded_run(count, seed, kind, shards):
+    config.SIM_TIME = 0
+    with ShardedNetworkSimulator(seed=seed, shards=shards) as network:
+        _drive(network, [f"N{i}" for i in range(count)], network.add_node,
+               lambda net, i: net.node_ids[i], kind)
+        return network, network.processed
+
+
+def _results(network):
+    return (network.get_node_summaries(), network.event_stats,
+            network.get_propagation_stats('block'), network.get_propagation_stats('tx'))
+
+
+def test_sharded_simulation():
+    """샤드 병렬 시뮬레이션 테스트"""
+    print("[TEST] 시나리오: 샤드 병렬 시뮬레이션")
+
+    saved = (config.SIM_TIME, config.LINK_LATENCY, config.LINK_BANDWIDTH, config.NETWORK_HASH_RATE)
+    try:
+        config.LINK_LATENCY = 0.1
+        config.LINK_BANDWIDTH = 20_000
+        config.NETWORK_HASH_RATE = 2048  # 블록 간격을 전파 지연 수준으로 줄여 분기/재구성 유도
+
+        # Case A: 샤드 수와 lookahead
+        print("\n1. 샤드 수 / lookahead")
+        assert effective_shard_workers(4, 2) <= 2, "Shard count should be capped by node count"
+        assert effective_shard_workers(64, 1000) <= (os.cpu_count() or 1), "Shard count should be capped by CPUs"
+        network = ShardedNetworkSimulator(seed=1, shards=3)
+        for i in range(10):
+            network.add_node(f"N{i}")
+        network.set_link("N0", "N1", latency=0.02)
+        assert network.shard_count == 3, "Explicit shard count should be used"
+        assert network.lookahead() == 0.02, "Lookahead should be the smallest link latency"
+        network.set_link("N2", "N3", latency=0)
+        try:
+            network.lookahead()
+            assert False, "Zero latency should be rejected (no lookahead)"
+        except ValueError:
+            pass
+        print(f"   lookahead=최소 링크 지연, CPU {os.cpu_count()}개")
+
+        # Case B: 직접 전송 - 단일 프로세스와 결과 동일
+        print("\n2. 직접 전송 네트워크 결과 비교")
+        single, single_events = _single_run(17, seed=9, kind=None)
+        expected = _results(single)
+        for shards in (1, 3):
+            sharded, sharded_events = _sharded_run(17, seed=9, kind=None, shards=shards)
+            assert sharded_events == single_events, f"Event count should match with {shards} shards"
+            assert _results(sharded) == expected, f"Results should match single-process run with {shards} shards"
+            if shards == 1:
+                assert sharded.cross_shard_messages == 0, "Single shard should not exchange messages"
+            else:
+                assert sharded.cross_shard_messages > 0, "Shards should exchange messages at barriers"
+            print(f"   샤드 {shards}개: 이벤트 {sharded_events}개, 시간 창 {sharded.windows}개, "
+                  f"샤드 간 메시지 {sharded.cross_shard_messages}개 - 동일")
+
+        # Case C: gossip + 분기 + 거래 - 노드별 체인/멤풀과 전파 통계까지 동일
+        print("\n3. Gossip 네트워크 (분기/거래 포함) 결과 비교")
+        single, single_events = _single_run(37, seed=9, kind="small_world")
+        expected = _results(single)
+        summaries, stats = expected[0], expected[1]
+        assert stats['blocks_mined'] > max(s['height'] for s in summaries.values()), "Run should include forks"
+        assert expected[3]['items'] > 0, "Some transactions should propagate"
+        for shards in (2, 4):
+            sharded, sharded_events = _sharded_run(37, seed=9, kind="small_world", shards=shards)
+            assert sharded_events == single_events, f"Event count should match with {shards} shards"
+            results = _results(sharded)
+            assert results[0] == summaries, f"Every node's chain and mempool should match with {shards} shards"
+            assert results[1:] == expected[1:], f"Message counts and delays should match with {shards} shards"
+            print(f"   샤드 {shards}개: 블록 {stats['blocks_mined']}개 채굴, 이벤트 {sharded_events}개, "
+                  f"시간 창 {sharded.windows}개 - 동일")
+
+        # Case D: 벤치마크 (시간은 출력만 - 속도 향상은 CPU 코어 수에 좌우)
+        print("\n4. 단일 프로세스 대비 실행 시간")
+        result = demo_sharding_benchmark(node_count=40, duration=8, shards=2)
+        assert result['identical'], "Benchmark runs should produce identical results"
+        assert result['shards'] == 2 and result['windows'] > 0, "Benchmark should run the sharded engine"
+    finally:
+        config.SIM_TIME, config.LINK_LATENCY, config.LINK_BANDWIDTH, config.NETWORK_HASH_RATE = saved
+
+    print("\n[OK] 시나리오 34 검증 완료")
+
+
+if __name__ == "__main__":
+    try:
+        test_sharded_simulation()
+        print("\n[OK] Sharded Simulation Test PASSED")
+        sys.exit(0)
+    except AssertionError as e:
+        print(f"\n[FAIL] Test FAILED: {e}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n[FAIL] Test ERROR: {e}")
+        sys.exit(1)
@@ -0,0 +1,102 @@
+"""
+시나리오 20: 서명 검증 캐시
+
+한 번 검증한 (txid, 서명, 공개키) 조합은 다시 ECDSA 검증하지 않고
+캐시 조회로 결과를 돌려주어야 하며, 같은 네트워크의 노드들은 캐시를 공유해야 함
+"""
+
+import sys
+import os
+import copy
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from blockchain import Node, NetworkSimulator, Wallet, SignatureCache, config
+
+
+def test_signature_cache():
+    """서명 검증 캐시 테스트"""
+    print("[TEST] 시나리오: 서명 검증 캐시")
+
+    network = NetworkSimulator()
+    wallet_alice = Wallet("Alice")
+    wallet_bob = Wallet("Bob")
+
+    node = Node(wallet_alice.address, network.genesis_block)
+
+    config.SIM_TIME = 1
+    block1 = node.try_mine()
+    node.receive_block(block1)
+
+    # Case A: 재검증은 캐시 적중
+    print("\n1. 같은 거래 재검증")
+    tx1 = wallet_alice.create_transaction(wallet_bob.address, 10, 1)
+    assert node.verify_transaction_signature(tx1), "Valid signature should verify"
+    misses = node.sig_cache.misses
+
+    for _ in range(3):
+        assert node.verify_transaction_signature(copy.deepcopy(tx1)), "Cached result should stay valid"
+    print(f"   캐시 통계: {node.sig_cache.stats()}")
+    assert node.sig_cache.misses == misses, "Re-verification should not miss the cache"
+    assert node.sig_cache.hits >= 3, "Re-verification should hit the cache"
+
+    # Case B: 멤풀 추가 -> 블록 템플릿 -> 블록 검증 경로가 모두 캐시 사용
+    print("\n2. 멤풀/채굴/블록 검증 경로")
+    node.add_transaction(tx1)
+    config.SIM_TIME = 2
+    block2 = node.try_mine()
+    node.receive_block(block2)
+    print(f"   캐시 통계: {node.sig_cache.stats()}")
+    assert node.sig_cache.misses == misses, "Mining and validation should reuse the cached result"
+    assert node.state[wallet_bob.address]['balance'] == 10, "Transaction should be confirmed"
+
+    # Case C: 변조된 거래는 다른 키 -> 실패 결과도 캐시
+    print("\n3. 변조된 거래")
+    tampered = copy.deepcopy(tx1)
+    tampered['body']['amount'] = 1000
+    assert not node.verify_transaction_signature(tampered), "Tampered tx should fail"
+    assert not node.verify_transaction_signature(tampered), "Cached failure should stay invalid"
+    assert node.sig_cache.misses == misses + 1, "Tampered tx should be verified only once"
+
+    # Case D: 네트워크 노드 간 캐시 공유
+    print("\n4. 네트워크 노드 간 공유")
+    node_a = Node(wallet_alice.address, network.genesis_block)
+    node_b = Node(wallet_bob.address, network.genesis_block)
+    network.add_node(node_a)
+    network.add_node(node_b)
+    assert node_a.sig_cache is node_b.sig_cache is network.sig_cache, "Nodes should share the network cache"
+
+    tx2 = wallet_alice.create_transaction(wallet_bob.address, 5, 2)
+    assert node_a.verify_transaction_signature(tx2)
+    shared_misses = network.sig_cache.misses
+    assert node_b.verify_transaction_signature(copy.deepcopy(tx2))
+    assert network.sig_cache.misses == shared_misses, "Second node should reuse the first node's result"
+
+    # Case E: 크기 제한 (LRU)
+    print("\n5. 크기 제한")
+    cache = SignatureCache(capacity=2)
+    small_node = Node(wallet_alice.address, network.genesis_block, sig_cache=cache)
+    txs = [wallet_alice.create_transaction(wallet_bob.address, 1, n) for n in (1, 2, 3)]
+    for tx in txs:
+        small_node.verify_transaction_signature(tx)
+    print(f"   캐시 크기: {len(cache)}")
+    assert len(cache) == 2, "Cache should be bounded by its capacity"
+    oldest_key = (small_node.compute_txid(txs[0]), txs[0]['signature'], txs[0]['public_key'])
+    assert oldest_key not in cache, "Least recently used entry should be evicted"
+    assert cache.evictions == 1, "Eviction should be counted"
+
+    print("\n[OK] 시나리오 20 검증 완료")
+    return True
+
+
+if __name__ == "__main__":
+    try:
+        test_signature_cache()
+        print("\n[OK] Signature Cache Test PASSED")
+        sys.exit(0)
+    except AssertionError as e:
+        print(f"\n[FAIL] Test FAILED: {e}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n[FAIL] Test ERROR: {e}")
+        sys.exit(1)
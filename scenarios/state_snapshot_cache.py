@@ -0,0 +1,170 @@
+"""
+시나리오 16: 상태 스냅샷 캐시
+
+검증이 끝난 블록의 상태는 블록 해시별로 캐시되어
+그 블록을 부모로 하는 블록을 검증할 때 Replay 없이 재사용되어야 함
+- 부모/자식 스냅샷은 Copy-on-Write로 계정을 공유
+- LRU 용량을 넘으면 가장 오래 쓰이지 않은 스냅샷부터 제거
+- 캐시 미스 시 가장 가까운 체크포인트부터 재생 (최대 N블록)
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from blockchain import Node, NetworkSimulator, Wallet, config
+from blockchain.state import StateSnapshot, StateCache
+
+
+def test_state_snapshot_cache():
+    """상태 스냅샷 캐시 테스트"""
+    print("[TEST] 시나리오: 상태 스냅샷 캐시")
+
+    network = NetworkSimulator()
+    wallet_alice = Wallet("Alice")
+    wallet_bob = Wallet("Bob")
+
+    node = Node(wallet_alice.address, network.genesis_block)
+
+    # Case A: 연속 블록 검증 시 캐시 적중
+    print("\n1. 연속 블록 검증 (부모 상태 캐시 적중)")
+    config.SIM_TIME = 1
+    block1 = node.try_mine()
+    node.receive_block(block1)
+
+    tx1 = wallet_alice.create_transaction(wallet_bob.address, 10, 1)
+    node.add_transaction(tx1)
+    config.SIM_TIME = 2
+    block2 = node.try_mine()
+
+    misses_before = node.state_cache.misses
+    node.receive_block(block2)
+    stats = node.state_cache.stats()
+    print(f"   캐시 통계: {stats}")
+
+    assert node.state_cache.misses == misses_before, "Validating a child of a validated block should not miss"
+    assert stats['hits'] > 0, "Cache should report hits"
+    assert block2.hash in node.state_cache, "Validated block state should be cached"
+
+    cached = node.get_state_at(block2.hash)
+    assert cached.to_dict() == node.state, "Cached snapshot should match the tip state"
+    replayed = node.derive_state(node.get_state_at(block1.hash), block2)
+    assert cached.to_dict() == replayed.to_dict(), "Validated snapshot should match replaying the block"
+
+    # 검증 중 만든 상태를 그대로 캐시하므로 블록을 다시 적용하지 않음
+    applied = []
+    original_apply = node.apply_block_to_state
+    node.apply_block_to_state = lambda block, state: (applied.append(block.hash), original_apply(block, state))
+    config.SIM_TIME = 3
+    block3 = node.try_mine()
+    assert node.validate_block(block3, block2), "Next block should be valid"
+    del node.apply_block_to_state
+    assert not applied, "Validation should not re-apply the block to derive its snapshot"
+
+    # Case B: Copy-on-Write - 자식 기록이 부모에 영향을 주지 않음
+    print("\n2. Copy-on-Write 스냅샷")
+    parent = StateSnapshot({"a": {'balance': 10, 'nonce': 0}})
+    child = parent.child()
+    child["a"] = {'balance': 5, 'nonce': 1}
+    child["b"] = {'balance': 5, 'nonce': 0}
+
+    print(f"   부모: {parent.to_dict()}")
+    print(f"   자식: {child.to_dict()}")
+    assert parent.get("a")['balance'] == 10, "Parent snapshot must not change"
+    assert "b" not in parent, "Parent snapshot must not see child accounts"
+    assert child.get("a")['balance'] == 5, "Child should see its own write"
+
+    deep = parent
+    for _ in range(StateSnapshot.MAX_DEPTH * 2):
+        deep = deep.child()
+    assert deep.depth <= StateSnapshot.MAX_DEPTH, "Deep snapshots should be flattened"
+    assert deep.get("a")['balance'] == 10, "Flattened snapshot should keep accounts"
+
+    # Case C: LRU 제거
+    print("\n3. LRU 제거")
+    cache = StateCache(2)
+    cache.put("h1", StateSnapshot())
+    cache.put("h2", StateSnapshot())
+    cache.get("h1")             # h1을 최근 사용으로 갱신
+    cache.put("h3", StateSnapshot())
+
+    print(f"   캐시 통계: {cache.stats()}")
+    assert "h1" in cache, "Recently used entry should survive"
+    assert "h2" not in cache, "Least recently used entry should be evicted"
+    assert cache.get("h2") is None and cache.misses == 1, "Miss should be counted"
+    assert cache.evictions == 1 and cache.stats()['evictions'] == 1, "Eviction should be counted"
+
+    # Case D: 체크포인트 기준 재생
+    print("\n4. 캐시 미스 시 체크포인트부터 재생")
+    original_interval = config.STATE_CHECKPOINT_INTERVAL
+    config.STATE_CHECKPOINT_INTERVAL = 2
+    try:
+        node3 = Node(wallet_alice.address, network.genesis_block)
+        for t in range(1, 8):
+            config.SIM_TIME = t
+            block = node3.try_mine()
+            node3.receive_block(block)
+
+        checkpoint_heights = sorted(node3.block_index[h].index for h in node3.state_checkpoints)
+        print(f"   체크포인트 높이: {checkpoint_heights}")
+        assert checkpoint_heights == [0, 2, 4, 6], "Checkpoints should be saved every 2 blocks"
+
+        # 캐시를 비워서 체크포인트 경로를 강제
+        node3.state_cache = StateCache(config.STATE_CACHE_SIZE)
+        base, path = node3.find_replay_base(node3.chain_tip)
+        print(f"   재생 블록 수: {len(path)}")
+        assert len(path) <= config.STATE_CHECKPOINT_INTERVAL, "Replay should start from the nearest checkpoint"
+
+        rebuilt = node3.get_state_at(node3.chain_tip)
+        assert rebuilt.to_dict() == node3.state, "State replayed from checkpoint should match the tip state"
+
+        expected = node3.state
+        assert node3.rebuild_state(node3.chain_tip), "rebuild_state should succeed from a checkpoint"
+        assert node3.state == expected, "rebuild_state from checkpoint should match"
+
+        # 곁가지 블록은 체크포인트를 남기지 않고, Reorg로 분리된 블록의 체크포인트는 삭제
+        print("\n5. 곁가지 / Reorg 체크포인트 정리")
+        rival = Node(wallet_bob.address, network.genesis_block)
+        for h in node3.main_chain[1:4]:
+            rival.receive_block(node3.block_index[h])
+        old_main = list(node3.main_chain)
+        branch = []
+        for t in range(4, 11):
+            config.SIM_TIME = t
+            block = rival.try_mine()
+            rival.receive_block(block)
+            branch.append(block)
+
+        node3.receive_block(branch[0])  # 높이 4 곁가지 블록 (메인 체인 아님)
+        assert branch[0].hash in node3.block_index and node3.chain_tip == old_main[-1], "Side block should not win"
+        assert branch[0].hash not in node3.state_checkpoints, "Side-branch blocks should not be checkpointed"
+
+        for block in branch[1:]:
+            node3.receive_block(block)
+        assert node3.chain_tip == branch[-1].hash, "Longer branch should win"
+        assert not set(old_main[4:]) & set(node3.state_checkpoints), "Disconnected checkpoints should be dropped"
+        assert all(h in node3.main_chain for h in node3.state_checkpoints), "Checkpoints should be on the main chain"
+        checkpoint_heights = sorted(node3.block_index[h].index for h in node3.state_checkpoints)
+        print(f"   Reorg 후 체크포인트 높이: {checkpoint_heights}")
+        assert checkpoint_heights == [0, 2, 4, 6, 8, 10], "New main chain should be checkpointed"
+        node3.state_cache = StateCache(config.STATE_CACHE_SIZE)
+        assert node3.get_state_at(node3.chain_tip).to_dict() == node3.state, "Replay from new checkpoints should match"
+    finally:
+        config.STATE_CHECKPOINT_INTERVAL = original_interval
+
+    print("\n[OK] 시나리오 16 검증 완료")
+    return True
+
+
+if __name__ == "__main__":
+    try:
+        test_state_snapshot_cache()
+        print("\n[OK] State Snapshot Cache Test PASSED")
+        sys.exit(0)
+    except AssertionError as e:
+        print(f"\n[FAIL] Test FAILED: {e}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n[FAIL] Test ERROR: {e}")
+        sys.exit(1)
@@ -0,0 +1,100 @@
+"""
+시나리오 19: 확정 거래 인덱스
+
+메인 체인에 포함된 거래는 txid로 블록 해시/높이/위치를 O(1)에 조회할 수 있어야 하며,
+인덱스는 연장/Reorg 시 증분 갱신되고 이미 확정된 거래의 재제출은 즉시 거부되어야 함
+"""
+
+import sys
+import os
+import copy
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from blockchain import Node, NetworkSimulator, Wallet, config
+
+
+def test_tx_index():
+    """확정 거래 인덱스 테스트"""
+    print("[TEST] 시나리오: 확정 거래 인덱스")
+
+    network = NetworkSimulator()
+    wallet_alice = Wallet("Alice")
+    wallet_bob = Wallet("Bob")
+
+    node = Node(wallet_alice.address, network.genesis_block)
+
+    config.SIM_TIME = 1
+    block1 = node.try_mine()
+    node.receive_block(block1)
+
+    # Case A: 연장 시 인덱스 추가
+    print("\n1. 블록 연장 후 거래 위치 조회")
+    tx1 = wallet_alice.create_transaction(wallet_bob.address, 10, 1)
+    txid1 = node.compute_txid(tx1)
+    assert not node.is_confirmed(txid1), "Pending tx should not be confirmed"
+
+    node.add_transaction(tx1)
+    config.SIM_TIME = 2
+    block2 = node.try_mine()
+    node.receive_block(block2)
+
+    location = node.get_transaction_location(txid1)
+    print(f"   위치: block={location[0][:6]}, height={location[1]}, position={location[2]}")
+    assert location == (block2.hash, 2, 1), "Location should point to block2 after the coinbase"
+    assert node.get_confirmed_transaction(txid1)['body'] == tx1['body'], "Lookup should return the confirmed tx"
+
+    # Case B: 확정 거래 재제출 거부
+    print("\n2. 확정 거래 재제출")
+    assert not node.add_transaction(copy.deepcopy(tx1)), "Confirmed tx should be rejected on submission"
+    assert len(node.mempool) == 0, "Mempool should stay empty"
+
+    # Case C: Reorg 시 버려진 거래는 인덱스에서 제거, 새 가지 거래는 추가
+    print("\n3. block1에서 분기한 더 무거운 체인으로 Reorg")
+    node2 = Node(wallet_bob.address, network.genesis_block)
+    node2.receive_block(copy.deepcopy(block1))
+
+    tx_alt = wallet_alice.create_transaction(wallet_bob.address, 20, 1)
+    txid_alt = node.compute_txid(tx_alt)
+    node2.add_transaction(tx_alt)
+    alt_blocks = []
+    for t in (3, 4):
+        config.SIM_TIME = t
+        block = node2.try_mine()
+        node2.receive_block(block)
+        alt_blocks.append(block)
+
+    for block in alt_blocks:
+        node.receive_block(copy.deepcopy(block))
+
+    assert node.chain_tip == alt_blocks[-1].hash, "Alt chain should be adopted"
+    print(f"   tx1 확정 여부: {node.is_confirmed(txid1)}, tx_alt 위치: {node.get_transaction_location(txid_alt)}")
+    assert not node.is_confirmed(txid1), "Discarded tx should leave the index"
+    assert node.get_transaction_location(txid_alt) == (alt_blocks[0].hash, 2, 1), "Adopted tx should be indexed"
+    assert txid1 not in node.mempool, "Conflicting discarded tx should not stay in the mempool"
+
+    # Case D: 인덱스가 메인 체인 전체 스캔 결과와 일치
+    print("\n4. 전체 스캔과 비교")
+    expected = {}
+    for height, block_hash in enumerate(node.main_chain):
+        for position, tx in enumerate(node.block_index[block_hash].transactions):
+            if tx['body']['sender'] != "SYSTEM":
+                expected[node.compute_txid(tx)] = (block_hash, height, position)
+    print(f"   인덱스 크기: {len(node.tx_index)}")
+    assert node.tx_index == expected, "Index should match a full scan of the main chain"
+
+    print("\n[OK] 시나리오 19 검증 완료")
+    return True
+
+
+if __name__ == "__main__":
+    try:
+        test_tx_index()
+        print("\n[OK] Tx Index Test PASSED")
+        sys.exit(0)
+    except AssertionError as e:
+        print(f"\n[FAIL] Test FAILED: {e}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n[FAIL] Test ERROR: {e}")
+        sys.exit(1)
@@ -0,0 +1,176 @@
+"""
+시나리오 32: 불변 블록/트랜잭션 공유
+
+브로드캐스트는 블록과 트랜잭션을 한 번 고정(freeze)한 뒤 모든 노드에 같은 객체를 넘기므로
+수신 노드 수가 늘어도 전파 시 메모리 할당이 늘지 않아야 하고, 고정은 해시를 바꾸지 않아야 함
+"""
+
+import sys
+import os
+import copy
+import pickle
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from blockchain import Node, NetworkSimulator, Wallet, config
+from blockchain.frozen import FrozenDict, freeze, thaw
+
+
+def _broadcast_allocation(node_count, shared=True):
+    """
+    노드 node_count개 네트워크에서 거래 20개짜리 블록 하나를 전파한 뒤 남은 할당 바이트
+    shared=False면 기존 방식처럼 수신 노드마다 deepcopy한 블록을 전달
+    """
+    config.SIM_TIME = 0
+    network = NetworkSimulator()
+    alice = Wallet("Alice")
+    nodes = [Node(alice.address, network.genesis_block)]
+    nodes += [Node(f"N{i}", network.genesis_block) for i in range(1, node_count)]
+    for node in nodes:
+        network.add_node(node)
+
+    config.SIM_TIME = 1
+    first = nodes[0].try_mine()
+    nodes[0].receive_block(first)
+    network.broadcast_block(nodes[0], first)
+
+    # 공유 방식은 고정된 거래 하나를, 기존 방식은 노드마다 복사한 거래를 멤풀에 넣음
+    for tx in alice.create_transactions([(f"R{i}", 1, i + 1) for i in range(20)]):
+        if shared:
+            tx = freeze(tx)
+        for node in nodes:
+            node.add_transaction(tx if shared else copy.deepcopy(tx))
+
+    config.SIM_TIME = 2
+    block = nodes[0].try_mine()
+    nodes[0].receive_block(block)
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    if shared:
+        network.broadcast_block(nodes[0], block)
+    else:
+        for node in nodes[1:]:
+            node.receive_block(copy.deepcopy(block))
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    assert all(node.chain_tip == block.hash for node in nodes), "Every node should accept the block"
+    return after - before
+
+
+def test_zero_copy_sharing():
+    """불변 블록/트랜잭션 공유 테스트"""
+    print("[TEST] 시나리오: 불변 블록/트랜잭션 공유")
+
+    saved = (config.SIM_TIME, config.SERIALIZATION_FORMAT, config.MAX_TXS_PER_BLOCK)
+    try:
+        # Case A: FrozenDict는 수정 불가, 복사는 자기 자신, pickle 가능
+        print("\n1. FrozenDict 불변성")
+        tx = freeze({"body": {"sender": "a", "recipient": "b", "amount": 1, "nonce": 1},
+                     "signature": "00", "public_key": "02"})
+        assert isinstance(tx, dict) and isinstance(tx['body'], FrozenDict), "Nested dicts should be frozen"
+        for mutate in (lambda: tx.__setitem__('signature', 'ff'),
+                       lambda: tx['body'].update(amount=2),
+                       lambda: tx['body'].pop('nonce'),
+                       lambda: tx.clear()):
+            try:
+                mutate()
+                assert False, "FrozenDict should reject mutation"
+            except TypeError:
+                pass
+        assert copy.deepcopy(tx) is tx and copy.copy(tx) is tx, "Copies of frozen values should be shared"
+        restored = pickle.loads(pickle.dumps(tx))
+        assert restored == tx and isinstance(restored['body'], FrozenDict), "Pickle should keep frozen type"
+
+        editable = thaw(tx)
+        editable['body']['amount'] = 2
+        assert type(editable) is dict and tx['body']['amount'] == 1, "thaw() should give an independent copy"
+        print("   수정 거부, 복사 공유, pickle 왕복, thaw() 독립 복사본")
+
+        # Case B: 고정해도 해시/txid/머클 루트가 바뀌지 않음 (바이너리 / JSON 호환 모드)
+        print("\n2. 고정 전후 해시 동일")
+        for fmt in ("json", "binary"):
+            config.SERIALIZATION_FORMAT = fmt
+            config.SIM_TIME = 0
+            network = NetworkSimulator()
+            alice, bob = Wallet("Alice"), Wallet("Bob")
+            node = Node(alice.address, network.genesis_block)
+            network.add_node(node)
+            network.register_wallet(alice)
+
+            config.SIM_TIME = 1
+            node.receive_block(node.try_mine())
+            network.add_transaction_to_network(alice.address, bob.address, 5)
+            config.SIM_TIME = 2
+            block = node.try_mine()
+            txid = node.compute_txid(block.transactions[1])
+            block_hash = block.hash
+
+            block.freeze()
+            assert isinstance(block.transactions, tuple), "Frozen block should hold a tuple"
+            assert block.calculate_hash() == block_hash, f"Freeze should not change the hash ({fmt})"
+            assert node.compute_txid(block.transactions[1]) == txid, f"Freeze should not change txid ({fmt})"
+            node.receive_block(block)
+            assert node.chain_tip == block_hash, f"Frozen block should be accepted ({fmt})"
+            print(f"   {fmt}: 해시 {block_hash[:8]} 유지")
+
+        # Case C: 고정된 블록은 수정 불가, deepcopy는 공유, 미고정 블록 deepcopy는 독립 복사본
+        print("\n3. 블록 고정")
+        try:
+            block.nonce = 0
+            assert False, "Frozen block should reject assignment"
+        except AttributeError:
+            pass
+        try:
+            block.difficulty = 5
+            assert False, "Frozen block should reject difficulty change"
+        except AttributeError:
+            pass
+        assert copy.deepcopy(block) is block, "Deepcopy of a frozen block should be shared"
+
+        template = node.create_block_template()
+        clone = copy.deepcopy(template)
+        clone.transactions[0]['body']['amount'] = 0
+        assert clone is not template and template.transactions[0]['body']['amount'] == config.MINING_REWARD, \
+            "Deepcopy of an unfrozen block should stay independent"
+        print("   고정 블록 수정 거부, 미고정 템플릿은 독립 복사")
+
+        # Case D: 누적 작업량은 노드가 보관 (같은 블록도 노드별로 따로 계산)
+        print("\n4. 노드별 누적 작업량")
+        fresh = Node("Fresh", network.genesis_block)
+        assert fresh.get_chain_work(block.hash) is None, "Unknown block should have no chain work"
+        assert not hasattr(block, 'total_work'), "Shared block should not carry per-node work"
+        for h in range(1, len(node.main_chain)):
+            fresh.receive_block(node.block_index[node.main_chain[h]])
+        assert fresh.get_chain_work() == node.get_chain_work(), "Chain work should match across nodes"
+        assert fresh.block_index[block.hash] is block, "Nodes should share the same block object"
+        print(f"   Fresh 노드 작업량 {fresh.get_chain_work()} (블록 객체 공유)")
+
+        # Case E: 전파 후 남는 메모리는 블록 복사본이 없으므로 노드 수에 따라 덜 늘어남
+        print("\n5. 노드 수 증가 시 전파 할당량")
+        config.MAX_TXS_PER_BLOCK = 20
+        shared = _broadcast_allocation(16) - _broadcast_allocation(2)
+        copied = _broadcast_allocation(16, shared=False) - _broadcast_allocation(2, shared=False)
+        print(f"   2 -> 16노드 증가분: 공유 {shared}B, deepcopy {copied}B")
+        assert shared < copied, "Sharing should allocate less than per-node deepcopy"
+        assert copied - shared > 14 * 20 * 100, \
+            "Savings should be at least one block copy (20 transactions) per extra node"
+    finally:
+        config.SIM_TIME, config.SERIALIZATION_FORMAT, config.MAX_TXS_PER_BLOCK = saved
+
+    print("\n[OK] 시나리오 32 검증 완료")
+
+
+if __name__ == "__main__":
+    try:
+        test_zero_copy_sharing()
+        print("\n[OK] Zero Copy Sharing Test PASSED")
+        sys.exit(0)
+    except AssertionError as e:
+        print(f"\n[FAIL] Test FAILED: {e}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n[FAIL] Test ERROR: {e}")
+        sys.exit(1)